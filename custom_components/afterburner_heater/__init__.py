@@ -5,10 +5,19 @@ https://github.com/tonylofgren/aurora-smart-home
 """
 from __future__ import annotations
 
+import time
+
+# Captured before the remaining imports so setup can report import cost,
+# which puts every import below after code (E402)
+# ruff: noqa: E402
+_IMPORT_STARTED = time.monotonic()
+
 import asyncio
+import importlib
 import json
 import logging
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any, TypeAlias
 
@@ -24,33 +33,68 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.service import (
+    async_extract_referenced_entity_ids,
+)
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .api.base import HeaterApi
-from .api.ble import BleHeaterApi
-from .api.ws import WebSocketHeaterApi
 from .const import (
     ATTR_CMD,
+    ATTR_MAX_CONCURRENCY,
+    ATTR_MINUTES,
     ATTR_PAYLOAD,
+    ATTR_SETTINGS,
+    ATTR_TIMEOUT,
     ATTR_VALUE,
+    ATTR_WAIT_FOR_ECHO,
     CONF_BLE_WRITE_CHAR,
     CONF_BLE_WRITE_WITH_RESPONSE,
     CONF_BLE_INIT_MESSAGE,
     CONF_BLE_APPEND_NEWLINE,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
     CONF_WS_INIT_MESSAGE,
+    CONF_MAX_KEY_AGE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SUPPRESS_UNCHANGED,
     CONF_TRANSPORT,
     DEFAULT_BLE_WRITE_CHAR,
     DEFAULT_BLE_WRITE_WITH_RESPONSE,
     DEFAULT_BLE_INIT_MESSAGE,
     DEFAULT_BLE_APPEND_NEWLINE,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE_PER_MINUTE,
+    DEFAULT_ECHO_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_KEY_AGE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL_BLE,
     DEFAULT_POLL_INTERVAL_WS,
+    DEFAULT_SUPPRESS_UNCHANGED,
+    DEFAULT_TRACE_MINUTES,
     DEFAULT_WS_PATH,
     DEFAULT_WS_INIT_MESSAGE,
+    DATA_DEVICE_INDEX,
     DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+    SERVICE_EXPORT_TRACE,
     SERVICE_SEND_JSON,
     SERVICE_SET_CYCLIC_ENABLED,
     SERVICE_SET_CYCLIC_OFF,
@@ -68,8 +112,13 @@ from .const import (
     TRANSPORT_BLE,
     TRANSPORT_WEBSOCKET,
 )
-from .coordinator import AfterburnerCoordinator
+from .capabilities import HeaterCapabilities
+from .coordinator import AfterburnerCoordinator, SetupTimings
+from .diagnostics import redact_trace
+from .fuel import FuelMeter
+from .protocol import COMMAND_SPECS, CommandSpec, pack_commands
 
+_IMPORT_DURATION = time.monotonic() - _IMPORT_STARTED
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -80,10 +129,54 @@ class AfterburnerRuntimeData:
     coordinator: AfterburnerCoordinator
     api: HeaterApi
     transport: str
+    options: dict[str, Any] = field(default_factory=dict)
 
 
 AfterburnerConfigEntry: TypeAlias = ConfigEntry[AfterburnerRuntimeData]
 
+# BLE write settings that can be swapped on a live connection
+_BLE_WRITE_OPTIONS = frozenset(
+    {CONF_BLE_WRITE_CHAR, CONF_BLE_WRITE_WITH_RESPONSE, CONF_BLE_APPEND_NEWLINE}
+)
+# Options applied without tearing down the transport; anything else reloads
+_HOT_OPTIONS = _BLE_WRITE_OPTIONS | {
+    CONF_SCAN_INTERVAL,
+    CONF_BLE_INIT_MESSAGE,
+    CONF_WS_INIT_MESSAGE,
+    CONF_MAX_KEY_AGE,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_SUPPRESS_UNCHANGED,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
+}
+
+# Service call fields selecting which heaters receive a command
+_TARGET_FIELDS = {
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional(ATTR_MAX_CONCURRENCY, default=DEFAULT_MAX_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+}
+_TARGET_KEYS = frozenset(str(key) for key in cv.ENTITY_SERVICE_FIELDS)
+
+# Helper services each setting one key of the command registry
+_SETTING_SERVICES = {
+    SERVICE_SET_CYCLIC_TEMP: "CyclicTemp",
+    SERVICE_SET_CYCLIC_ON: "CyclicOn",
+    SERVICE_SET_CYCLIC_OFF: "CyclicOff",
+    SERVICE_SET_CYCLIC_ENABLED: "CyclicEnb",
+    SERVICE_SET_FROST_ENABLE: "FrostEnable",
+    SERVICE_SET_FROST_ON: "FrostOn",
+    SERVICE_SET_FROST_RISE: "FrostRise",
+    SERVICE_SET_FROST_TARGET: "FrostTarget",
+    SERVICE_SET_THERMOSTAT: "Thermostat",
+    SERVICE_SET_THERMOSTAT_MODE: "ThermostatMode",
+    SERVICE_SET_FIXED_DEMAND: "FixedDemand",
+    SERVICE_SET_GPOUT1: "GPout1",
+    SERVICE_SET_GPOUT2: "GPout2",
+}
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
@@ -96,22 +189,16 @@ PLATFORMS: list[Platform] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry) -> bool:
     """Set up Afterburner Heater from a config entry."""
+    timings = SetupTimings(import_duration=_IMPORT_DURATION)
     hass.data.setdefault(DOMAIN, {})
 
     transport = entry.data[CONF_TRANSPORT]
+    update_interval = _update_interval(entry)
 
-    # Use transport-specific default poll interval
-    if transport == TRANSPORT_BLE:
-        default_interval = DEFAULT_POLL_INTERVAL_BLE
-    elif transport == TRANSPORT_WEBSOCKET:
-        default_interval = DEFAULT_POLL_INTERVAL_WS
-    else:
-        default_interval = DEFAULT_POLL_INTERVAL
-
-    update_seconds = entry.options.get(
-        CONF_SCAN_INTERVAL, int(default_interval.total_seconds())
-    )
-    update_interval = timedelta(seconds=update_seconds)
+    # Only the configured transport's modules (and their libraries) are imported
+    import_started = time.monotonic()
+    api_module = await _async_import_transport(hass, transport)
+    timings.import_duration = _IMPORT_DURATION + time.monotonic() - import_started
 
     coordinator: AfterburnerCoordinator
 
@@ -129,13 +216,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry)
         append_newline = entry.options.get(
             CONF_BLE_APPEND_NEWLINE, DEFAULT_BLE_APPEND_NEWLINE
         )
-        init_message = _parse_init_message(
-            entry.options.get(
-                CONF_BLE_INIT_MESSAGE, json.dumps(DEFAULT_BLE_INIT_MESSAGE)
-            ),
-            "BLE",
-        )
-        api = BleHeaterApi(
+        init_message = _init_message(entry)
+        command_burst, command_rate = _command_rate(entry)
+        api = api_module.BleHeaterApi(
             hass,
             address,
             write_char,
@@ -143,19 +226,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry)
             _message_callback,
             init_message=init_message,
             append_newline=append_newline,
+            command_burst=command_burst,
+            command_rate=command_rate,
         )
-    elif transport == TRANSPORT_WEBSOCKET:
+    else:
         host = entry.data[CONF_HOST]
         port = entry.data.get(CONF_PORT)
         path = entry.options.get(CONF_PATH, entry.data.get(CONF_PATH, DEFAULT_WS_PATH))
-        init_message = _parse_init_message(
-            entry.options.get(
-                CONF_WS_INIT_MESSAGE, json.dumps(DEFAULT_WS_INIT_MESSAGE)
-            ),
-            "WebSocket",
-        )
+        init_message = _init_message(entry)
         token = entry.data.get(CONF_ACCESS_TOKEN)
-        api = WebSocketHeaterApi(
+        command_burst, command_rate = _command_rate(entry)
+        api = api_module.WebSocketHeaterApi(
             hass,
             host,
             port,
@@ -163,29 +244,202 @@ async def async_setup_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry)
             _message_callback,
             token=token,
             init_message=init_message,
+            command_burst=command_burst,
+            command_rate=command_rate,
         )
-    else:
-        raise UpdateFailed(f"Unsupported transport: {transport}")
 
-    coordinator = AfterburnerCoordinator(hass, entry, api, update_interval)
-    await coordinator.async_start()
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = AfterburnerCoordinator(
+        hass,
+        entry,
+        api,
+        update_interval,
+        timings=timings,
+        max_key_age=_max_key_age(entry),
+        min_update_interval=_option_interval(
+            entry, CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+        ),
+        max_update_interval=_option_interval(
+            entry, CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+        ),
+        suppress_unchanged=entry.options.get(
+            CONF_SUPPRESS_UNCHANGED, DEFAULT_SUPPRESS_UNCHANGED
+        ),
+    )
+
+    # Keyed entities seen before the restart are created with the platforms
+    await coordinator.capabilities.async_load()
+    # Fuel totals continue from the last checkpoint
+    await coordinator.fuel.async_load()
 
     entry.runtime_data = AfterburnerRuntimeData(
         coordinator=coordinator,
         api=api,
         transport=transport,
+        options=dict(entry.options),
     )
 
     # Keep hass.data for service access across all entries
     hass.data[DOMAIN][entry.entry_id] = entry.runtime_data
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.title,
+        manufacturer="Afterburner",
+    )
+    hass.data.setdefault(DATA_DEVICE_INDEX, {})[device.id] = entry.entry_id
 
+    # Entities are created from the description tables right away and stay
+    # unavailable until the transport, started in the background, delivers data.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await _async_register_services(hass)
+    entry.async_create_background_task(
+        hass, coordinator.async_start(), f"{DOMAIN} {entry.title} transport start"
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(
+    hass: HomeAssistant, entry: AfterburnerConfigEntry
+) -> None:
+    """Apply changed options in place, reloading only when required."""
+    runtime_data = entry.runtime_data
+    new_options = dict(entry.options)
+    # Storing a key with the value it already defaulted to is not a change
+    defaults = _option_defaults(entry)
+    changed = {
+        key
+        for key in runtime_data.options.keys() | new_options.keys()
+        if runtime_data.options.get(key, defaults.get(key))
+        != new_options.get(key, defaults.get(key))
+    }
+    if not changed:
+        return
+    if changed - _HOT_OPTIONS:
+        _LOGGER.debug(
+            "Reloading %s for options: %s", entry.title, sorted(changed - _HOT_OPTIONS)
+        )
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    coordinator = runtime_data.coordinator
+    api = runtime_data.api
+    if CONF_SCAN_INTERVAL in changed:
+        coordinator.async_set_update_interval(_update_interval(entry))
+    if changed & {CONF_MIN_SCAN_INTERVAL, CONF_MAX_SCAN_INTERVAL}:
+        coordinator.async_set_update_interval_bounds(
+            _option_interval(entry, CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            _option_interval(entry, CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+    if CONF_MAX_KEY_AGE in changed:
+        coordinator.max_key_age = _max_key_age(entry)
+    if CONF_SUPPRESS_UNCHANGED in changed:
+        coordinator.suppress_unchanged = entry.options.get(
+            CONF_SUPPRESS_UNCHANGED, DEFAULT_SUPPRESS_UNCHANGED
+        )
+    if changed & {CONF_COMMAND_BURST, CONF_COMMAND_RATE}:
+        api.set_command_rate(*_command_rate(entry))
+    if changed & {CONF_BLE_INIT_MESSAGE, CONF_WS_INIT_MESSAGE}:
+        api.set_init_message(_init_message(entry))
+    if runtime_data.transport == TRANSPORT_BLE and changed & _BLE_WRITE_OPTIONS:
+        await api.async_update_write_settings(
+            entry.options.get(CONF_BLE_WRITE_CHAR, DEFAULT_BLE_WRITE_CHAR),
+            entry.options.get(
+                CONF_BLE_WRITE_WITH_RESPONSE, DEFAULT_BLE_WRITE_WITH_RESPONSE
+            ),
+            entry.options.get(CONF_BLE_APPEND_NEWLINE, DEFAULT_BLE_APPEND_NEWLINE),
+        )
+    runtime_data.options = new_options
+    _LOGGER.debug("Applied options in place for %s: %s", entry.title, sorted(changed))
+
+
+def _default_update_interval(entry: ConfigEntry) -> timedelta:
+    """Return the transport-specific default poll interval."""
+    transport = entry.data[CONF_TRANSPORT]
+    if transport == TRANSPORT_BLE:
+        return DEFAULT_POLL_INTERVAL_BLE
+    if transport == TRANSPORT_WEBSOCKET:
+        return DEFAULT_POLL_INTERVAL_WS
+    return DEFAULT_POLL_INTERVAL
+
+
+def _update_interval(entry: ConfigEntry) -> timedelta:
+    """Return the configured poll interval with a transport-specific default."""
+    update_seconds = entry.options.get(
+        CONF_SCAN_INTERVAL, int(_default_update_interval(entry).total_seconds())
+    )
+    return timedelta(seconds=update_seconds)
+
+
+def _option_defaults(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the value each option takes while it is not stored."""
+    return {
+        CONF_SCAN_INTERVAL: int(_default_update_interval(entry).total_seconds()),
+        CONF_MIN_SCAN_INTERVAL: int(DEFAULT_MIN_POLL_INTERVAL.total_seconds()),
+        CONF_MAX_SCAN_INTERVAL: int(DEFAULT_MAX_POLL_INTERVAL.total_seconds()),
+        CONF_MAX_KEY_AGE: int(DEFAULT_MAX_KEY_AGE.total_seconds()),
+        CONF_SUPPRESS_UNCHANGED: DEFAULT_SUPPRESS_UNCHANGED,
+        CONF_COMMAND_BURST: DEFAULT_COMMAND_BURST,
+        CONF_COMMAND_RATE: DEFAULT_COMMAND_RATE_PER_MINUTE,
+        CONF_BLE_WRITE_CHAR: DEFAULT_BLE_WRITE_CHAR,
+        CONF_BLE_WRITE_WITH_RESPONSE: DEFAULT_BLE_WRITE_WITH_RESPONSE,
+        CONF_BLE_APPEND_NEWLINE: DEFAULT_BLE_APPEND_NEWLINE,
+        CONF_BLE_INIT_MESSAGE: json.dumps(DEFAULT_BLE_INIT_MESSAGE),
+        CONF_WS_INIT_MESSAGE: json.dumps(DEFAULT_WS_INIT_MESSAGE),
+        CONF_PATH: entry.data.get(CONF_PATH, DEFAULT_WS_PATH),
+    }
+
+
+def _max_key_age(entry: ConfigEntry) -> timedelta:
+    """Return the key age below which the periodic refresh is skipped."""
+    return _option_interval(entry, CONF_MAX_KEY_AGE, DEFAULT_MAX_KEY_AGE)
+
+
+def _option_interval(entry: ConfigEntry, option: str, default: timedelta) -> timedelta:
+    """Return an option stored in seconds as a timedelta."""
+    return timedelta(
+        seconds=entry.options.get(option, int(default.total_seconds()))
+    )
+
+
+def _command_rate(entry: ConfigEntry) -> tuple[int, float]:
+    """Return the command burst size and refill rate per second."""
+    burst = entry.options.get(CONF_COMMAND_BURST, DEFAULT_COMMAND_BURST)
+    per_minute = entry.options.get(
+        CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE_PER_MINUTE
+    )
+    return burst, per_minute / 60
+
+
+def _init_message(entry: ConfigEntry) -> dict[str, Any] | None:
+    """Return the parsed init message option for the entry's transport."""
+    if entry.data[CONF_TRANSPORT] == TRANSPORT_BLE:
+        return _parse_init_message(
+            entry.options.get(
+                CONF_BLE_INIT_MESSAGE, json.dumps(DEFAULT_BLE_INIT_MESSAGE)
+            ),
+            "BLE",
+        )
+    return _parse_init_message(
+        entry.options.get(CONF_WS_INIT_MESSAGE, json.dumps(DEFAULT_WS_INIT_MESSAGE)),
+        "WebSocket",
+    )
+
+
+async def _async_import_transport(hass: HomeAssistant, transport: str) -> Any:
+    """Import the API module for a transport without blocking the event loop."""
+    if transport == TRANSPORT_BLE:
+        module_name = ".api.ble"
+    elif transport == TRANSPORT_WEBSOCKET:
+        module_name = ".api.ws"
+    else:
+        raise UpdateFailed(f"Unsupported transport: {transport}")
+    return await hass.async_add_import_executor_job(
+        importlib.import_module, module_name, __name__
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(
@@ -194,30 +448,68 @@ async def async_unload_entry(hass: HomeAssistant, entry: AfterburnerConfigEntry)
     if unload_ok:
         await entry.runtime_data.coordinator.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id)
+        device_index = hass.data.get(DATA_DEVICE_INDEX, {})
+        for device_id, entry_id in list(device_index.items()):
+            if entry_id == entry.entry_id:
+                del device_index[device_id]
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored capabilities and fuel checkpoint of a removed entry."""
+    await HeaterCapabilities(hass, entry.entry_id).async_remove()
+    await FuelMeter(hass, entry.entry_id).async_remove()
+
+
 async def _async_register_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, SERVICE_SEND_JSON):
         return
 
-    async def _async_send_payload(payload_obj: dict[str, Any]) -> None:
-        tasks = []
-        for runtime_data in hass.data.get(DOMAIN, {}).values():
-            if isinstance(runtime_data, AfterburnerRuntimeData):
-                tasks.append(runtime_data.api.async_send_json(payload_obj))
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            errors = [r for r in results if isinstance(r, Exception)]
-            if errors:
-                _LOGGER.warning(
-                    "Some heaters failed to receive command: %s",
-                    [str(e) for e in errors],
-                )
-                if len(errors) == len(tasks):
-                    raise HomeAssistantError("All heaters failed to receive command")
-
-    async def _handle_send_json(call: ServiceCall) -> None:
+    async def _async_dispatch(
+        call: ServiceCall,
+        action: Callable[[AfterburnerRuntimeData], Awaitable[dict[str, Any] | None]],
+    ) -> ServiceResponse:
+        targets = _async_resolve_targets(hass, call)
+        semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+
+        async def _async_run_one(
+            runtime_data: AfterburnerRuntimeData,
+        ) -> dict[str, Any]:
+            result: dict[str, Any] = {"name": runtime_data.coordinator.name}
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    result.update(await action(runtime_data) or {})
+                except Exception as err:  # noqa: BLE001
+                    error: str | None = str(err) or type(err).__name__
+                else:
+                    error = None
+                latency_ms = round((time.monotonic() - started) * 1000, 1)
+            result.update(success=error is None, latency_ms=latency_ms, error=error)
+            return result
+
+        results = await asyncio.gather(
+            *(_async_run_one(runtime_data) for runtime_data in targets.values())
+        )
+        errors = [result["error"] for result in results if not result["success"]]
+        if errors:
+            _LOGGER.warning("Some heaters failed to receive command: %s", errors)
+            if len(errors) == len(results):
+                raise HomeAssistantError("All heaters failed to receive command")
+        if not call.return_response:
+            return None
+        return {"heaters": dict(zip(targets, results))}
+
+    async def _async_send_payload(
+        call: ServiceCall, payload_obj: dict[str, Any]
+    ) -> ServiceResponse:
+        async def _async_send(runtime_data: AfterburnerRuntimeData) -> dict[str, Any]:
+            sent = await runtime_data.coordinator.async_send_command(payload_obj)
+            return {"suppressed": not sent}
+
+        return await _async_dispatch(call, _async_send)
+
+    async def _handle_send_json(call: ServiceCall) -> ServiceResponse:
         cmd = call.data.get(ATTR_CMD)
         value = call.data.get(ATTR_VALUE)
         payload = call.data.get(ATTR_PAYLOAD)
@@ -241,7 +533,7 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             else:
                 raise HomeAssistantError("Payload must be a JSON string or dict")
 
-        await _async_send_payload(payload_obj)
+        return await _async_send_payload(call, payload_obj)
 
     hass.services.async_register(
         DOMAIN,
@@ -252,95 +544,173 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                 vol.Exclusive(ATTR_PAYLOAD, "payload_or_cmd"): vol.Any(str, dict),
                 vol.Exclusive(ATTR_CMD, "payload_or_cmd"): str,
                 ATTR_VALUE: object,
+                **_TARGET_FIELDS,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
-    def _register_simple_service(
-        service_name: str,
-        cmd_key: str,
-        value_schema: vol.Schema,
-    ) -> None:
-        async def _handler(call: ServiceCall) -> None:
-            value = call.data.get("value")
-            if value is None:
-                raise HomeAssistantError(f"value is required for {service_name}")
-            await _async_send_payload({cmd_key: value})
+    def _register_setting_service(service_name: str, spec: CommandSpec) -> None:
+        async def _handler(call: ServiceCall) -> ServiceResponse:
+            return await _async_send_payload(call, {spec.key: call.data[ATTR_VALUE]})
 
         hass.services.async_register(
             DOMAIN,
             service_name,
             _handler,
-            schema=value_schema,
+            schema=vol.Schema(
+                {vol.Required(ATTR_VALUE): _spec_validator(spec), **_TARGET_FIELDS}
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
         )
 
-    _register_simple_service(
-        SERVICE_SET_CYCLIC_TEMP,
-        "CyclicTemp",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_CYCLIC_ON,
-        "CyclicOn",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_CYCLIC_OFF,
-        "CyclicOff",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_CYCLIC_ENABLED,
-        "CyclicEnb",
-        vol.Schema({vol.Required("value"): vol.Coerce(int)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_FROST_ENABLE,
-        "FrostEnable",
-        vol.Schema({vol.Required("value"): vol.Coerce(int)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_FROST_ON,
-        "FrostOn",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_FROST_RISE,
-        "FrostRise",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_FROST_TARGET,
-        "FrostTarget",
-        vol.Schema({vol.Required("value"): vol.Coerce(float)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_THERMOSTAT,
-        "Thermostat",
-        vol.Schema({vol.Required("value"): vol.Coerce(int)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_THERMOSTAT_MODE,
-        "ThermostatMode",
-        vol.Schema({vol.Required("value"): str}),
-    )
-    _register_simple_service(
-        SERVICE_SET_FIXED_DEMAND,
-        "FixedDemand",
-        vol.Schema({vol.Required("value"): vol.Any(vol.Coerce(float), None)}),
-    )
-    _register_simple_service(
-        SERVICE_SET_GPOUT1,
-        "GPout1",
-        vol.Schema({vol.Required("value"): vol.Coerce(int)}),
+    for service_name, cmd_key in _SETTING_SERVICES.items():
+        _register_setting_service(service_name, COMMAND_SPECS[cmd_key])
+
+    def _validate_settings(settings: dict[str, Any]) -> dict[str, Any]:
+        validated: dict[str, Any] = {}
+        for key, value in settings.items():
+            spec = COMMAND_SPECS.get(key)
+            if spec is None or spec.exclusive:
+                raise vol.Invalid(f"Unsupported setting: {key}", path=[key])
+            validated[key] = _spec_validator(spec)(value)
+        if not validated:
+            raise vol.Invalid("At least one setting is required")
+        return validated
+
+    async def _handle_apply_settings(call: ServiceCall) -> ServiceResponse:
+        settings: dict[str, Any] = call.data[ATTR_SETTINGS]
+        wait_for_echo: bool = call.data[ATTR_WAIT_FOR_ECHO]
+        timeout: float = call.data[ATTR_TIMEOUT]
+
+        async def _async_apply(runtime_data: AfterburnerRuntimeData) -> dict[str, Any]:
+            api = runtime_data.api
+            coordinator = runtime_data.coordinator
+            unchanged: set[str] = set()
+            if coordinator.suppress_unchanged:
+                unchanged = coordinator.unchanged_keys(settings)
+            pending = {
+                key: value for key, value in settings.items() if key not in unchanged
+            }
+            if not pending:
+                coordinator.health.commands_suppressed += 1
+            chunks = pack_commands(pending, api.max_payload_size) if pending else []
+            # Track echoes before writing so fast replies are not missed
+            echo = (
+                coordinator.async_track_echo(pending)
+                if wait_for_echo and pending
+                else None
+            )
+            try:
+                # Writes are issued back to back without waiting for echoes
+                for chunk in chunks:
+                    await api.async_send_json(chunk)
+                missing: list[str] = []
+                if echo is not None:
+                    missing = sorted(await coordinator.async_wait_echo(echo, timeout))
+            finally:
+                if echo is not None:
+                    coordinator.async_cancel_echo(echo)
+            return {
+                "applied": sorted(pending),
+                "unchanged": sorted(unchanged),
+                "writes": len(chunks),
+                "echoed": None if echo is None else not missing,
+                "missing_echo": missing,
+            }
+
+        return await _async_dispatch(call, _async_apply)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        _handle_apply_settings,
+        schema=vol.Schema(
+            {
+                vol.Required(ATTR_SETTINGS): vol.All(dict, _validate_settings),
+                vol.Optional(ATTR_WAIT_FOR_ECHO, default=False): cv.boolean,
+                vol.Optional(ATTR_TIMEOUT, default=DEFAULT_ECHO_TIMEOUT): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=60)
+                ),
+                **_TARGET_FIELDS,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
-    _register_simple_service(
-        SERVICE_SET_GPOUT2,
-        "GPout2",
-        vol.Schema({vol.Required("value"): vol.Coerce(int)}),
+
+    async def _handle_export_trace(call: ServiceCall) -> ServiceResponse:
+        window = call.data[ATTR_MINUTES] * 60
+
+        async def _async_export(runtime_data: AfterburnerRuntimeData) -> dict[str, Any]:
+            trace = runtime_data.api.trace
+            return {
+                "dropped_records": trace.dropped,
+                "records": redact_trace(trace.export(window)),
+            }
+
+        return await _async_dispatch(call, _async_export)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_TRACE,
+        _handle_export_trace,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_MINUTES, default=DEFAULT_TRACE_MINUTES): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=60)
+                ),
+                **_TARGET_FIELDS,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
     )
 
 
+@callback
+def _async_resolve_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, AfterburnerRuntimeData]:
+    """Return the runtime data of the heaters targeted by a service call.
+
+    Calls without a target keep the legacy behaviour of addressing every heater.
+    """
+    runtimes: dict[str, AfterburnerRuntimeData] = {
+        entry_id: runtime_data
+        for entry_id, runtime_data in hass.data.get(DOMAIN, {}).items()
+        if isinstance(runtime_data, AfterburnerRuntimeData)
+    }
+    if _TARGET_KEYS.isdisjoint(call.data):
+        return runtimes
+
+    selected = async_extract_referenced_entity_ids(hass, call, expand_group=False)
+    device_index: dict[str, str] = hass.data.get(DATA_DEVICE_INDEX, {})
+    targets: dict[str, AfterburnerRuntimeData] = {}
+    for device_id in selected.referenced_devices:
+        entry_id = device_index.get(device_id)
+        if entry_id in runtimes:
+            targets[entry_id] = runtimes[entry_id]
+    entity_registry = er.async_get(hass)
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entity_entry = entity_registry.async_get(entity_id)
+        if entity_entry and entity_entry.config_entry_id in runtimes:
+            targets[entity_entry.config_entry_id] = runtimes[entity_entry.config_entry_id]
+    if not targets:
+        raise HomeAssistantError("No Afterburner heaters match the service target")
+    return targets
+
+
+def _spec_validator(spec: CommandSpec) -> Callable[[Any], Any]:
+    """Return a voluptuous validator coercing values with a command spec."""
+
+    def validate(value: Any) -> Any:
+        try:
+            return spec.coerce(value)
+        except ValueError as err:
+            raise vol.Invalid(str(err)) from err
+
+    return validate
+
+
 def _parse_init_message(value: str | None, transport: str) -> dict[str, Any] | None:
     """Parse an init message JSON string for any transport type.
 
@@ -5,10 +5,33 @@ https://github.com/tonylofgren/aurora-smart-home
 """
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import Any
 
+from ..protocol import (
+    DEFAULT_CHANGE_QUEUE_SIZE,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE,
+    DEFAULT_PAYLOAD_QUEUE_SIZE,
+    DEFAULT_REFRESH_SPACING,
+    LANE_REFRESH,
+    AfterburnerClient,
+    CommandRateLimitedError,
+    CommandRateLimiter,
+    ConflatingQueue,
+    PayloadQueue,
+    TraceRecorder,
+    Transport,
+    TransportError,
+    command_lane,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
 MessageCallback = Callable[[dict[str, Any]], None]
 
 
@@ -17,6 +40,16 @@ class HeaterApi(ABC):
 
     def __init__(self, message_callback: MessageCallback) -> None:
         self._message_callback = message_callback
+        self._init_message: dict[str, Any] | None = None
+        # Monotonic time of the last command sent, for adaptive polling
+        self.last_command_time: float | None = None
+        # Only enforced by transports writing through ClientHeaterApi
+        self.rate_limiter = CommandRateLimiter(burst=0, now=time.monotonic())
+        self.trace = TraceRecorder()
+        self._payload_queues: set[PayloadQueue] = set()
+        self._change_queues: dict[ConflatingQueue[str, Any], frozenset[str] | None] = {}
+        # Last value per key, only maintained while change subscribers exist
+        self._last_values: dict[str, Any] = {}
 
     @abstractmethod
     async def async_start(self) -> None:
@@ -30,9 +63,210 @@ class HeaterApi(ABC):
     async def async_send_json(self, payload: dict[str, Any]) -> None:
         """Send a JSON payload to the heater."""
 
+    @property
+    def max_payload_size(self) -> int | None:
+        """Largest payload in bytes that fits one write, or None if unlimited."""
+        return None
+
+    @property
+    def bytes_received(self) -> int:
+        """Return the number of bytes received from the heater."""
+        return 0
+
+    @property
+    def reconnects(self) -> int:
+        """Return how often the transport reconnected after dropping."""
+        return 0
+
+    @property
+    def parser_recoveries(self) -> int:
+        """Return how often malformed input was skipped."""
+        return 0
+
     async def async_request_refresh(self) -> None:
         """Optionally request a state refresh."""
 
+    async def async_reconnect(self) -> None:
+        """Drop the current link so the transport reconnects."""
+
+    def set_init_message(self, init_message: dict[str, Any] | None) -> None:
+        """Replace the message used to request a state refresh."""
+        self._init_message = init_message
+
+    def set_command_rate(self, burst: int, rate: float) -> None:
+        """Change the command burst size and refill rate per second."""
+        self.rate_limiter.configure(burst, rate, time.monotonic())
+
+    async def async_iter_payloads(
+        self, maxsize: int = DEFAULT_PAYLOAD_QUEUE_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every decoded payload.
+
+        A subscriber more than ``maxsize`` payloads behind has new payloads
+        merged into its newest pending one, so it never stalls the transport.
+        """
+        queue = PayloadQueue(maxsize)
+        self._payload_queues.add(queue)
+        try:
+            async for payload in queue:
+                yield payload
+        finally:
+            self._payload_queues.discard(queue)
+
+    async def async_iter_changes(
+        self,
+        keys: Iterable[str] | None = None,
+        maxsize: int = DEFAULT_CHANGE_QUEUE_SIZE,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Yield ``(key, value)`` whenever a key (optionally one of ``keys``) changes.
+
+        The first value seen after subscribing counts as a change. A slow
+        subscriber only receives the latest value of each pending key.
+        """
+        queue: ConflatingQueue[str, Any] = ConflatingQueue(maxsize)
+        self._change_queues[queue] = frozenset(keys) if keys is not None else None
+        try:
+            async for change in queue:
+                yield change
+        finally:
+            self._change_queues.pop(queue, None)
+            if not self._change_queues:
+                self._last_values.clear()
+
+    def _close_subscriptions(self) -> None:
+        """End all subscriber iterators once their pending items are consumed."""
+        for queue in self._payload_queues:
+            queue.close()
+        for change_queue in self._change_queues:
+            change_queue.close()
+
     def _handle_message(self, payload: dict[str, Any]) -> None:
-        """Invoke the registered message callback."""
+        """Invoke the registered message callback and feed subscribers."""
         self._message_callback(payload)
+        for queue in self._payload_queues:
+            queue.put(payload)
+        if self._change_queues:
+            self._publish_changes(payload)
+
+    def _publish_changes(self, payload: dict[str, Any]) -> None:
+        last_values = self._last_values
+        changes = [
+            (key, value)
+            for key, value in payload.items()
+            if key not in last_values or last_values[key] != value
+        ]
+        if not changes:
+            return
+        last_values.update(payload)
+        for queue, keys in self._change_queues.items():
+            for key, value in changes:
+                if keys is None or key in keys:
+                    queue.put(key, value)
+
+
+class ClientHeaterApi(HeaterApi):
+    """HeaterApi adapter over a standalone ``AfterburnerClient``.
+
+    The client owns the connection; the coordinator keeps the merged state, so
+    the client only forwards decoded payloads. Refresh requests from the
+    connect sequence, the coordinator and services share one in-flight dump;
+    ``refresh_spacing`` is the minimum time between two dumps.
+
+    Commands and refresh requests pass a token bucket of ``command_burst``
+    writes refilled at ``command_rate`` per second (a burst of 0, the default,
+    disables it); commands over the limit raise ``CommandRateLimitedError``
+    and refresh requests are shed.
+    """
+
+    def __init__(
+        self,
+        message_callback: MessageCallback,
+        transport: Transport,
+        init_message: dict[str, Any] | None,
+        refresh_spacing: float = DEFAULT_REFRESH_SPACING,
+        command_burst: int = DEFAULT_COMMAND_BURST,
+        command_rate: float = DEFAULT_COMMAND_RATE,
+    ) -> None:
+        super().__init__(message_callback)
+        self._init_message = init_message
+        self.rate_limiter.configure(command_burst, command_rate, time.monotonic())
+        self._client = AfterburnerClient(
+            transport,
+            init_message=init_message,
+            track_state=False,
+            trace=self.trace,
+            refresh_spacing=refresh_spacing,
+        )
+        self._client.add_listener(self._handle_message)
+
+    async def async_start(self) -> None:
+        """Start the client's connection loop."""
+        await self._client.start()
+
+    async def async_stop(self) -> None:
+        """Stop the client and close the transport."""
+        await self._client.stop()
+        self._close_subscriptions()
+
+    async def async_send_json(self, payload: dict[str, Any]) -> None:
+        """Send a JSON payload to the heater unless its lane is rate limited."""
+        now = time.monotonic()
+        lane = command_lane(payload)
+        if not self.rate_limiter.acquire(lane, now):
+            raise CommandRateLimitedError(
+                f"Command rate limit reached, {lane} command not sent"
+            )
+        self.last_command_time = now
+        await self._client.send(payload)
+
+    @property
+    def max_payload_size(self) -> int | None:
+        """Largest payload in bytes that fits one write, or None if unlimited."""
+        return self._client.max_payload_size
+
+    @property
+    def refresh_spacing(self) -> float:
+        """Return the minimum seconds between two refresh dumps."""
+        return self._client.refresh_gate.min_spacing
+
+    @refresh_spacing.setter
+    def refresh_spacing(self, seconds: float) -> None:
+        self._client.refresh_gate.min_spacing = seconds
+
+    @property
+    def bytes_received(self) -> int:
+        """Return the number of bytes received from the heater."""
+        return self._client.bytes_received
+
+    @property
+    def reconnects(self) -> int:
+        """Return how often the transport reconnected after dropping."""
+        return self._client.reconnects
+
+    @property
+    def parser_recoveries(self) -> int:
+        """Return how often malformed input was skipped."""
+        return self._client.parser_recoveries
+
+    async def async_request_refresh(self) -> None:
+        """Request a state refresh if connected and not rate limited."""
+        if (
+            self._client.is_connected
+            and not self._client.refresh_gate.would_share
+            and not self.rate_limiter.acquire(LANE_REFRESH, time.monotonic())
+        ):
+            _LOGGER.debug("Refresh request shed by the command rate limit")
+            return
+        try:
+            await self._client.request_refresh()
+        except (TransportError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Refresh request failed: %s", err)
+
+    async def async_reconnect(self) -> None:
+        """Drop the current link so the client reconnects."""
+        await self._client.reconnect()
+
+    def set_init_message(self, init_message: dict[str, Any] | None) -> None:
+        """Replace the message used to request a state refresh."""
+        super().set_init_message(init_message)
+        self._client.init_message = init_message
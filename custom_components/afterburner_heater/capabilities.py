@@ -0,0 +1,91 @@
+"""Keys each heater has reported, persisted per config entry.
+
+Entities backed by a state key are only created once the heater has sent
+that key, so heaters without e.g. a BME280 or glow plug current sensor do not
+carry permanently unknown entities. The set is stored, so a restart recreates
+the same entities before the transport has delivered anything.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Seconds to batch newly seen keys before writing the store
+_SAVE_DELAY = 10
+
+KeysListener = Callable[[set[str]], None]
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
+
+class HeaterCapabilities:
+    """Set of state keys a heater has reported, with new-key listeners."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities"
+        )
+        self.keys: set[str] = set()
+        self._listeners: list[KeysListener] = []
+
+    async def async_load(self) -> None:
+        """Load the keys seen before the last restart."""
+        if data := await self._store.async_load():
+            self.keys.update(data.get("keys", ()))
+
+    async def async_remove(self) -> None:
+        """Delete the stored keys, e.g. when the entry is removed."""
+        await self._store.async_remove()
+
+    @callback
+    def async_observe(self, keys: Iterable[str]) -> None:
+        """Record the keys of a payload and notify listeners of new ones."""
+        if self.keys.issuperset(keys):
+            return
+        new = set(keys) - self.keys
+        self.keys |= new
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+        for listener in list(self._listeners):
+            listener(new)
+
+    @callback
+    def async_add_listener(self, listener: KeysListener) -> CALLBACK_TYPE:
+        """Call ``listener`` with newly seen keys; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"keys": sorted(self.keys)}
+
+
+@callback
+def async_add_keyed_entities(
+    entry: ConfigEntry,
+    capabilities: HeaterCapabilities,
+    descriptions: Iterable[_DescriptionT],
+    factory: Callable[[_DescriptionT], Entity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add an entity per description once its key has been reported."""
+    pending = list(descriptions)
+
+    @callback
+    def _add(keys: set[str]) -> None:
+        ready = [description for description in pending if description.key in keys]
+        if not ready:
+            return
+        for description in ready:
+            pending.remove(description)
+        async_add_entities(factory(description) for description in ready)
+
+    _add(capabilities.keys)
+    if pending:
+        entry.async_on_unload(capabilities.async_add_listener(_add))
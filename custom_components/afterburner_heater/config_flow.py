@@ -32,12 +32,24 @@ from .const import (
     CONF_BLE_WRITE_WITH_RESPONSE,
     CONF_BLE_INIT_MESSAGE,
     CONF_BLE_APPEND_NEWLINE,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
+    CONF_MAX_KEY_AGE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SUPPRESS_UNCHANGED,
     CONF_TRANSPORT,
     DEFAULT_BLE_WRITE_CHAR,
     DEFAULT_BLE_WRITE_WITH_RESPONSE,
     DEFAULT_BLE_INIT_MESSAGE,
     DEFAULT_BLE_APPEND_NEWLINE,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE_PER_MINUTE,
+    DEFAULT_MAX_KEY_AGE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_SUPPRESS_UNCHANGED,
     DEFAULT_WS_PATH,
     DEFAULT_WS_PORT,
     CONF_WS_INIT_MESSAGE,
@@ -228,18 +240,60 @@ class AfterburnerOptionsFlowHandler(config_entries.OptionsFlow):
         self._entry = config_entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if (
+                user_input[CONF_MIN_SCAN_INTERVAL]
+                > user_input[CONF_MAX_SCAN_INTERVAL]
+            ):
+                errors[CONF_MAX_SCAN_INTERVAL] = "max_below_min"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         transport = self._entry.data[CONF_TRANSPORT]
-        options = dict(self._entry.options)
+        # Re-shown after an error with what was entered
+        options = {**self._entry.options, **(user_input or {})}
         update_seconds = options.get(
             CONF_SCAN_INTERVAL, int(DEFAULT_POLL_INTERVAL.total_seconds())
         )
+        max_key_age = options.get(
+            CONF_MAX_KEY_AGE, int(DEFAULT_MAX_KEY_AGE.total_seconds())
+        )
+        min_seconds = options.get(
+            CONF_MIN_SCAN_INTERVAL, int(DEFAULT_MIN_POLL_INTERVAL.total_seconds())
+        )
+        max_seconds = options.get(
+            CONF_MAX_SCAN_INTERVAL, int(DEFAULT_MAX_POLL_INTERVAL.total_seconds())
+        )
+        suppress_unchanged = options.get(
+            CONF_SUPPRESS_UNCHANGED, DEFAULT_SUPPRESS_UNCHANGED
+        )
+        command_burst = options.get(CONF_COMMAND_BURST, DEFAULT_COMMAND_BURST)
+        command_rate = options.get(
+            CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE_PER_MINUTE
+        )
         if transport == TRANSPORT_BLE:
             data_schema = vol.Schema(
                 {
                     vol.Required(CONF_SCAN_INTERVAL, default=update_seconds): int,
+                    vol.Required(CONF_MIN_SCAN_INTERVAL, default=min_seconds): vol.All(
+                        int, vol.Range(min=1)
+                    ),
+                    vol.Required(CONF_MAX_SCAN_INTERVAL, default=max_seconds): vol.All(
+                        int, vol.Range(min=1)
+                    ),
+                    vol.Required(CONF_MAX_KEY_AGE, default=max_key_age): vol.All(
+                        int, vol.Range(min=0)
+                    ),
+                    vol.Required(
+                        CONF_SUPPRESS_UNCHANGED, default=suppress_unchanged
+                    ): bool,
+                    vol.Required(CONF_COMMAND_BURST, default=command_burst): vol.All(
+                        int, vol.Range(min=0)
+                    ),
+                    vol.Required(CONF_COMMAND_RATE, default=command_rate): vol.All(
+                        int, vol.Range(min=1)
+                    ),
                     vol.Required(
                         CONF_BLE_WRITE_CHAR,
                         default=options.get(CONF_BLE_WRITE_CHAR, DEFAULT_BLE_WRITE_CHAR),
@@ -271,6 +325,24 @@ class AfterburnerOptionsFlowHandler(config_entries.OptionsFlow):
             data_schema = vol.Schema(
                 {
                     vol.Required(CONF_SCAN_INTERVAL, default=update_seconds): int,
+                    vol.Required(CONF_MIN_SCAN_INTERVAL, default=min_seconds): vol.All(
+                        int, vol.Range(min=1)
+                    ),
+                    vol.Required(CONF_MAX_SCAN_INTERVAL, default=max_seconds): vol.All(
+                        int, vol.Range(min=1)
+                    ),
+                    vol.Required(CONF_MAX_KEY_AGE, default=max_key_age): vol.All(
+                        int, vol.Range(min=0)
+                    ),
+                    vol.Required(
+                        CONF_SUPPRESS_UNCHANGED, default=suppress_unchanged
+                    ): bool,
+                    vol.Required(CONF_COMMAND_BURST, default=command_burst): vol.All(
+                        int, vol.Range(min=0)
+                    ),
+                    vol.Required(CONF_COMMAND_RATE, default=command_rate): vol.All(
+                        int, vol.Range(min=1)
+                    ),
                     vol.Optional(
                         CONF_PATH,
                         default=options.get(
@@ -288,7 +360,9 @@ class AfterburnerOptionsFlowHandler(config_entries.OptionsFlow):
                 }
             )
 
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
 
 
 def _has_service_uuid(info: bluetooth.BluetoothServiceInfoBleak, uuid: str) -> bool:
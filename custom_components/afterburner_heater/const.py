@@ -16,6 +16,12 @@ CONF_BLE_WRITE_WITH_RESPONSE = "ble_write_with_response"
 CONF_BLE_INIT_MESSAGE = "ble_init_message"
 CONF_BLE_APPEND_NEWLINE = "ble_append_newline"
 CONF_WS_INIT_MESSAGE = "ws_init_message"
+CONF_MAX_KEY_AGE = "max_key_age"
+CONF_SUPPRESS_UNCHANGED = "suppress_unchanged"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_COMMAND_BURST = "command_burst"
+CONF_COMMAND_RATE = "command_rate"
 
 TRANSPORT_BLE = "ble"
 TRANSPORT_WEBSOCKET = "websocket"
@@ -30,6 +36,21 @@ DEFAULT_POLL_INTERVAL = timedelta(seconds=60)
 # - WebSocket: Longer interval since heater pushes updates automatically
 DEFAULT_POLL_INTERVAL_BLE = timedelta(seconds=30)
 DEFAULT_POLL_INTERVAL_WS = timedelta(seconds=60)
+# Adaptive polling: floor while starting/stopping or after a command, ceiling
+# while idle and stable. Equal values disable adaptation.
+DEFAULT_MIN_POLL_INTERVAL = timedelta(seconds=10)
+DEFAULT_MAX_POLL_INTERVAL = timedelta(seconds=600)
+# The periodic refresh is skipped while every key backing an enabled entity
+# was received more recently than this; 0 always refreshes
+DEFAULT_MAX_KEY_AGE = timedelta(seconds=300)
+# Commands that would not change a value received within COMMAND_MAX_AGE are
+# not written
+DEFAULT_SUPPRESS_UNCHANGED = True
+COMMAND_MAX_AGE = timedelta(seconds=60)
+# Writes per heater: a burst of this many, then the rate per minute; a burst
+# of 0 (the default) disables the limit
+DEFAULT_COMMAND_BURST = 0
+DEFAULT_COMMAND_RATE_PER_MINUTE = 30
 DEFAULT_WS_PATH = "/"
 DEFAULT_WS_PORT = 81
 DEFAULT_BLE_WRITE_CHAR = "FFE1"
@@ -41,6 +62,8 @@ DEFAULT_BLE_COMMAND_TIMEOUT = 5
 DEFAULT_WS_INIT_MESSAGE = {"Refresh": 1}
 
 SERVICE_SEND_JSON = "send_json"
+SERVICE_APPLY_SETTINGS = "apply_settings"
+SERVICE_EXPORT_TRACE = "export_trace"
 SERVICE_SET_CYCLIC_TEMP = "set_cyclic_temp"
 SERVICE_SET_CYCLIC_ON = "set_cyclic_on"
 SERVICE_SET_CYCLIC_OFF = "set_cyclic_off"
@@ -63,6 +86,23 @@ CHAR_WRITE_ALT_UUID = "FFE2"
 ATTR_PAYLOAD = "payload"
 ATTR_CMD = "cmd"
 ATTR_VALUE = "value"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_SETTINGS = "settings"
+ATTR_WAIT_FOR_ECHO = "wait_for_echo"
+ATTR_TIMEOUT = "timeout"
+ATTR_MINUTES = "minutes"
+
+# Seconds apply_settings waits for the heater to echo applied keys
+DEFAULT_ECHO_TIMEOUT = 5.0
+
+# Heaters addressed concurrently by one service call
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Minutes of wire trace returned by export_trace
+DEFAULT_TRACE_MINUTES = 5.0
+
+# hass.data key mapping device registry ids to config entry ids
+DATA_DEVICE_INDEX = f"{DOMAIN}_device_index"
 
 REDACTED_CONFIG = {"access_token", "password", "token"}
 
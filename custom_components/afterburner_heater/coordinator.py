@@ -5,24 +5,61 @@ https://github.com/tonylofgren/aurora-smart-home
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from collections import deque
+from collections import Counter, deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api.base import HeaterApi
-from .protocol import HeaterState
+from .capabilities import HeaterCapabilities
+from .const import COMMAND_MAX_AGE, DEFAULT_SUPPRESS_UNCHANGED, DOMAIN
+from .fuel import FuelMeter
+from .ingest import PayloadIngest
+from .protocol import (
+    CommandRateLimitedError,
+    HeaterState,
+    HeaterStatistics,
+    StreamingHistogram,
+    coerce_settings,
+    echo_key,
+    echo_keys,
+    normalize_payload,
+)
+from .scheduler import PollScheduler
+from .watchdog import StalenessWatchdog
 
 _LOGGER = logging.getLogger(__name__)
 
 # Number of latency samples to keep for averaging
 _LATENCY_WINDOW_SIZE = 10
+# Quiet period without new keys after which the first dump counts as complete
+_FULL_DUMP_SETTLE_DELAY = 2.0
+# Health sensors are published at this fixed rate, not on every message
+_HEALTH_PUBLISH_INTERVAL = timedelta(seconds=60)
+# How often the staleness watchdog checks for silent links
+_WATCHDOG_CHECK_INTERVAL = timedelta(seconds=10)
+# Without a learned cadence, data is stale after this many poll intervals
+_STALE_POLL_INTERVALS = 2
+# Refreshes are only skipped while the link was active within this share of
+# the staleness threshold; poll-only links (BLE) would otherwise fall silent
+_SKIP_ACTIVITY_SHARE = 0.5
+# How often dropped commands are checked for the rate limit repair issue
+_RATE_LIMIT_CHECK_INTERVAL = timedelta(seconds=30)
+# The repair issue is removed after this long without dropped commands
+_RATE_LIMIT_ISSUE_CLEAR_AFTER = 1800.0
+# Commands whose effect can't be read back under the same key
+_ALWAYS_SEND_KEYS = frozenset({"Run", "Refresh"})
 
 
 @dataclass
@@ -33,6 +70,12 @@ class TransportHealth:
     last_message_time: float | None = None
     last_refresh_time: float | None = None
     refresh_latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW_SIZE))
+    refresh_histogram: StreamingHistogram = field(default_factory=StreamingHistogram)
+    stale_after: float = 120.0
+    refreshes_sent: int = 0
+    refreshes_skipped: int = 0
+    commands_sent: int = 0
+    commands_suppressed: int = 0
 
     @property
     def avg_latency_ms(self) -> float | None:
@@ -43,10 +86,72 @@ class TransportHealth:
 
     @property
     def is_stale(self) -> bool:
-        """Check if transport hasn't received messages recently (>2 poll intervals)."""
+        """Check if transport hasn't received messages within ``stale_after``."""
         if self.last_message_time is None:
             return True
-        return (time.monotonic() - self.last_message_time) > 120  # 2 minutes
+        return (time.monotonic() - self.last_message_time) > self.stale_after
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """Transport health figures published to the health sensors.
+
+    Rates cover the interval since the previous snapshot and are None for the
+    first one. ``statistics`` holds the rolling figures of ``HeaterStatistics``.
+    """
+
+    messages_per_minute: float | None
+    bytes_per_minute: float | None
+    refresh_p50_ms: float | None
+    refresh_p95_ms: float | None
+    refresh_p99_ms: float | None
+    reconnects: int
+    parser_recoveries: int
+    commands_dropped: int
+    seconds_since_last_message: float | None
+    statistics: dict[str, float | None]
+
+
+@dataclass
+class SetupTimings:
+    """Track per-phase setup timings for an entry.
+
+    Phases are stored as seconds relative to ``setup_started`` except for
+    ``import_duration``, which is the time spent importing the integration.
+    """
+
+    import_duration: float | None = None
+    setup_started: float = field(default_factory=time.monotonic)
+    transport_started: float | None = None
+    first_message: float | None = None
+    first_full_dump: float | None = None
+
+    def mark(self, phase: str) -> float:
+        """Record a phase relative to setup start and return it."""
+        elapsed = time.monotonic() - self.setup_started
+        setattr(self, phase, elapsed)
+        _LOGGER.debug("Setup phase %s reached after %.1fms", phase, elapsed * 1000)
+        return elapsed
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Return the recorded phases in milliseconds."""
+        return {
+            phase: None if value is None else round(value * 1000, 1)
+            for phase, value in (
+                ("import", self.import_duration),
+                ("transport_started", self.transport_started),
+                ("first_message", self.first_message),
+                ("first_full_dump", self.first_full_dump),
+            )
+        }
+
+
+@dataclass
+class EchoWaiter:
+    """Command keys still waiting to be echoed back by the heater."""
+
+    pending: set[str]
+    future: asyncio.Future[None]
 
 
 class AfterburnerCoordinator(DataUpdateCoordinator[HeaterState]):
@@ -60,41 +165,435 @@ class AfterburnerCoordinator(DataUpdateCoordinator[HeaterState]):
         entry: ConfigEntry,
         api: HeaterApi,
         update_interval: timedelta,
+        timings: SetupTimings | None = None,
+        max_key_age: timedelta | None = None,
+        min_update_interval: timedelta | None = None,
+        max_update_interval: timedelta | None = None,
+        suppress_unchanged: bool = DEFAULT_SUPPRESS_UNCHANGED,
     ) -> None:
+        # Polling starts with the first payload; until then the transport's
+        # refresh on connect and the watchdog's reconnects ask for data
         super().__init__(
             hass,
             _LOGGER,
             name=entry.title,
-            update_interval=update_interval,
+            update_interval=None,
         )
         self.config_entry = entry
         self._api = api
         self._state = HeaterState()
         self._health = TransportHealth()
+        self._timings = timings or SetupTimings()
+        self._full_dump_unsub: CALLBACK_TYPE | None = None
+        self._first_dump_settled = False
+        self._echo_waiters: list[EchoWaiter] = []
+        # Echo keys of written commands the heater has not echoed yet, by send time
+        self._in_flight: dict[str, float] = {}
+        self._ingest = PayloadIngest(hass.loop, self._publish_payload)
+        self._health_snapshot: HealthSnapshot | None = None
+        self._health_listeners: list[CALLBACK_TYPE] = []
+        self._health_unsub: CALLBACK_TYPE | None = None
+        # (time, message count, bytes received) at the previous snapshot
+        self._health_baseline: tuple[float, int, int] | None = None
+        self._watchdog = StalenessWatchdog(
+            _fallback_stale_after(update_interval), time.monotonic()
+        )
+        self._watchdog_unsub: CALLBACK_TYPE | None = None
+        self._rate_limit_unsub: CALLBACK_TYPE | None = None
+        # Dropped writes at the last check and when the count last grew
+        self._dropped_seen = 0
+        self._dropped_at: float | None = None
+        # Set when the watchdog found the link silent, cleared by the next payload
+        self._stale = False
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self.max_key_age = max_key_age or timedelta(0)
+        # Keys read by enabled entities, with the number of entities reading them
+        self._tracked_keys: Counter[str] = Counter()
+        self.suppress_unchanged = suppress_unchanged
+        self._capabilities = HeaterCapabilities(hass, entry.entry_id)
+        # Folded in per payload, read at the health publish rate
+        self._statistics = HeaterStatistics()
+        self._fuel = FuelMeter(hass, entry.entry_id)
+        self._scheduler = PollScheduler(
+            update_interval.total_seconds(),
+            (min_update_interval or update_interval).total_seconds(),
+            (max_update_interval or update_interval).total_seconds(),
+            time.monotonic(),
+        )
+        # Entities stay unavailable until the transport delivers a payload
+        self.last_update_success = False
 
     @property
     def health(self) -> TransportHealth:
         """Return transport health statistics."""
         return self._health
 
+    @property
+    def health_snapshot(self) -> HealthSnapshot | None:
+        """Return the last published health snapshot."""
+        return self._health_snapshot
+
+    @property
+    def watchdog(self) -> StalenessWatchdog:
+        """Return the staleness watchdog."""
+        return self._watchdog
+
+    @property
+    def scheduler(self) -> PollScheduler:
+        """Return the adaptive poll scheduler."""
+        return self._scheduler
+
+    @property
+    def capabilities(self) -> HeaterCapabilities:
+        """Return the keys this heater has reported."""
+        return self._capabilities
+
+    @property
+    def fuel(self) -> FuelMeter:
+        """Return the heater's checkpointed fuel consumption."""
+        return self._fuel
+
+    @property
+    def timings(self) -> SetupTimings:
+        """Return setup phase timings."""
+        return self._timings
+
+    @property
+    def ingest(self) -> PayloadIngest:
+        """Return the payload ingestion stage."""
+        return self._ingest
+
     async def async_start(self) -> None:
         """Start the transport."""
+        self._ingest.start()
+        self._watchdog_unsub = async_track_time_interval(
+            self.hass,
+            self._async_check_stale,
+            _WATCHDOG_CHECK_INTERVAL,
+            name=f"{self.name} watchdog",
+        )
+        self._rate_limit_unsub = async_track_time_interval(
+            self.hass,
+            self._async_check_rate_limit,
+            _RATE_LIMIT_CHECK_INTERVAL,
+            name=f"{self.name} rate limit",
+        )
+        self._fuel.async_start()
         await self._api.async_start()
+        self._timings.mark("transport_started")
 
     async def async_stop(self) -> None:
         """Stop the transport."""
+        if self._full_dump_unsub:
+            self._full_dump_unsub()
+            self._full_dump_unsub = None
+        if self._health_unsub:
+            self._health_unsub()
+            self._health_unsub = None
+        if self._watchdog_unsub:
+            self._watchdog_unsub()
+            self._watchdog_unsub = None
+        if self._rate_limit_unsub:
+            self._rate_limit_unsub()
+            self._rate_limit_unsub = None
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        ir.async_delete_issue(self.hass, DOMAIN, self._rate_limit_issue_id)
         await self._api.async_stop()
+        self._ingest.stop()
+        await self._fuel.async_stop()
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the base poll interval without restarting the transport."""
+        seconds = update_interval.total_seconds()
+        if seconds == self._scheduler.base:
+            return
+        self._scheduler.base = self._scheduler.interval = seconds
+        self._watchdog.fallback_stale_after = _fallback_stale_after(update_interval)
+        if self.update_interval is None:
+            # Not polling yet; the first payload starts at the new interval
+            return
+        self.update_interval = update_interval
+        if self._listeners:
+            self._schedule_refresh()
+        _LOGGER.debug("Poll interval changed to %s", update_interval)
+
+    @callback
+    def async_set_update_interval_bounds(
+        self, minimum: timedelta, maximum: timedelta
+    ) -> None:
+        """Change the floor and ceiling of the adaptive poll interval."""
+        self._scheduler.floor = minimum.total_seconds()
+        self._scheduler.ceiling = maximum.total_seconds()
+
+    def _apply_poll_interval(self, seconds: float) -> None:
+        interval = timedelta(seconds=seconds)
+        if interval != self.update_interval:
+            _LOGGER.debug("Adaptive poll interval now %s", interval)
+            self.update_interval = interval
+        # Backed-off polls are further apart; faster ones keep the base threshold
+        self._watchdog.fallback_stale_after = _fallback_stale_after(
+            timedelta(seconds=max(seconds, self._scheduler.base))
+        )
+
+    def unchanged_keys(
+        self, payload: dict[str, Any], now: float | None = None
+    ) -> set[str]:
+        """Return keys of a command whose value the fresh state already has.
+
+        Only values received within ``COMMAND_MAX_AGE`` count, so a stale
+        state never suppresses a write. Keys of an earlier write that has not
+        been echoed yet count as changed: the state may be about to move away
+        from the requested value.
+        """
+        if self._stale:
+            return set()
+        now = time.monotonic() if now is None else now
+        max_age = COMMAND_MAX_AGE.total_seconds()
+        state = self._state
+        in_flight = self._in_flight
+        requested = normalize_payload(payload)
+        return {
+            key
+            for key in payload
+            if key not in _ALWAYS_SEND_KEYS
+            and now - in_flight.get(echo_key(key), float("-inf")) > max_age
+            and key in state.normalized
+            and now - state.updated.get(key, float("-inf")) <= max_age
+            and requested.get(key) == state.normalized[key]
+        }
+
+    async def async_send_command(self, payload: dict[str, Any]) -> bool:
+        """Send a command unless it would change nothing; return whether sent.
+
+        Registered keys are coerced to their wire types first, so entities and
+        services write the same values; an invalid value raises.
+        """
+        try:
+            payload = coerce_settings(payload)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        if (
+            self.suppress_unchanged
+            and payload
+            and len(self.unchanged_keys(payload)) == len(payload)
+        ):
+            self._health.commands_suppressed += 1
+            _LOGGER.debug("Command %s matches current state, not sent", payload)
+            return False
+        try:
+            await self._api.async_send_json(payload)
+        except CommandRateLimitedError as err:
+            raise HomeAssistantError(str(err)) from err
+        self._health.commands_sent += 1
+        now = time.monotonic()
+        for key in echo_keys(payload):
+            self._in_flight[key] = now
+        return True
+
+    @callback
+    def async_track_keys(self, keys: Iterable[str]) -> CALLBACK_TYPE:
+        """Mark keys as backing an entity; return a callback that unmarks them."""
+        keys = tuple(keys)
+        self._tracked_keys.update(keys)
+
+        @callback
+        def untrack() -> None:
+            self._tracked_keys.subtract(keys)
+            for key in keys:
+                if self._tracked_keys[key] <= 0:
+                    del self._tracked_keys[key]
+
+        return untrack
+
+    def stale_keys(self, now: float | None = None) -> set[str]:
+        """Return tracked keys older than ``max_key_age``.
+
+        Keys the heater has never sent are not stale; refreshing would not
+        produce them.
+        """
+        now = time.monotonic() if now is None else now
+        max_age = self.max_key_age.total_seconds()
+        updated = self._state.updated
+        return {
+            key
+            for key in self._tracked_keys
+            if key in updated and now - updated[key] > max_age
+        }
+
+    @callback
+    def _async_check_stale(self, _now: datetime) -> None:
+        """Force a reconnect and mark entities unavailable on a silent link."""
+        now = time.monotonic()
+        self._health.stale_after = self._watchdog.stale_after
+        if not self._watchdog.is_stale(now):
+            return
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+        # Warn once per outage; retries while still silent are debug only
+        log = _LOGGER.debug if self._stale else _LOGGER.warning
+        log(
+            "No data from %s for %.0fs, reconnecting",
+            self.name,
+            self._watchdog.stale_after,
+        )
+        self._watchdog.reconnected(now)
+        self._stale = True
+        if self.last_update_success:
+            self.last_update_success = False
+            self.async_update_listeners()
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._api.async_reconnect(), f"{self.name} watchdog reconnect"
+        )
+
+    @property
+    def _rate_limit_issue_id(self) -> str:
+        return f"commands_rate_limited_{self.config_entry.entry_id}"
+
+    @property
+    def commands_dropped(self) -> int:
+        """Return writes refused by the command rate limit."""
+        return self._api.rate_limiter.dropped.total()
+
+    @callback
+    def _async_check_rate_limit(self, _now: datetime) -> None:
+        """Raise a repair issue while commands are dropped, clear it after."""
+        now = time.monotonic()
+        dropped = self.commands_dropped
+        if dropped > self._dropped_seen:
+            self._dropped_at = now
+            _LOGGER.warning(
+                "Command rate limit for %s dropped %d writes",
+                self.name,
+                dropped - self._dropped_seen,
+            )
+            self._dropped_seen = dropped
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                self._rate_limit_issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="commands_rate_limited",
+                translation_placeholders={
+                    "name": self.name,
+                    "dropped": str(dropped),
+                },
+            )
+        elif (
+            self._dropped_at is not None
+            and now - self._dropped_at > _RATE_LIMIT_ISSUE_CLEAR_AFTER
+        ):
+            self._dropped_at = None
+            ir.async_delete_issue(self.hass, DOMAIN, self._rate_limit_issue_id)
+
+    @callback
+    def async_add_health_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for health snapshots; return a callback that removes it."""
+        if not self._health_listeners:
+            self._async_publish_health()
+            self._health_unsub = async_track_time_interval(
+                self.hass,
+                self._async_publish_health,
+                _HEALTH_PUBLISH_INTERVAL,
+                name=f"{self.name} health",
+            )
+        self._health_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._health_listeners.remove(update_callback)
+            if not self._health_listeners and self._health_unsub:
+                self._health_unsub()
+                self._health_unsub = None
+
+        return remove_listener
+
+    @callback
+    def _async_publish_health(self, _now: datetime | None = None) -> None:
+        now = time.monotonic()
+        health = self._health
+        messages = health.message_count
+        received = self._api.bytes_received
+        messages_rate = bytes_rate = None
+        if self._health_baseline is not None:
+            since, last_messages, last_bytes = self._health_baseline
+            if (minutes := (now - since) / 60) > 0:
+                messages_rate = round((messages - last_messages) / minutes, 1)
+                bytes_rate = round((received - last_bytes) / minutes, 1)
+        self._health_baseline = (now, messages, received)
+
+        histogram = health.refresh_histogram
+        self._health_snapshot = HealthSnapshot(
+            messages_per_minute=messages_rate,
+            bytes_per_minute=bytes_rate,
+            refresh_p50_ms=_round(histogram.percentile(0.5)),
+            refresh_p95_ms=_round(histogram.percentile(0.95)),
+            refresh_p99_ms=_round(histogram.percentile(0.99)),
+            reconnects=self._api.reconnects,
+            parser_recoveries=self._api.parser_recoveries,
+            commands_dropped=self.commands_dropped,
+            seconds_since_last_message=(
+                None
+                if health.last_message_time is None
+                else round(now - health.last_message_time, 1)
+            ),
+            statistics=self._statistics.snapshot(now),
+        )
+        for update_callback in list(self._health_listeners):
+            update_callback()
+
+    @callback
+    def async_track_echo(self, keys: Iterable[str]) -> EchoWaiter:
+        """Start waiting for the heater to echo the given command keys."""
+        waiter = EchoWaiter(echo_keys(keys), self.hass.loop.create_future())
+        if not waiter.pending:
+            waiter.future.set_result(None)
+        else:
+            self._echo_waiters.append(waiter)
+        return waiter
+
+    async def async_wait_echo(self, waiter: EchoWaiter, timeout: float) -> set[str]:
+        """Wait for an echo to complete and return the keys still missing."""
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return set(waiter.pending)
+
+    @callback
+    def async_cancel_echo(self, waiter: EchoWaiter) -> None:
+        """Stop tracking an echo."""
+        if waiter in self._echo_waiters:
+            self._echo_waiters.remove(waiter)
+        if not waiter.future.done():
+            waiter.future.cancel()
+
+    def _resolve_echoes(self, payload: dict[str, Any]) -> None:
+        for waiter in list(self._echo_waiters):
+            waiter.pending.difference_update(payload)
+            if not waiter.pending:
+                self._echo_waiters.remove(waiter)
+                if not waiter.future.done():
+                    waiter.future.set_result(None)
 
     def handle_message(self, payload: dict[str, Any]) -> None:
         """Handle new payloads from the transport."""
         now = time.monotonic()
         self._health.message_count += 1
         self._health.last_message_time = now
+        self._watchdog.observe(payload, now)
+        if self._stale:
+            _LOGGER.info("Data from %s is back", self.name)
+            self._stale = False
 
         # Track refresh latency if we're waiting for a refresh response
         if self._health.last_refresh_time is not None:
             latency_ms = (now - self._health.last_refresh_time) * 1000
             self._health.refresh_latencies.append(latency_ms)
+            self._health.refresh_histogram.record(latency_ms)
             self._health.last_refresh_time = None
             _LOGGER.debug(
                 "Refresh latency: %.1fms (avg: %.1fms over %d samples)",
@@ -103,11 +602,97 @@ class AfterburnerCoordinator(DataUpdateCoordinator[HeaterState]):
                 len(self._health.refresh_latencies),
             )
 
-        self._state = self._state.merge_payload(payload)
+        self._ingest.push(payload)
+
+    def _publish_payload(self, payload: dict[str, Any]) -> None:
+        """Merge a payload, possibly conflated from several, and notify."""
+        if self._echo_waiters:
+            self._resolve_echoes(payload)
+        if self._in_flight:
+            for key in payload.keys() & self._in_flight.keys():
+                del self._in_flight[key]
+
+        now = time.monotonic()
+        if self.update_interval is None:
+            # First payload: start polling, scheduled by async_set_updated_data
+            self.update_interval = timedelta(seconds=self._scheduler.interval)
+        known_keys = len(self._state.raw)
+        self._state = self._state.merge_payload(payload, now)
+        # May add entities for first-seen keys before they are notified below
+        self._capabilities.async_observe(payload)
+        self._statistics.observe(payload, self._state.normalized, now)
+        self._fuel.async_observe(payload, self._state.normalized, now)
+        if not self._first_dump_settled:
+            self._track_first_dump(now, len(self._state.raw) > known_keys)
+        self._scheduler.observe(payload, now)
+        if self._scheduler.urgent(self._state.raw, self._api.last_command_time, now):
+            # Picked up by the refresh rescheduled in async_set_updated_data
+            self._scheduler.interval = self._scheduler.floor
+            self._apply_poll_interval(self._scheduler.floor)
         self.async_set_updated_data(self._state)
 
+    def _track_first_dump(self, now: float, new_keys: bool) -> None:
+        """Record the first message and first full dump setup phases."""
+        if self._timings.first_message is None:
+            self._timings.mark("first_message")
+        elif not new_keys:
+            return
+        # The dump is complete once no new keys arrive for a settle period
+        self._timings.first_full_dump = now - self._timings.setup_started
+        if self._full_dump_unsub:
+            self._full_dump_unsub()
+        self._full_dump_unsub = async_call_later(
+            self.hass, _FULL_DUMP_SETTLE_DELAY, self._async_first_dump_settled
+        )
+
+    @callback
+    def _async_first_dump_settled(self, _now: Any) -> None:
+        self._full_dump_unsub = None
+        self._first_dump_settled = True
+        _LOGGER.debug(
+            "Setup timings for %s (ms): %s (%d keys)",
+            self.name,
+            self._timings.as_dict(),
+            len(self._state.raw),
+        )
+
     async def _async_update_data(self) -> HeaterState:
+        if self._stale:
+            # Keep entities unavailable until the reconnected link delivers data
+            await self._api.async_request_refresh()
+            raise UpdateFailed("No recent data from heater")
+        now = time.monotonic()
+        raw = self._state.raw
+        last_command = self._api.last_command_time
+        fast = self._scheduler.wants_floor(raw, last_command, now)
+        self._apply_poll_interval(
+            self._scheduler.next_interval(raw, last_command, now)
+        )
+        if (
+            not fast
+            and self._first_dump_settled
+            and self.max_key_age
+            and self._tracked_keys
+            and self._watchdog.quiet_for(now)
+            < self._watchdog.stale_after * _SKIP_ACTIVITY_SHARE
+            and not self.stale_keys()
+        ):
+            # Every entity-backed key is fresh; a full dump would repeat it
+            self._health.refreshes_skipped += 1
+            _LOGGER.debug("All tracked keys fresh, skipping refresh")
+            return self._state
         # Track when we send the refresh request for latency measurement
-        self._health.last_refresh_time = time.monotonic()
+        self._health.last_refresh_time = now
+        self._health.refreshes_sent += 1
         await self._api.async_request_refresh()
         return self._state
+
+
+def _fallback_stale_after(update_interval: timedelta | None) -> float:
+    if update_interval is None:
+        return 120.0
+    return update_interval.total_seconds() * _STALE_POLL_INTERVALS
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
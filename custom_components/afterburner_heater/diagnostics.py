@@ -5,6 +5,9 @@ https://github.com/tonylofgren/aurora-smart-home
 """
 from __future__ import annotations
 
+import re
+import time
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,6 +15,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import redact
 
 from .const import DOMAIN
+from .protocol import DEFAULT_TRACE_EXPORT_WINDOW
 
 _SENSITIVE_KEYS = {
     "mpasswd",
@@ -23,6 +27,12 @@ _SENSITIVE_KEYS = {
     "authorization",
 }
 
+# "key": "value" pairs of sensitive keys inside raw JSON trace text
+_SENSITIVE_TRACE_RE = re.compile(
+    r'("(?:' + "|".join(sorted(_SENSITIVE_KEYS)) + r')"\s*:\s*)"(?:[^"\\]|\\.)*"',
+    re.IGNORECASE,
+)
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -38,12 +48,53 @@ async def async_get_config_entry_diagnostics(
         "ws_init_message": entry.options.get("ws_init_message"),
         "ble_init_message": entry.options.get("ble_init_message"),
         "ble_append_newline": entry.options.get("ble_append_newline"),
+        "setup_timings_ms": coordinator.timings.as_dict(),
+        "capabilities": sorted(coordinator.capabilities.keys),
+        "fuel": coordinator.fuel.integrator.as_dict(),
+        "ingest": coordinator.ingest.stats.as_dict(),
+        "watchdog": coordinator.watchdog.as_dict(time.monotonic()),
+        "refresh": {
+            "sent": coordinator.health.refreshes_sent,
+            "skipped": coordinator.health.refreshes_skipped,
+            "stale_keys": sorted(coordinator.stale_keys()),
+            "interval_s": coordinator.scheduler.interval,
+            "base_interval_s": coordinator.scheduler.base,
+            "min_interval_s": coordinator.scheduler.floor,
+            "max_interval_s": coordinator.scheduler.ceiling,
+            "saved_by_adaptive_interval": round(coordinator.scheduler.saved, 1),
+        },
+        "commands": {
+            "sent": coordinator.health.commands_sent,
+            "suppressed": coordinator.health.commands_suppressed,
+            "rate_limit": runtime_data.api.rate_limiter.as_dict(),
+        },
+        "health": (
+            asdict(coordinator.health_snapshot)
+            if coordinator.health_snapshot
+            else None
+        ),
         "last_payload": _redact_sensitive(
             coordinator.data.raw if coordinator.data else {}
         ),
+        "trace": {
+            "buffer_bytes": runtime_data.api.trace.size,
+            "dropped_records": runtime_data.api.trace.dropped,
+            "records": redact_trace(
+                runtime_data.api.trace.export(DEFAULT_TRACE_EXPORT_WINDOW)
+            ),
+        },
     }
 
 
+def redact_trace(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mask sensitive values inside exported wire trace records."""
+    for record in records:
+        record["data"] = _SENSITIVE_TRACE_RE.sub(
+            rf'\1"{redact.REDACTED}"', record["data"]
+        )
+    return records
+
+
 def _redact_sensitive(value: Any) -> Any:
     if isinstance(value, dict):
         redacted: dict[Any, Any] = {}
@@ -18,6 +18,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..capabilities import async_add_keyed_entities
 from ..const import DOMAIN
 from ..coordinator import AfterburnerCoordinator
 from ..protocol import HeaterState, raw_bool
@@ -51,9 +52,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Afterburner Heater binary sensors."""
     coordinator: AfterburnerCoordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        AfterburnerBinarySensor(coordinator, entry, description)
-        for description in BINARY_SENSOR_DESCRIPTIONS
+    async_add_keyed_entities(
+        entry,
+        coordinator.capabilities,
+        BINARY_SENSOR_DESCRIPTIONS,
+        lambda description: AfterburnerBinarySensor(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -79,6 +83,11 @@ class AfterburnerBinarySensor(
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys([self.entity_description.key]))
+
     @property
     def is_on(self) -> bool | None:
         state = cast(HeaterState | None, self.coordinator.data)
@@ -22,10 +22,20 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import DOMAIN
 from ..coordinator import AfterburnerCoordinator
-from ..protocol import HeaterState
+from ..protocol import THERMOSTAT_MODES, HeaterState
 
 # Thermostat mode options from the heater
-PRESET_MODES = ["Standard", "Deadband", "Linear Hz", "Stop/Start"]
+PRESET_MODES = list(THERMOSTAT_MODES)
+
+# Keys the climate entity reads
+CLIMATE_KEYS = (
+    "Temp1Current",
+    "TempCurrent",
+    "CyclicTemp",
+    "RunString",
+    "RunState",
+    "ThermostatMode",
+)
 
 
 async def async_setup_entry(
@@ -68,6 +78,11 @@ class AfterburnerClimate(CoordinatorEntity[AfterburnerCoordinator], ClimateEntit
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys(CLIMATE_KEYS))
+
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -175,17 +190,17 @@ class AfterburnerClimate(CoordinatorEntity[AfterburnerCoordinator], ClimateEntit
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         if hvac_mode == HVACMode.HEAT:
-            await self.coordinator._api.async_send_json({"Run": "heat"})
+            await self.coordinator.async_send_command({"Run": "heat"})
         else:
-            await self.coordinator._api.async_send_json({"Run": "off"})
+            await self.coordinator.async_send_command({"Run": "off"})
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is not None:
-            await self.coordinator._api.async_send_json({"CyclicTemp": temperature})
+            await self.coordinator.async_send_command({"CyclicTemp": temperature})
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode (thermostat mode)."""
         if preset_mode in PRESET_MODES:
-            await self.coordinator._api.async_send_json({"ThermostatMode": preset_mode})
+            await self.coordinator.async_send_command({"ThermostatMode": preset_mode})
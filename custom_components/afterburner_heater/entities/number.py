@@ -20,73 +20,25 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..capabilities import async_add_keyed_entities
 from ..const import DOMAIN
 from ..coordinator import AfterburnerCoordinator
-from ..protocol import HeaterState
+from ..protocol import PLATFORM_NUMBER, HeaterState, specs_for_platform
 
-NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
+NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = tuple(
     NumberEntityDescription(
-        key="CyclicTemp",
-        translation_key="CyclicTemp",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=-20,
-        native_max_value=40,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="CyclicOn",
-        translation_key="CyclicOn",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="CyclicOff",
-        translation_key="CyclicOff",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=-10,
-        native_max_value=10,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="FrostOn",
-        translation_key="FrostOn",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=-20,
-        native_max_value=10,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="FrostRise",
-        translation_key="FrostRise",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=0,
-        native_max_value=20,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="FrostTarget",
-        translation_key="FrostTarget",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=NumberDeviceClass.TEMPERATURE,
-        native_min_value=-10,
-        native_max_value=20,
-        native_step=0.5,
-    ),
-    NumberEntityDescription(
-        key="FixedDemand",
-        translation_key="FixedDemand",
-        native_min_value=0,
-        native_max_value=100,
-        native_step=1,
-        mode=NumberMode.SLIDER,
-    ),
+        key=spec.key,
+        translation_key=spec.key,
+        native_unit_of_measurement=(
+            UnitOfTemperature.CELSIUS if spec.temperature else None
+        ),
+        device_class=NumberDeviceClass.TEMPERATURE if spec.temperature else None,
+        native_min_value=spec.minimum,
+        native_max_value=spec.maximum,
+        native_step=spec.step,
+        mode=NumberMode.AUTO if spec.temperature else NumberMode.SLIDER,
+    )
+    for spec in specs_for_platform(PLATFORM_NUMBER)
 )
 
 
@@ -97,9 +49,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Afterburner Heater numbers."""
     coordinator: AfterburnerCoordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        AfterburnerNumber(coordinator, entry, description)
-        for description in NUMBER_DESCRIPTIONS
+    async_add_keyed_entities(
+        entry,
+        coordinator.capabilities,
+        NUMBER_DESCRIPTIONS,
+        lambda description: AfterburnerNumber(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -123,6 +78,11 @@ class AfterburnerNumber(CoordinatorEntity[AfterburnerCoordinator], NumberEntity)
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys([self.entity_description.key]))
+
     @property
     def native_value(self) -> float | None:
         state = cast(HeaterState | None, self.coordinator.data)
@@ -135,6 +95,6 @@ class AfterburnerNumber(CoordinatorEntity[AfterburnerCoordinator], NumberEntity)
             return None
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator._api.async_send_json(
+        await self.coordinator.async_send_command(
             {self.entity_description.key: value}
         )
@@ -14,24 +14,18 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..capabilities import async_add_keyed_entities
 from ..const import DOMAIN
 from ..coordinator import AfterburnerCoordinator
-from ..protocol import HeaterState
+from ..protocol import PLATFORM_SELECT, HeaterState, specs_for_platform
 
-THERMOSTAT_MODE_OPTIONS = ["Standard", "Deadband", "Linear Hz", "Stop/Start"]
-FROST_MODE_OPTIONS = ["Off", "Start/Stop", "System Thermostat", "Frost Thermostat"]
-
-SELECT_DESCRIPTIONS: tuple[SelectEntityDescription, ...] = (
-    SelectEntityDescription(
-        key="ThermostatMode",
-        translation_key="ThermostatMode",
-        options=THERMOSTAT_MODE_OPTIONS,
-    ),
+SELECT_DESCRIPTIONS: tuple[SelectEntityDescription, ...] = tuple(
     SelectEntityDescription(
-        key="FrostMode",
-        translation_key="FrostMode",
-        options=FROST_MODE_OPTIONS,
-    ),
+        key=spec.key,
+        translation_key=spec.key,
+        options=list(spec.options),
+    )
+    for spec in specs_for_platform(PLATFORM_SELECT)
 )
 
 
@@ -42,9 +36,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Afterburner Heater selects."""
     coordinator: AfterburnerCoordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        AfterburnerSelect(coordinator, entry, description)
-        for description in SELECT_DESCRIPTIONS
+    async_add_keyed_entities(
+        entry,
+        coordinator.capabilities,
+        SELECT_DESCRIPTIONS,
+        lambda description: AfterburnerSelect(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -68,6 +65,11 @@ class AfterburnerSelect(CoordinatorEntity[AfterburnerCoordinator], SelectEntity)
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys([self.entity_description.key]))
+
     @property
     def current_option(self) -> str | None:
         state = cast(HeaterState | None, self.coordinator.data)
@@ -77,6 +79,6 @@ class AfterburnerSelect(CoordinatorEntity[AfterburnerCoordinator], SelectEntity)
         return None if value is None else str(value)
 
     async def async_select_option(self, option: str) -> None:
-        await self.coordinator._api.async_send_json(
+        await self.coordinator.async_send_command(
             {self.entity_description.key: option}
         )
@@ -5,6 +5,10 @@ https://github.com/tonylofgren/aurora-smart-home
 """
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, cast
 
 from homeassistant.components.sensor import (
@@ -18,171 +22,385 @@ from homeassistant.const import (
     EntityCategory,
     PERCENTAGE,
     UnitOfElectricPotential,
+    UnitOfEnergy,
     UnitOfFrequency,
     UnitOfPressure,
     UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..capabilities import async_add_keyed_entities
 from ..const import DOMAIN
-from ..coordinator import AfterburnerCoordinator
-from ..protocol import HeaterState
+from ..coordinator import AfterburnerCoordinator, HealthSnapshot
+from ..protocol import FuelIntegrator, HeaterState
 
-SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+# Deadband comparisons tolerate this much float error
+DEADBAND_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True, kw_only=True)
+class AfterburnerSensorDescription(SensorEntityDescription):
+    """Describes a heater state sensor and how its writes are filtered."""
+
+    # A numeric state is only written once it moved at least this far from
+    # the last written value; 0 writes every change
+    deadband: float = 0.0
+    # Seconds a numeric state is held after a write; 0 writes immediately
+    min_interval: float = 0.0
+
+
+SENSOR_DESCRIPTIONS: tuple[AfterburnerSensorDescription, ...] = (
+    AfterburnerSensorDescription(
         key="Humidity",
         translation_key="Humidity",
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,  # Noisy sensor
+        deadband=1.0,
+        min_interval=60,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="TempCurrent",
         translation_key="TempCurrent",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="TempDesired",
         translation_key="TempDesired",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="TempBody",
         translation_key="TempBody",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="Temp1Current",
         translation_key="Temp1Current",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="Temp4Current",
         translation_key="Temp4Current",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="InputVoltage",
         translation_key="InputVoltage",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=0.1,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="SystemVoltage",
         translation_key="SystemVoltage",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=0.1,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="GlowVoltage",
         translation_key="GlowVoltage",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=0.1,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="GlowCurrent",
         translation_key="GlowCurrent",
         native_unit_of_measurement="A",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=0.1,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="FanRPM",
         translation_key="FanRPM",
         native_unit_of_measurement="RPM",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="PumpActual",
         translation_key="PumpActual",
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=0.1,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="PumpFixed",
         translation_key="PumpFixed",
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="FuelUsage",
         translation_key="FuelUsage",
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="TotalFuelUsage",
         translation_key="TotalFuelUsage",
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="FuelRate",
         translation_key="FuelRate",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="FrostRise",
         translation_key="FrostRise",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="Altitude",
         translation_key="Altitude",
         native_unit_of_measurement="m",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="FuelAlarm",
         translation_key="FuelAlarm",
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="RunString",
         translation_key="RunString",
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="ErrorString",
         translation_key="ErrorString",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="GPanlg",
         translation_key="GPanlg",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    SensorEntityDescription(
+    AfterburnerSensorDescription(
         key="Pressure",
         translation_key="Pressure",
         native_unit_of_measurement=UnitOfPressure.HPA,
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,  # Noisy sensor
+        deadband=0.5,
+        min_interval=60,
+    ),
+)
+
+
+
+@dataclass(frozen=True, kw_only=True)
+class AfterburnerHealthSensorDescription(SensorEntityDescription):
+    """Describes a transport health sensor."""
+
+    value_fn: Callable[[HealthSnapshot], StateType]
+
+
+HEALTH_SENSOR_DESCRIPTIONS: tuple[AfterburnerHealthSensorDescription, ...] = (
+    AfterburnerHealthSensorDescription(
+        key="messages_per_minute",
+        translation_key="messages_per_minute",
+        native_unit_of_measurement="msg/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda snapshot: snapshot.messages_per_minute,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="bytes_per_minute",
+        translation_key="bytes_per_minute",
+        native_unit_of_measurement="B/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.bytes_per_minute,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="refresh_latency_p50",
+        translation_key="refresh_latency_p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.refresh_p50_ms,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="refresh_latency_p95",
+        translation_key="refresh_latency_p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda snapshot: snapshot.refresh_p95_ms,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="refresh_latency_p99",
+        translation_key="refresh_latency_p99",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.refresh_p99_ms,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="reconnects",
+        translation_key="reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda snapshot: snapshot.reconnects,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="time_since_last_message",
+        translation_key="time_since_last_message",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda snapshot: snapshot.seconds_since_last_message,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="parser_recoveries",
+        translation_key="parser_recoveries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda snapshot: snapshot.parser_recoveries,
+    ),
+    AfterburnerHealthSensorDescription(
+        key="commands_dropped",
+        translation_key="commands_dropped",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda snapshot: snapshot.commands_dropped,
+    ),
+)
+
+# Keys with rolling mean/min/max figures, with their unit and device class
+_STATISTICS_SOURCES: dict[str, tuple[str, SensorDeviceClass]] = {
+    "TempCurrent": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    "TempBody": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    "InputVoltage": (UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE),
+    "PumpActual": (UnitOfFrequency.HERTZ, SensorDeviceClass.FREQUENCY),
+}
+
+
+def _statistic(key: str) -> Callable[[HealthSnapshot], StateType]:
+    return lambda snapshot: snapshot.statistics.get(key)
+
+
+# Published with the health snapshot, so they update at its fixed rate
+STATISTICS_SENSOR_DESCRIPTIONS: tuple[AfterburnerHealthSensorDescription, ...] = (
+    *(
+        AfterburnerHealthSensorDescription(
+            key=f"{source}_{figure}",
+            translation_key=f"{source}_{figure}",
+            native_unit_of_measurement=unit,
+            device_class=device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            value_fn=_statistic(f"{source}_{figure}"),
+        )
+        for source, (unit, device_class) in _STATISTICS_SOURCES.items()
+        for figure in ("mean", "min", "max")
+    ),
+    AfterburnerHealthSensorDescription(
+        key="run_duty_cycle",
+        translation_key="run_duty_cycle",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_statistic("run_duty_cycle"),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AfterburnerFuelSensorDescription(SensorEntityDescription):
+    """Describes a sensor reading the coordinator's fuel integrator."""
+
+    value_fn: Callable[[FuelIntegrator], StateType]
+
+
+def _liters(ml: float) -> float:
+    return round(ml / 1000, 3)
+
+
+FUEL_SENSOR_DESCRIPTIONS: tuple[AfterburnerFuelSensorDescription, ...] = (
+    AfterburnerFuelSensorDescription(
+        key="fuel_total",
+        translation_key="fuel_total",
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        device_class=SensorDeviceClass.VOLUME,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda fuel: _liters(fuel.total_ml),
+    ),
+    AfterburnerFuelSensorDescription(
+        key="fuel_today",
+        translation_key="fuel_today",
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        device_class=SensorDeviceClass.VOLUME,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda fuel: _liters(fuel.day_ml),
+    ),
+    AfterburnerFuelSensorDescription(
+        key="fuel_this_run",
+        translation_key="fuel_this_run",
+        native_unit_of_measurement=UnitOfVolume.LITERS,
+        device_class=SensorDeviceClass.VOLUME,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda fuel: _liters(fuel.run_ml),
+    ),
+    # Energy dashboard source: fuel use at diesel's calorific value
+    AfterburnerFuelSensorDescription(
+        key="fuel_energy",
+        translation_key="fuel_energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda fuel: round(fuel.energy_kwh, 2),
+    ),
+    AfterburnerFuelSensorDescription(
+        key="burn_rate",
+        translation_key="burn_rate",
+        native_unit_of_measurement="L/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fuel: (
+            None if fuel.rate_lph is None else round(fuel.rate_lph, 3)
+        ),
     ),
 )
 
@@ -195,8 +413,22 @@ async def async_setup_entry(
     """Set up Afterburner Heater sensors."""
     coordinator: AfterburnerCoordinator = entry.runtime_data.coordinator
     async_add_entities(
-        AfterburnerSensor(coordinator, entry, description)
-        for description in SENSOR_DESCRIPTIONS
+        AfterburnerHealthSensor(coordinator, entry, description)
+        for description in (
+            *HEALTH_SENSOR_DESCRIPTIONS,
+            *STATISTICS_SENSOR_DESCRIPTIONS,
+        )
+    )
+    async_add_entities(
+        AfterburnerFuelSensor(coordinator, entry, description)
+        for description in FUEL_SENSOR_DESCRIPTIONS
+    )
+    async_add_keyed_entities(
+        entry,
+        coordinator.capabilities,
+        SENSOR_DESCRIPTIONS,
+        lambda description: AfterburnerSensor(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -206,15 +438,22 @@ class AfterburnerSensor(
     """Representation of an Afterburner Heater sensor."""
 
     _attr_has_entity_name = True
+    entity_description: AfterburnerSensorDescription
 
     def __init__(
         self,
         coordinator: AfterburnerCoordinator,
         entry: ConfigEntry,
-        description: SensorEntityDescription,
+        description: AfterburnerSensorDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self.deadband = description.deadband
+        self.min_interval = description.min_interval
+        self._written_value: Any = None
+        self._written_available: bool | None = None
+        self._written_at = 0.0
+        self._hold_unsub: CALLBACK_TYPE | None = None
         self._attr_unique_id = f"{entry.entry_id}-{description.key}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -222,9 +461,142 @@ class AfterburnerSensor(
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys([self.entity_description.key]))
+        self.async_on_remove(self._cancel_hold)
+
     @property
     def native_value(self) -> Any:
         state = cast(HeaterState | None, self.coordinator.data)
         if state is None:
             return None
         return state.raw.get(self.entity_description.key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless it is within the deadband or min interval."""
+        if not (self.deadband or self.min_interval):
+            super()._handle_coordinator_update()
+            return
+        value = self.native_value
+        if self.available == self._written_available:
+            if not self._changed(value):
+                return
+            held = self._written_at + self.min_interval - time.monotonic()
+            if held > 0 and _is_number(value) and _is_number(self._written_value):
+                # Written when the hold ends unless it changes back first
+                if self._hold_unsub is None:
+                    self._hold_unsub = async_call_later(
+                        self.hass, held, self._async_hold_ended
+                    )
+                return
+        self._write(value)
+
+    @callback
+    def _async_hold_ended(self, _now: datetime) -> None:
+        self._hold_unsub = None
+        value = self.native_value
+        if self._changed(value):
+            self._write(value)
+
+    def _changed(self, value: Any) -> bool:
+        written = self._written_value
+        if not (_is_number(value) and _is_number(written)):
+            return value != written
+        # Allow for float error, so 12.5 -> 12.6 passes a 0.1 deadband
+        return (
+            value != written
+            and abs(value - written) >= self.deadband - DEADBAND_TOLERANCE
+        )
+
+    def _write(self, value: Any) -> None:
+        self._cancel_hold()
+        self._written_value = value
+        self._written_available = self.available
+        self._written_at = time.monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_hold(self) -> None:
+        if self._hold_unsub is not None:
+            self._hold_unsub()
+            self._hold_unsub = None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class AfterburnerFuelSensor(
+    CoordinatorEntity[AfterburnerCoordinator], SensorEntity
+):
+    """Fuel use or burn rate from the coordinator's integrator."""
+
+    _attr_has_entity_name = True
+    entity_description: AfterburnerFuelSensorDescription
+
+    def __init__(
+        self,
+        coordinator: AfterburnerCoordinator,
+        entry: ConfigEntry,
+        description: AfterburnerFuelSensorDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}-{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Afterburner",
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        return self.entity_description.value_fn(self.coordinator.fuel.integrator)
+
+
+class AfterburnerHealthSensor(SensorEntity):
+    """Transport health sensor, updated at the coordinator's fixed health rate.
+
+    Not a coordinator entity: it must not be rewritten on every payload, and
+    it stays available while the transport is down.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description: AfterburnerHealthSensorDescription
+
+    def __init__(
+        self,
+        coordinator: AfterburnerCoordinator,
+        entry: ConfigEntry,
+        description: AfterburnerHealthSensorDescription,
+    ) -> None:
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}-{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Afterburner",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to health snapshots."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_health_listener(self._handle_health_update)
+        )
+
+    @callback
+    def _handle_health_update(self) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> StateType:
+        snapshot = self.coordinator.health_snapshot
+        if snapshot is None:
+            return None
+        return self.entity_description.value_fn(snapshot)
@@ -14,35 +14,26 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ..capabilities import async_add_keyed_entities
 from ..const import DOMAIN
 from ..coordinator import AfterburnerCoordinator
-from ..protocol import HeaterState, raw_bool
-
-
-SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
-    SwitchEntityDescription(
-        key="CyclicEnb",
-        translation_key="CyclicEnb",
-    ),
-    SwitchEntityDescription(
-        key="FrostEnable",
-        translation_key="FrostEnable",
-    ),
-    SwitchEntityDescription(
-        key="Thermostat",
-        translation_key="Thermostat",
-    ),
-    SwitchEntityDescription(
-        key="GPout1",
-        translation_key="GPout1",
-    ),
-    SwitchEntityDescription(
-        key="GPout2",
-        translation_key="GPout2",
-    ),
+from ..protocol import (
+    PLATFORM_SWITCH,
+    HeaterState,
+    raw_bool,
+    specs_for_platform,
 )
 
 
+SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = tuple(
+    SwitchEntityDescription(key=spec.key, translation_key=spec.key)
+    for spec in specs_for_platform(PLATFORM_SWITCH)
+)
+
+# Keys the power switch reads
+_POWER_KEYS = ("Run", "RunState", "Power")
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -50,12 +41,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Afterburner Heater switches."""
     coordinator: AfterburnerCoordinator = entry.runtime_data.coordinator
-    entities: list[SwitchEntity] = [AfterburnerPowerSwitch(coordinator, entry)]
-    entities.extend(
-        AfterburnerCommandSwitch(coordinator, entry, description)
-        for description in SWITCH_DESCRIPTIONS
+    async_add_entities([AfterburnerPowerSwitch(coordinator, entry)])
+    async_add_keyed_entities(
+        entry,
+        coordinator.capabilities,
+        SWITCH_DESCRIPTIONS,
+        lambda description: AfterburnerCommandSwitch(coordinator, entry, description),
+        async_add_entities,
     )
-    async_add_entities(entities)
 
 
 class AfterburnerPowerSwitch(
@@ -75,10 +68,15 @@ class AfterburnerPowerSwitch(
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys(_POWER_KEYS))
+
     @property
     def available(self) -> bool:
         state = cast(HeaterState | None, self.coordinator.data)
-        if state is None:
+        if state is None or not super().available:
             return False
         return state.power is not None or "Power" in state.raw or "Run" in state.raw
 
@@ -90,10 +88,10 @@ class AfterburnerPowerSwitch(
         return state.power
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator._api.async_send_json({"Run": "heat"})
+        await self.coordinator.async_send_command({"Run": "heat"})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator._api.async_send_json({"Run": "off"})
+        await self.coordinator.async_send_command({"Run": "off"})
 
 
 class AfterburnerCommandSwitch(
@@ -118,6 +116,11 @@ class AfterburnerCommandSwitch(
             manufacturer="Afterburner",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register the keys this entity reads for refresh scheduling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_keys([self.entity_description.key]))
+
     @property
     def is_on(self) -> bool | None:
         state = cast(HeaterState | None, self.coordinator.data)
@@ -126,11 +129,11 @@ class AfterburnerCommandSwitch(
         return raw_bool(state.raw, [self.entity_description.key])
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.coordinator._api.async_send_json(
+        await self.coordinator.async_send_command(
             {self.entity_description.key: 1}
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.coordinator._api.async_send_json(
+        await self.coordinator.async_send_command(
             {self.entity_description.key: 0}
         )
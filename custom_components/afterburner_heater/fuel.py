@@ -0,0 +1,94 @@
+"""Fuel consumption of one heater, checkpointed per config entry.
+
+The ``FuelIntegrator`` is fed from the coordinator per payload; this wrapper
+restores its accumulators at setup, starts a new day at local midnight and
+writes a checkpoint every few minutes, when Home Assistant stops and when the
+entry is unloaded.
+"""
+from __future__ import annotations
+
+from collections.abc import Container, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_time_change,
+    async_track_time_interval,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .protocol import FuelIntegrator
+
+STORAGE_VERSION = 1
+# Fuel use since the last checkpoint is lost if Home Assistant crashes
+_CHECKPOINT_INTERVAL = timedelta(minutes=5)
+
+
+class FuelMeter:
+    """Checkpointed fuel integrator of one heater."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.fuel"
+        )
+        self.integrator = FuelIntegrator()
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    async def async_load(self) -> None:
+        """Continue from the last checkpoint."""
+        if data := await self._store.async_load():
+            self.integrator.restore(data)
+        self.integrator.start_day(dt_util.now().date().isoformat())
+        self.integrator.changed = False
+
+    async def async_remove(self) -> None:
+        """Delete the checkpoint, e.g. when the entry is removed."""
+        await self._store.async_remove()
+
+    @callback
+    def async_start(self) -> None:
+        """Start the midnight reset and periodic checkpoints."""
+        self._unsubs = [
+            async_track_time_change(
+                self._hass, self._async_new_day, hour=0, minute=0, second=0
+            ),
+            async_track_time_interval(
+                self._hass, self._async_checkpoint, _CHECKPOINT_INTERVAL
+            ),
+            # Pending delayed saves are flushed by the store's final write
+            self._hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._async_checkpoint
+            ),
+        ]
+
+    async def async_stop(self) -> None:
+        """Stop the timers and write a final checkpoint."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        if self.integrator.changed:
+            self.integrator.changed = False
+            await self._store.async_save(self.integrator.as_dict())
+
+    @callback
+    def async_observe(
+        self, keys: Container[str], values: Mapping[str, Any], now: float
+    ) -> None:
+        """Fold in the normalized values of one payload."""
+        self.integrator.observe(keys, values, now)
+
+    @callback
+    def _async_new_day(self, now: datetime) -> None:
+        self.integrator.start_day(dt_util.as_local(now).date().isoformat())
+
+    @callback
+    def _async_checkpoint(self, _now: datetime | Event) -> None:
+        if not self.integrator.changed:
+            return
+        self.integrator.changed = False
+        self._store.async_delay_save(self.integrator.as_dict)
@@ -0,0 +1,149 @@
+"""Payload ingestion stage between the transport and the coordinator.
+
+Payloads are normally published one by one as they arrive. When the event
+loop is lagging, payloads arriving before the next loop iteration are folded
+into a single delta with ``dict.update`` (latest value per key wins, no key is
+lost) and published once, so a refresh dump costs one merge and one entity
+fan-out instead of one per object. The lag is only sampled while payloads
+are arriving, so an idle heater adds no timer wake-ups.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the event loop lag is sampled
+_LAG_PROBE_INTERVAL = 0.25
+# Loop lag above which payloads are conflated; conflation stops below half
+_LAG_THRESHOLD = 0.05
+# Sampling stops once no payload arrived for this long
+_PROBE_IDLE_AFTER = 2.0
+
+
+@dataclass
+class IngestStats:
+    """Counters for the ingestion stage."""
+
+    payloads: int = 0
+    publishes: int = 0
+    conflated_payloads: int = 0
+    conflated_batches: int = 0
+    conflation_activations: int = 0
+    loop_lag: float = 0.0
+    max_loop_lag: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters with lags in milliseconds."""
+        return {
+            "payloads": self.payloads,
+            "publishes": self.publishes,
+            "conflated_payloads": self.conflated_payloads,
+            "conflated_batches": self.conflated_batches,
+            "conflation_activations": self.conflation_activations,
+            "loop_lag_ms": round(self.loop_lag * 1000, 1),
+            "max_loop_lag_ms": round(self.max_loop_lag * 1000, 1),
+        }
+
+
+class PayloadIngest:
+    """Publish payloads directly, or conflated while the loop is lagging."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        publish: Callable[[dict[str, Any]], None],
+        lag_threshold: float = _LAG_THRESHOLD,
+        probe_interval: float = _LAG_PROBE_INTERVAL,
+        probe_idle_after: float = _PROBE_IDLE_AFTER,
+    ) -> None:
+        self._loop = loop
+        self._publish = publish
+        self._lag_threshold = lag_threshold
+        self._probe_interval = probe_interval
+        self._probe_idle_after = probe_idle_after
+        self.stats = IngestStats()
+        self.conflating = False
+        self._pending: dict[str, Any] | None = None
+        self._pending_count = 0
+        self._probe_handle: asyncio.TimerHandle | None = None
+        self._probe_due = 0.0
+        self._started = False
+        self._last_payload = 0.0
+
+    def start(self) -> None:
+        """Sample the event loop lag whenever payloads arrive."""
+        self._started = True
+
+    def stop(self) -> None:
+        """Stop sampling and publish anything still pending."""
+        self._started = False
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+        self.conflating = False
+        if self._pending is not None:
+            self._flush()
+
+    def push(self, payload: dict[str, Any]) -> None:
+        """Accept one decoded payload from the transport."""
+        self.stats.payloads += 1
+        if self._started:
+            self._last_payload = self._loop.time()
+            if self._probe_handle is None:
+                self._schedule_probe()
+        if self._pending is not None:
+            self._pending.update(payload)
+            self._pending_count += 1
+            return
+        if not self.conflating:
+            self.stats.publishes += 1
+            self._publish(payload)
+            return
+        # Copy: the payload object may be shared with other subscribers
+        self._pending = dict(payload)
+        self._pending_count = 1
+        self._loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        pending, count = self._pending, self._pending_count
+        if pending is None:
+            return
+        self._pending = None
+        self._pending_count = 0
+        if count > 1:
+            self.stats.conflated_payloads += count - 1
+            self.stats.conflated_batches += 1
+        self.stats.publishes += 1
+        self._publish(pending)
+
+    def _schedule_probe(self) -> None:
+        self._probe_due = self._loop.time() + self._probe_interval
+        self._probe_handle = self._loop.call_at(self._probe_due, self._probe)
+
+    def _probe(self) -> None:
+        now = self._loop.time()
+        lag = max(0.0, now - self._probe_due)
+        self.stats.loop_lag = lag
+        self.stats.max_loop_lag = max(self.stats.max_loop_lag, lag)
+        if lag > self._lag_threshold:
+            if not self.conflating:
+                self.conflating = True
+                self.stats.conflation_activations += 1
+                _LOGGER.debug(
+                    "Event loop lag %.1fms, conflating payloads", lag * 1000
+                )
+        elif self.conflating and lag < self._lag_threshold / 2:
+            self.conflating = False
+            _LOGGER.debug("Event loop lag %.1fms, conflation stopped", lag * 1000)
+        idle = now - self._last_payload >= self._probe_idle_after
+        if self._pending is not None or not idle:
+            self._schedule_probe()
+            return
+        # Idle: the next payload re-arms the probe and measures afresh
+        self._probe_handle = None
+        self.conflating = False
@@ -2,9 +2,30 @@
 
 Shared protocol definitions for both Home Assistant integration
 and standalone protocol lab tool.
+
+The BLE and WebSocket transports live in ``ble_transport`` and
+``ws_transport`` and are not imported here, so the package only needs
+``bleak`` or ``aiohttp`` when the matching transport is used.
+
+The asyncio-based client, refresh gate and subscription queues are imported
+on first access. ``python -m protocol.replay`` runs with the integration
+directory on ``sys.path``, where the integration's ``select.py`` shadows the
+standard library module asyncio needs.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .commands import (
+    ENCODED_GPOUT1_OFF,
+    ENCODED_GPOUT1_ON,
+    ENCODED_GPOUT2_OFF,
+    ENCODED_GPOUT2_ON,
+    ENCODED_REFRESH,
+    ENCODED_RUN_HEAT,
+    ENCODED_RUN_OFF,
     RefreshCommand,
     RunCommand,
     build_command,
@@ -12,6 +33,10 @@ from .commands import (
     cyclic_off_command,
     cyclic_on_command,
     cyclic_temp_command,
+    encode_command,
+    encode_setting,
+    encoded_command,
+    encoded_size,
     fixed_demand_command,
     frost_enable_command,
     frost_on_command,
@@ -19,6 +44,7 @@ from .commands import (
     frost_target_command,
     gpout1_command,
     gpout2_command,
+    pack_commands,
     refresh_command,
     run_command,
     thermostat_command,
@@ -34,12 +60,16 @@ from .const import (
     DEFAULT_BLE_INIT_MESSAGE,
     DEFAULT_BLE_WRITE_CHAR,
     DEFAULT_BLE_WRITE_WITH_RESPONSE,
+    DEFAULT_TRACE_BUFFER_BYTES,
+    DEFAULT_TRACE_EXPORT_WINDOW,
     DEFAULT_WS_COMMAND_TIMEOUT,
     DEFAULT_WS_INIT_MESSAGE,
     DEFAULT_WS_PATH,
     DEFAULT_WS_PORT,
     SERVICE_UUID,
 )
+from .fuel import DEFAULT_PUMP_STROKE_ML, FUEL_ENERGY_KWH_PER_LITER, FuelIntegrator
+from .histogram import StreamingHistogram
 from .json_stream import JsonObjectStream
 from .models import (
     BOOL_KEYS,
@@ -54,10 +84,124 @@ from .models import (
     raw_value,
     state_text_from_raw,
 )
+from .ratelimit import (
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE,
+    LANE_CONTROL,
+    LANE_REFRESH,
+    LANE_SETTING,
+    CommandRateLimitedError,
+    CommandRateLimiter,
+    command_lane,
+)
+from .schema import (
+    COMMAND_SPECS,
+    FROST_MODES,
+    KIND_CHOICE,
+    KIND_FLAG,
+    KIND_FLOAT,
+    PLATFORM_NUMBER,
+    PLATFORM_SELECT,
+    PLATFORM_SWITCH,
+    THERMOSTAT_MODES,
+    CommandSpec,
+    coerce_settings,
+    echo_key,
+    echo_keys,
+    is_exclusive,
+    specs_for_platform,
+)
+from .stats import (
+    DEFAULT_EWMA_HALF_LIFE,
+    DEFAULT_STATISTICS_KEYS,
+    DEFAULT_STATISTICS_WINDOW,
+    DutyCycle,
+    HeaterStatistics,
+    RollingStats,
+)
+from .trace import TRACE_IN, TRACE_OUT, TraceRecorder, iter_records
+from .transport import Transport, TransportError
+
+if TYPE_CHECKING:
+    from .client import AfterburnerClient
+    from .refresh import (
+        DEFAULT_REFRESH_SETTLE,
+        DEFAULT_REFRESH_SPACING,
+        DEFAULT_REFRESH_TIMEOUT,
+        RefreshGate,
+    )
+    from .subscription import (
+        DEFAULT_CHANGE_QUEUE_SIZE,
+        DEFAULT_PAYLOAD_QUEUE_SIZE,
+        ConflatingQueue,
+        PayloadQueue,
+    )
+
+# Names imported on first access, by defining module
+_LAZY_IMPORTS = {
+    "AfterburnerClient": ".client",
+    "DEFAULT_REFRESH_SETTLE": ".refresh",
+    "DEFAULT_REFRESH_SPACING": ".refresh",
+    "DEFAULT_REFRESH_TIMEOUT": ".refresh",
+    "RefreshGate": ".refresh",
+    "DEFAULT_CHANGE_QUEUE_SIZE": ".subscription",
+    "DEFAULT_PAYLOAD_QUEUE_SIZE": ".subscription",
+    "ConflatingQueue": ".subscription",
+    "PayloadQueue": ".subscription",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
+    # Client and transports
+    "AfterburnerClient",
+    "Transport",
+    "TransportError",
     # JSON stream parser
     "JsonObjectStream",
+    # Metrics
+    "StreamingHistogram",
+    # Rolling statistics
+    "HeaterStatistics",
+    "RollingStats",
+    "DutyCycle",
+    "DEFAULT_STATISTICS_KEYS",
+    "DEFAULT_STATISTICS_WINDOW",
+    "DEFAULT_EWMA_HALF_LIFE",
+    # Fuel consumption
+    "FuelIntegrator",
+    "DEFAULT_PUMP_STROKE_ML",
+    "FUEL_ENERGY_KWH_PER_LITER",
+    # Refresh de-duplication
+    "RefreshGate",
+    "DEFAULT_REFRESH_SETTLE",
+    "DEFAULT_REFRESH_SPACING",
+    "DEFAULT_REFRESH_TIMEOUT",
+    # Command rate limiting
+    "CommandRateLimiter",
+    "CommandRateLimitedError",
+    "command_lane",
+    "LANE_CONTROL",
+    "LANE_SETTING",
+    "LANE_REFRESH",
+    "DEFAULT_COMMAND_BURST",
+    "DEFAULT_COMMAND_RATE",
+    # Subscriptions
+    "ConflatingQueue",
+    "PayloadQueue",
+    "DEFAULT_CHANGE_QUEUE_SIZE",
+    "DEFAULT_PAYLOAD_QUEUE_SIZE",
+    # Wire trace
+    "TraceRecorder",
+    "TRACE_IN",
+    "TRACE_OUT",
+    "iter_records",
     # Models and parsing
     "HeaterState",
     "normalize_payload",
@@ -86,10 +230,40 @@ __all__ = [
     "DEFAULT_BLE_APPEND_NEWLINE",
     "DEFAULT_BLE_CONNECT_TIMEOUT",
     "DEFAULT_BLE_COMMAND_TIMEOUT",
+    "DEFAULT_TRACE_BUFFER_BYTES",
+    "DEFAULT_TRACE_EXPORT_WINDOW",
+    # Command registry
+    "CommandSpec",
+    "COMMAND_SPECS",
+    "KIND_FLOAT",
+    "KIND_FLAG",
+    "KIND_CHOICE",
+    "PLATFORM_NUMBER",
+    "PLATFORM_SWITCH",
+    "PLATFORM_SELECT",
+    "THERMOSTAT_MODES",
+    "FROST_MODES",
+    "coerce_settings",
+    "echo_key",
+    "echo_keys",
+    "is_exclusive",
+    "specs_for_platform",
     # Commands
     "RefreshCommand",
     "RunCommand",
     "build_command",
+    "encode_command",
+    "encode_setting",
+    "encoded_command",
+    "encoded_size",
+    "ENCODED_REFRESH",
+    "ENCODED_RUN_HEAT",
+    "ENCODED_RUN_OFF",
+    "ENCODED_GPOUT1_ON",
+    "ENCODED_GPOUT1_OFF",
+    "ENCODED_GPOUT2_ON",
+    "ENCODED_GPOUT2_OFF",
+    "pack_commands",
     "refresh_command",
     "run_command",
     "cyclic_temp_command",
@@ -0,0 +1,198 @@
+"""BLE transport for the standalone Afterburner client.
+
+Requires ``bleak`` and ``bleak-retry-connector``. The BLE device is looked up
+through an injectable resolver so the same transport works under Home
+Assistant's Bluetooth stack and with plain ``BleakScanner`` results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from bleak import BleakClient, BleakError
+from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak_retry_connector import BleakError as BleakRetryError, establish_connection
+
+from .const import (
+    CHAR_NOTIFY_UUID,
+    DEFAULT_BLE_APPEND_NEWLINE,
+    DEFAULT_BLE_COMMAND_TIMEOUT,
+    DEFAULT_BLE_CONNECT_TIMEOUT,
+    DEFAULT_BLE_WRITE_CHAR,
+    DEFAULT_BLE_WRITE_WITH_RESPONSE,
+)
+from .transport import Transport, TransportError
+
+_LOGGER = logging.getLogger(__name__)
+
+# ATT payload available with the default 23 byte MTU
+_DEFAULT_ATT_PAYLOAD = 20
+# Firmware needs a moment after subscribing before it answers a refresh
+_REFRESH_DELAY = 0.2
+
+DeviceResolver = Callable[[str], Any]
+Connector = Callable[..., Awaitable[BleakClient]]
+
+
+class BleTransport(Transport):
+    """Notify/write transport over a BLE GATT connection."""
+
+    refresh_delay = _REFRESH_DELAY
+
+    def __init__(
+        self,
+        address: str,
+        device_resolver: DeviceResolver,
+        write_char: str = DEFAULT_BLE_WRITE_CHAR,
+        write_with_response: bool = DEFAULT_BLE_WRITE_WITH_RESPONSE,
+        append_newline: bool = DEFAULT_BLE_APPEND_NEWLINE,
+        connector: Connector | None = None,
+    ) -> None:
+        super().__init__()
+        self._address = address
+        self._device_resolver = device_resolver
+        self._connector = connector
+        self._write_char = format_uuid(write_char)
+        self._write_target: BleakGATTCharacteristic | str = self._write_char
+        self._write_with_response = write_with_response
+        self._append_newline = append_newline
+        self._client: BleakClient | None = None
+        self._notifying = False
+        self._lock = asyncio.Lock()
+        self._disconnected_event = asyncio.Event()
+
+    @property
+    def suffix(self) -> bytes:  # type: ignore[override]
+        """Return the optional newline terminating each write."""
+        return b"\n" if self._append_newline else b""
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the GATT connection is up."""
+        return self._client is not None and self._client.is_connected
+
+    @property
+    def max_payload_size(self) -> int:
+        """Largest payload that fits one ATT write on the current connection."""
+        if self._client and self._client.is_connected:
+            payload_size = self._client.mtu_size - 3
+        else:
+            payload_size = _DEFAULT_ATT_PAYLOAD
+        return payload_size - len(self.suffix)
+
+    async def update_write_settings(
+        self, write_char: str, write_with_response: bool, append_newline: bool
+    ) -> None:
+        """Apply new write settings without dropping the connection."""
+        async with self._lock:
+            self._write_char = format_uuid(write_char)
+            self._write_with_response = write_with_response
+            self._append_newline = append_newline
+            self._resolve_write_target()
+
+    async def open(self) -> None:
+        """Connect and subscribe to notifications."""
+        async with self._lock:
+            await self._open()
+
+    async def wait_closed(self) -> None:
+        """Return once the heater disconnects."""
+        await self._disconnected_event.wait()
+
+    async def close(self) -> None:
+        """Unsubscribe and disconnect."""
+        async with self._lock:
+            await self._close()
+
+    async def write(self, data: bytes) -> None:
+        """Write to the heater, connecting on demand."""
+        async with self._lock:
+            await self._open()
+            assert self._client is not None
+            try:
+                async with asyncio.timeout(DEFAULT_BLE_COMMAND_TIMEOUT):
+                    await self._client.write_gatt_char(
+                        self._write_target, data, response=self._write_with_response
+                    )
+            except (BleakError, BleakRetryError) as err:
+                raise TransportError(f"BLE write failed: {err}") from err
+
+    async def _open(self) -> None:
+        if self.is_connected and self._notifying:
+            return
+        try:
+            if not self.is_connected:
+                await self._connect()
+            assert self._client is not None
+            async with asyncio.timeout(DEFAULT_BLE_CONNECT_TIMEOUT):
+                await self._client.start_notify(
+                    format_uuid(CHAR_NOTIFY_UUID), self._handle_notify
+                )
+        except (BleakError, BleakRetryError) as err:
+            await self._close()
+            raise TransportError(f"BLE connection failed: {err}") from err
+        self._notifying = True
+
+    async def _connect(self) -> None:
+        ble_device = self._device_resolver(self._address)
+        if not ble_device:
+            raise TransportError(f"Device not found: {self._address}")
+        # Looked up at call time so a replacement connector can be patched in
+        connector = self._connector or establish_connection
+        async with asyncio.timeout(DEFAULT_BLE_CONNECT_TIMEOUT):
+            self._client = await connector(BleakClient, ble_device, self._address)
+        self._disconnected_event.clear()
+        self._client.set_disconnected_callback(
+            lambda _: self._disconnected_event.set()
+        )
+        self._resolve_write_target()
+
+    async def _close(self) -> None:
+        client, self._client = self._client, None
+        self._notifying = False
+        self._disconnected_event.set()
+        if client is None:
+            return
+        try:
+            if client.is_connected:
+                await client.stop_notify(format_uuid(CHAR_NOTIFY_UUID))
+            await client.disconnect()
+        except BleakError as err:
+            _LOGGER.debug("BLE disconnect error: %s", err)
+
+    def _handle_notify(self, _: Any, payload: bytearray) -> None:
+        if payload:
+            self._deliver(bytes(payload))
+
+    def _resolve_write_target(self) -> None:
+        """Resolve the write characteristic on the live client, if connected."""
+        self._write_target = self._write_char
+        if not self.is_connected:
+            return
+        assert self._client is not None
+        try:
+            characteristic = self._client.services.get_characteristic(
+                self._write_char
+            )
+        except BleakError as err:
+            _LOGGER.debug("BLE services not resolved yet: %s", err)
+            return
+        if characteristic is None:
+            _LOGGER.warning(
+                "BLE write characteristic %s not found on %s",
+                self._write_char,
+                self._address,
+            )
+            return
+        self._write_target = characteristic
+
+
+def format_uuid(uuid: str) -> str:
+    """Expand a 16-bit UUID to the full Bluetooth base UUID."""
+    normalized = uuid.lower()
+    if len(normalized) == 4:
+        return f"0000{normalized}-0000-1000-8000-00805f9b34fb"
+    return normalized
@@ -0,0 +1,320 @@
+"""Asyncio client for Afterburner heaters, independent of Home Assistant.
+
+``AfterburnerClient`` owns the connection lifecycle of one heater over a
+pluggable ``Transport``: reconnects with backoff, JSON framing, wire tracing,
+state tracking and command acknowledgement by echo.
+
+    transport = WebSocketTransport(build_ws_url("192.168.1.50", 81, "/"))
+    async with AfterburnerClient(transport) as client:
+        state = await client.refresh()
+        await client.send({"CyclicTemp": 21}, ack=True)
+        async for state in client.states():
+            print(state.raw.get("TempCurrent"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
+
+from .commands import encode_command
+from .const import DEFAULT_WS_INIT_MESSAGE
+from .json_stream import JsonObjectStream
+from .models import HeaterState
+from .refresh import DEFAULT_REFRESH_SPACING, DEFAULT_REFRESH_TIMEOUT, RefreshGate
+from .schema import echo_keys
+from .subscription import ConflatingQueue
+from .trace import TRACE_IN, TRACE_OUT, TraceRecorder
+from .transport import Transport, TransportError
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_BACKOFF = 30
+DEFAULT_ACK_TIMEOUT = 5.0
+
+PayloadListener = Callable[[dict[str, Any]], None]
+
+
+class AfterburnerClient:
+    """Connection to one heater on plain asyncio."""
+
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        init_message: dict[str, Any] | None = DEFAULT_WS_INIT_MESSAGE,
+        track_state: bool = True,
+        trace: TraceRecorder | None = None,
+        refresh_spacing: float = DEFAULT_REFRESH_SPACING,
+    ) -> None:
+        self._transport = transport
+        self._transport.set_data_callback(self._handle_data)
+        self.init_message = init_message
+        self._track_state = track_state
+        self.trace = trace if trace is not None else TraceRecorder()
+        self.state = HeaterState()
+        self.message_count = 0
+        self.bytes_received = 0
+        self.reconnects = 0
+        self._invalid_frames = 0
+        self._stream = JsonObjectStream()
+        self._listeners: list[PayloadListener] = []
+        self._state_queues: set[ConflatingQueue[None, HeaterState]] = set()
+        self._echo_waiters: list[tuple[set[str], asyncio.Future[None]]] = []
+        self.refresh_gate = RefreshGate(self._send_refresh, min_spacing=refresh_spacing)
+        self._connected_event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def __aenter__(self) -> AfterburnerClient:
+        await self.start()
+        await self.wait_connected()
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.stop()
+
+    @property
+    def init_message(self) -> dict[str, Any] | None:
+        """Return the message requesting a full state dump."""
+        return self._init_message
+
+    @init_message.setter
+    def init_message(self, init_message: dict[str, Any] | None) -> None:
+        self._init_message = init_message
+        # Encoded once, it is written on every connect and poll
+        self._init_data: bytes | None = (
+            encode_command(init_message) if init_message else None
+        )
+
+    @property
+    def transport(self) -> Transport:
+        """Return the underlying transport."""
+        return self._transport
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the transport is connected."""
+        return self._transport.is_connected
+
+    @property
+    def max_payload_size(self) -> int | None:
+        """Largest payload in bytes that fits one write, or None if unlimited."""
+        return self._transport.max_payload_size
+
+    @property
+    def parser_recoveries(self) -> int:
+        """Return how often malformed or overflowing input was skipped."""
+        return self._stream.recoveries + self._invalid_frames
+
+    def add_listener(self, listener: PayloadListener) -> Callable[[], None]:
+        """Call ``listener`` with every decoded payload; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    async def start(self) -> None:
+        """Start connecting and keep the connection up in the background."""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        """Wait until the transport is connected."""
+        async with asyncio.timeout(timeout):
+            await self._connected_event.wait()
+
+    async def stop(self) -> None:
+        """Stop reconnecting and close the transport."""
+        self._stopping = True
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._connected_event.clear()
+        await self._transport.close()
+        for _keys, future in self._echo_waiters:
+            future.cancel()
+        self.refresh_gate.reset()
+        for queue in self._state_queues:
+            queue.close()
+
+    async def reconnect(self) -> None:
+        """Drop the current link; the connection loop opens a new one."""
+        if self._task is None or self._stopping:
+            return
+        _LOGGER.debug("Reconnect requested")
+        self._connected_event.clear()
+        await self._transport.close()
+
+    async def send(
+        self,
+        payload: dict[str, Any] | bytes,
+        *,
+        ack: bool = False,
+        timeout: float = DEFAULT_ACK_TIMEOUT,
+    ) -> set[str]:
+        """Send a command; with ``ack`` wait for the heater to echo its keys.
+
+        ``payload`` may also be a command pre-encoded by ``encode_command``
+        or one of the ``ENCODED_*`` constants. Returns the keys that were not
+        echoed within ``timeout``.
+        """
+        if isinstance(payload, bytes):
+            if ack:
+                payload = json.loads(payload)
+            else:
+                await self._write(payload)
+                return set()
+        if not ack:
+            await self._write(payload)
+            return set()
+        # Track the echo before writing so a fast reply is not missed
+        keys, future = self._track_echo(payload)
+        try:
+            await self._write(payload)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            self._echo_waiters.remove((keys, future))
+        return keys
+
+    async def request_refresh(self) -> asyncio.Future[None] | None:
+        """Ask the heater for a full state dump without waiting for it.
+
+        Requests while a dump is in flight, or shortly after one was sent,
+        share it. Returns the dump's completion future, or None if no refresh
+        could be requested.
+        """
+        if not self.init_message or not self._transport.is_connected:
+            return None
+        return await self.refresh_gate.request()
+
+    async def refresh(self, timeout: float = DEFAULT_REFRESH_TIMEOUT) -> HeaterState:
+        """Request a full state dump and return the state once it settles."""
+        if not self.init_message:
+            raise ValueError("No init message configured to request a refresh")
+        count = self.message_count
+        async with asyncio.timeout(timeout):
+            future = await self.refresh_gate.request()
+            try:
+                await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                raise TransportError("Refresh dump not received") from None
+        _LOGGER.debug(
+            "Refresh dump messages received: %d", self.message_count - count
+        )
+        return self.state
+
+    async def states(self) -> AsyncIterator[HeaterState]:
+        """Yield the state after every update; slow consumers see the latest."""
+        queue: ConflatingQueue[None, HeaterState] = ConflatingQueue(maxsize=1)
+        self._state_queues.add(queue)
+        try:
+            async for _key, state in queue:
+                yield state
+        finally:
+            self._state_queues.discard(queue)
+
+    async def _run(self) -> None:
+        backoff = 1
+        connected_once = False
+        while not self._stopping:
+            try:
+                # Drop any partial object left over from the previous link
+                self._stream.clear()
+                await self._transport.open()
+                if connected_once:
+                    self.reconnects += 1
+                connected_once = True
+                self._connected_event.set()
+                if self.init_message:
+                    await asyncio.sleep(self._transport.refresh_delay)
+                    await self.request_refresh()
+                backoff = 1
+                await self._transport.wait_closed()
+                _LOGGER.debug("Transport closed, reconnecting")
+                self._connected_event.clear()
+                self.refresh_gate.reset()
+                await self._transport.close()
+            except (TransportError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Transport error: %s", err)
+                self._connected_event.clear()
+                self.refresh_gate.reset()
+                await self._transport.close()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+            except asyncio.CancelledError:
+                break
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected transport error: %s", err)
+                self._connected_event.clear()
+                self.refresh_gate.reset()
+                await self._transport.close()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    async def _send_refresh(self) -> None:
+        if self._init_data:
+            await self._write(self._init_data)
+
+    async def _write(self, payload: dict[str, Any] | bytes) -> None:
+        if not isinstance(payload, bytes):
+            payload = encode_command(payload)
+        data = payload + self._transport.suffix
+        self.trace.record(TRACE_OUT, data)
+        await self._transport.write(data)
+
+    def _handle_data(self, data: bytes) -> None:
+        self.trace.record(TRACE_IN, data)
+        self.bytes_received += len(data)
+        if self._transport.framed:
+            payloads = _decode_frame(data)
+            if not payloads:
+                self._invalid_frames += 1
+        else:
+            payloads = self._stream.feed(data.decode("utf-8", errors="replace"))
+        for payload in payloads:
+            self._handle_payload(payload)
+
+    def _handle_payload(self, payload: dict[str, Any]) -> None:
+        self.message_count += 1
+        self.refresh_gate.feed()
+        if self._echo_waiters:
+            self._resolve_echoes(payload)
+        for listener in list(self._listeners):
+            listener(payload)
+        if not self._track_state:
+            return
+        self.state = self.state.merge_payload(payload)
+        for queue in self._state_queues:
+            queue.put(None, self.state)
+
+    def _track_echo(
+        self, payload: dict[str, Any]
+    ) -> tuple[set[str], asyncio.Future[None]]:
+        keys = echo_keys(payload)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (keys, future)
+        self._echo_waiters.append(waiter)
+        return waiter
+
+    def _resolve_echoes(self, payload: Iterable[str]) -> None:
+        for keys, future in self._echo_waiters:
+            keys.difference_update(payload)
+            if not keys and not future.done():
+                future.set_result(None)
+
+
+def _decode_frame(data: bytes) -> list[dict[str, Any]]:
+    try:
+        payload = json.loads(data)
+    except ValueError as err:
+        _LOGGER.debug("Invalid JSON payload: %s", err)
+        return []
+    return [payload] if isinstance(payload, dict) else []
@@ -1,12 +1,25 @@
 """Command builders for Afterburner Heater protocol.
 
-This module provides type-safe command builders for the heater protocol.
+This module provides type-safe command builders for the heater protocol and
+their wire encoding. Commands are encoded as compact JSON without whitespace;
+constant commands are pre-encoded and single-key commands are cached by
+value, so repeated writes skip ``json.dumps``.
 """
 
 from __future__ import annotations
 
+import json
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Literal
 
+from .schema import COMMAND_SPECS, is_exclusive
+
+# Distinct single-key commands whose encoding is kept
+_ENCODE_CACHE_SIZE = 256
+# Values that can key the encoding cache
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
 
 # Command type aliases for documentation
 RefreshCommand = dict[Literal["Refresh"], Literal[1]]
@@ -32,31 +45,33 @@ def run_command(mode: Literal["heat", "off"]) -> RunCommand:
     return {"Run": mode}
 
 
-def cyclic_temp_command(temp_f: float) -> dict[str, float]:
+def cyclic_temp_command(temp_c: float) -> dict[str, float]:
     """Build a cyclic temperature setpoint command.
 
     Args:
-        temp_f: Temperature in Fahrenheit
+        temp_c: Setpoint in degrees Celsius (-20 to 40)
     """
-    return {"CyclicTemp": temp_f}
+    return {"CyclicTemp": temp_c}
 
 
-def cyclic_on_command(temp_f: float) -> dict[str, float]:
+def cyclic_on_command(temp_c: float) -> dict[str, float]:
     """Build a cyclic restart temperature command.
 
     Args:
-        temp_f: Temperature in Fahrenheit at which heater restarts
+        temp_c: Offset from the setpoint in degrees Celsius at which the
+            heater restarts (-10 to 10)
     """
-    return {"CyclicOn": temp_f}
+    return {"CyclicOn": temp_c}
 
 
-def cyclic_off_command(temp_f: float) -> dict[str, float]:
+def cyclic_off_command(temp_c: float) -> dict[str, float]:
     """Build a cyclic stop temperature command.
 
     Args:
-        temp_f: Temperature in Fahrenheit at which heater stops
+        temp_c: Offset from the setpoint in degrees Celsius at which the
+            heater stops (-10 to 10)
     """
-    return {"CyclicOff": temp_f}
+    return {"CyclicOff": temp_c}
 
 
 def cyclic_enabled_command(enabled: bool) -> dict[str, int]:
@@ -77,31 +92,34 @@ def frost_enable_command(enabled: bool) -> dict[str, int]:
     return {"FrostEnable": 1 if enabled else 0}
 
 
-def frost_on_command(temp_f: float) -> dict[str, float]:
+def frost_on_command(temp_c: float) -> dict[str, float]:
     """Build a frost protection activation temperature command.
 
     Args:
-        temp_f: Temperature in Fahrenheit below which frost protection activates
+        temp_c: Temperature in degrees Celsius below which frost protection
+            activates (-20 to 10)
     """
-    return {"FrostOn": temp_f}
+    return {"FrostOn": temp_c}
 
 
-def frost_rise_command(temp_f: float) -> dict[str, float]:
+def frost_rise_command(temp_c: float) -> dict[str, float]:
     """Build a frost protection rise temperature command.
 
     Args:
-        temp_f: Temperature rise in Fahrenheit for frost protection
+        temp_c: Temperature rise in degrees Celsius for frost protection
+            (0 to 20)
     """
-    return {"FrostRise": temp_f}
+    return {"FrostRise": temp_c}
 
 
-def frost_target_command(temp_f: float) -> dict[str, float]:
+def frost_target_command(temp_c: float) -> dict[str, float]:
     """Build a frost protection target temperature command.
 
     Args:
-        temp_f: Target temperature in Fahrenheit for frost protection
+        temp_c: Target temperature in degrees Celsius for frost protection
+            (-10 to 20)
     """
-    return {"FrostTarget": temp_f}
+    return {"FrostTarget": temp_c}
 
 
 def thermostat_command(enabled: bool) -> dict[str, int]:
@@ -128,7 +146,7 @@ def fixed_demand_command(value: float | None) -> dict[str, float | None]:
     """Build a fixed demand command.
 
     Args:
-        value: Fixed demand value (0.0-1.0), or None to disable
+        value: Fixed demand in percent (0 to 100), or None to disable
     """
     return {"FixedDemand": value}
 
@@ -149,3 +167,81 @@ def gpout2_command(state: bool) -> dict[str, int]:
         state: True for on, False for off
     """
     return {"GPout2": 1 if state else 0}
+
+
+def encode_command(payload: Mapping[str, Any]) -> bytes:
+    """Encode a command payload as the transports send it."""
+    if len(payload) == 1:
+        ((key, value),) = payload.items()
+        if isinstance(value, _CACHEABLE_TYPES):
+            return encoded_command(key, value)
+    return _dumps(payload)
+
+
+@lru_cache(maxsize=_ENCODE_CACHE_SIZE, typed=True)
+def encoded_command(key: str, value: Any) -> bytes:
+    """Return the cached encoding of a single-key command.
+
+    The cache is typed, so ``1``, ``1.0`` and ``True`` keep their encodings.
+    """
+    return _dumps({key: value})
+
+
+def encode_setting(key: str, value: Any) -> bytes:
+    """Validate a registered command key's value and return its encoding.
+
+    Raises KeyError for unregistered keys and ValueError for invalid values.
+    """
+    return encoded_command(key, COMMAND_SPECS[key].coerce(value))
+
+
+def _dumps(payload: Mapping[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def encoded_size(payload: dict[str, Any]) -> int:
+    """Return the encoded size in bytes of a payload as the transports send it."""
+    return len(encode_command(payload))
+
+
+def pack_commands(
+    settings: dict[str, Any], max_size: int | None = None
+) -> list[dict[str, Any]]:
+    """Pack command keys into as few payloads as fit in one write each.
+
+    Args:
+        settings: Command keys and values to send
+        max_size: Maximum encoded payload size in bytes, or None for no limit
+
+    A key that does not fit in ``max_size`` on its own, or that the registry
+    marks exclusive (``Run``), is sent alone.
+    """
+    chunks: list[dict[str, Any]] = []
+    shared: dict[str, Any] = {}
+    for key, value in settings.items():
+        if is_exclusive(key):
+            chunks.append({key: value})
+        else:
+            shared[key] = value
+    if max_size is None:
+        return chunks + [shared] if shared else chunks
+    current: dict[str, Any] = {}
+    for key, value in shared.items():
+        candidate = {**current, key: value}
+        if current and encoded_size(candidate) > max_size:
+            chunks.append(current)
+            candidate = {key: value}
+        current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# Pre-encoded constant commands
+ENCODED_REFRESH = encode_command(refresh_command())
+ENCODED_RUN_HEAT = encode_command(run_command("heat"))
+ENCODED_RUN_OFF = encode_command(run_command("off"))
+ENCODED_GPOUT1_ON = encode_command(gpout1_command(True))
+ENCODED_GPOUT1_OFF = encode_command(gpout1_command(False))
+ENCODED_GPOUT2_ON = encode_command(gpout2_command(True))
+ENCODED_GPOUT2_OFF = encode_command(gpout2_command(False))
@@ -25,3 +25,7 @@ DEFAULT_BLE_INIT_MESSAGE: dict[str, int] = {"Refresh": 1}
 DEFAULT_BLE_APPEND_NEWLINE = False
 DEFAULT_BLE_CONNECT_TIMEOUT = 10
 DEFAULT_BLE_COMMAND_TIMEOUT = 5
+
+# Wire trace defaults
+DEFAULT_TRACE_BUFFER_BYTES = 256 * 1024
+DEFAULT_TRACE_EXPORT_WINDOW = 300
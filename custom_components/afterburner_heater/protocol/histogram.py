@@ -0,0 +1,78 @@
+"""Fixed-bucket streaming histogram for latency percentiles.
+
+Buckets grow geometrically, so recording a sample is a constant-time index
+computation and memory is bounded regardless of how many samples are seen.
+Percentiles are accurate to one bucket width (``growth`` - 1, about 10%).
+"""
+
+from __future__ import annotations
+
+import math
+
+DEFAULT_HISTOGRAM_MIN = 1.0
+DEFAULT_HISTOGRAM_MAX = 60_000.0
+DEFAULT_HISTOGRAM_GROWTH = 1.1
+
+
+class StreamingHistogram:
+    """Histogram with geometric buckets between ``minimum`` and ``maximum``.
+
+    Samples below ``minimum`` land in the first bucket and samples above
+    ``maximum`` in the last one.
+    """
+
+    def __init__(
+        self,
+        minimum: float = DEFAULT_HISTOGRAM_MIN,
+        maximum: float = DEFAULT_HISTOGRAM_MAX,
+        growth: float = DEFAULT_HISTOGRAM_GROWTH,
+    ) -> None:
+        self._minimum = minimum
+        self._growth = growth
+        self._log_growth = math.log(growth)
+        self._buckets = [0] * (self._index(maximum) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self._minimum:
+            return 0
+        return int(math.log(value / self._minimum) / self._log_growth) + 1
+
+    def record(self, value: float) -> None:
+        """Add one sample."""
+        index = min(self._index(value), len(self._buckets) - 1)
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket holding the ``fraction`` rank."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        # The last bucket is open-ended, so it reports the largest sample
+        for index, bucket in enumerate(self._buckets[:-1]):
+            seen += bucket
+            if seen >= rank:
+                upper = self._minimum * self._growth**index
+                return min(upper, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of all samples."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._buckets = [0] * len(self._buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
@@ -24,6 +24,8 @@ class JsonObjectStream:
 
     def __init__(self) -> None:
         self._buffer = ""
+        # Malformed objects skipped and buffer overflows recovered from
+        self.recoveries = 0
 
     def feed(self, text: str) -> list[dict[str, Any]]:
         """Feed a chunk of text and return decoded JSON objects."""
@@ -96,6 +98,7 @@ class JsonObjectStream:
                             _LOGGER.debug(
                                 "Malformed JSON, skipping: %s...", candidate[:100]
                             )
+                            self.recoveries += 1
                             self._buffer = self._buffer[1:]
                             return None, self._buffer
 
@@ -104,6 +107,7 @@ class JsonObjectStream:
 
     def _attempt_recovery(self) -> None:
         """Attempt to recover from buffer overflow/corruption."""
+        self.recoveries += 1
         _LOGGER.debug(
             "Buffer overflow (%d chars), attempting recovery", len(self._buffer)
         )
@@ -6,6 +6,7 @@ Shared protocol models for state representation and payload normalization.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -22,18 +23,31 @@ class HeaterState:
     power: bool | None = None
     raw: dict[str, Any] = field(default_factory=dict)
     normalized: dict[str, Any] = field(default_factory=dict)
-
-    def merge_payload(self, payload: dict[str, Any]) -> "HeaterState":
+    # Monotonic time each raw key was last received
+    updated: dict[str, float] = field(default_factory=dict)
+
+    def merge_payload(
+        self,
+        payload: dict[str, Any],
+        now: float | None = None,
+        normalized: dict[str, Any] | None = None,
+    ) -> "HeaterState":
         """Merge a new payload into the state, returning a new HeaterState.
 
         This method is immutable - it returns a new HeaterState instance
         rather than modifying the existing one, preventing race conditions
-        when concurrent async tasks access the state.
+        when concurrent async tasks access the state. Keys in ``payload`` are
+        stamped with ``now`` (default: the current monotonic time). Pass
+        ``normalized`` if ``normalize_payload`` already ran on the payload.
         """
-        normalized = normalize_payload(payload)
+        if now is None:
+            now = time.monotonic()
+        if normalized is None:
+            normalized = normalize_payload(payload)
         parsed = parse_message(normalized)
         new_raw = {**self.raw, **payload}
         new_normalized = {**self.normalized, **normalized}
+        new_updated = {**self.updated, **dict.fromkeys(payload, now)}
 
         # Debug: log power and GPIO keys
         debug_keys = ("Run", "RunState", "Power", "GPout1", "GPout2")
@@ -52,8 +66,16 @@ class HeaterState:
             power=parsed.power if parsed.power is not None else self.power,
             raw=new_raw,
             normalized=new_normalized,
+            updated=new_updated,
         )
 
+    def age(self, key: str, now: float | None = None) -> float | None:
+        """Return seconds since ``key`` was last received, or None if never."""
+        updated = self.updated.get(key)
+        if updated is None:
+            return None
+        return (time.monotonic() if now is None else now) - updated
+
     def value(self, key: str) -> Any:
         """Return a normalized value if available, otherwise raw."""
         if key in self.normalized:
@@ -0,0 +1,103 @@
+"""Token bucket limiting how fast commands are written to one heater.
+
+The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+second; every write takes one. Lanes reserve part of the bucket for more
+important traffic: refresh requests are only sent while at least half the
+bucket is left, setting writes leave a fifth for control commands, and
+control commands (``Run``) may spend the last token. A runaway automation
+therefore exhausts its own lane first and can still be stopped.
+
+A burst of 0 disables the limit; it is off unless a burst is configured.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+from .transport import TransportError
+
+DEFAULT_COMMAND_BURST = 0
+# Tokens per second
+DEFAULT_COMMAND_RATE = 0.5
+
+LANE_CONTROL = "control"
+LANE_SETTING = "setting"
+LANE_REFRESH = "refresh"
+
+# Fraction of the burst a lane must leave in the bucket
+_LANE_RESERVE = {LANE_CONTROL: 0.0, LANE_SETTING: 0.2, LANE_REFRESH: 0.5}
+# Commands that start or stop the heater
+_CONTROL_KEYS = frozenset({"Run"})
+
+
+class CommandRateLimitedError(TransportError):
+    """Raised when a command is not written because its lane is exhausted."""
+
+
+def command_lane(payload: Mapping[str, Any]) -> str:
+    """Return the lane a command payload is written in."""
+    if not _CONTROL_KEYS.isdisjoint(payload):
+        return LANE_CONTROL
+    if payload and set(payload) == {"Refresh"}:
+        return LANE_REFRESH
+    return LANE_SETTING
+
+
+class CommandRateLimiter:
+    """Token bucket with per-lane reserves; counts what it turns away."""
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_COMMAND_BURST,
+        rate: float = DEFAULT_COMMAND_RATE,
+        now: float = 0.0,
+    ) -> None:
+        self.burst = burst
+        self.rate = rate
+        self.tokens = float(burst)
+        self.dropped: Counter[str] = Counter()
+        self._updated = now
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether writes are limited at all."""
+        return self.burst > 0
+
+    def configure(self, burst: int, rate: float, now: float) -> None:
+        """Change the burst size and refill rate, keeping the current fill."""
+        self._refill(now)
+        if not self.enabled:
+            # The bucket starts full when a limit is first set
+            self.tokens = float(burst)
+        self.burst = burst
+        self.rate = rate
+        self.tokens = min(self.tokens, float(burst))
+
+    def acquire(self, lane: str, now: float) -> bool:
+        """Take a token for one write in ``lane``; return whether it may be sent."""
+        if not self.enabled:
+            return True
+        self._refill(now)
+        if self.tokens - 1 < self.burst * _LANE_RESERVE[lane]:
+            self.dropped[lane] += 1
+            return False
+        self.tokens -= 1
+        return True
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the configuration and drop counts for diagnostics."""
+        return {
+            "burst": self.burst,
+            "rate_per_minute": round(self.rate * 60, 1),
+            "tokens": round(self.tokens, 2),
+            "dropped": {
+                lane: self.dropped[lane] for lane in _LANE_RESERVE
+            },
+        }
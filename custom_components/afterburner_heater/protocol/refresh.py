@@ -0,0 +1,123 @@
+"""Single-flight gate for full state refresh requests.
+
+A refresh makes the heater stream its whole state as several objects. The
+connect sequence, the coordinator's poll and service calls can all ask for
+one at nearly the same time; the gate lets requests arriving while a dump is
+in flight, or within ``min_spacing`` of the last one, share that dump and its
+completion future instead of triggering another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+DEFAULT_REFRESH_SPACING = 2.0
+DEFAULT_REFRESH_TIMEOUT = 10.0
+# Quiet period after which a refresh dump is considered complete
+DEFAULT_REFRESH_SETTLE = 0.5
+
+
+class RefreshGate:
+    """Coalesce refresh requests into one in-flight dump."""
+
+    def __init__(
+        self,
+        send: Callable[[], Awaitable[None]],
+        min_spacing: float = DEFAULT_REFRESH_SPACING,
+        settle: float = DEFAULT_REFRESH_SETTLE,
+        timeout: float = DEFAULT_REFRESH_TIMEOUT,
+    ) -> None:
+        self._send = send
+        self.min_spacing = min_spacing
+        self.settle = settle
+        self.timeout = timeout
+        self.sent = 0
+        self.shared = 0
+        self._future: asyncio.Future[None] | None = None
+        self._sent_at: float | None = None
+        self._last_payload = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> bool:
+        """Return whether a dump is being received."""
+        return self._future is not None and not self._future.done()
+
+    @property
+    def would_share(self) -> bool:
+        """Return whether a request now would share a dump instead of sending."""
+        if self._future is None:
+            return False
+        if not self._future.done():
+            return True
+        return (
+            self._sent_at is not None
+            and asyncio.get_running_loop().time() - self._sent_at < self.min_spacing
+        )
+
+    async def request(self) -> asyncio.Future[None]:
+        """Send a refresh unless one can be shared; return its completion future.
+
+        The future resolves once the dump settles and is cancelled if it
+        times out or the link drops.
+        """
+        if self._future is not None and self.would_share:
+            self.shared += 1
+            return self._future
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._future = future
+        self._sent_at = loop.time()
+        self._last_payload = 0.0
+        self._arm(self.timeout)
+        try:
+            await self._send()
+        except BaseException:
+            self.reset()
+            raise
+        self.sent += 1
+        return future
+
+    def feed(self) -> None:
+        """Note a payload; the dump completes once payloads stop arriving."""
+        if not self.in_flight:
+            return
+        first = not self._last_payload
+        self._last_payload = asyncio.get_running_loop().time()
+        if first:
+            self._arm(self.settle)
+
+    def reset(self) -> None:
+        """Abandon the in-flight dump, e.g. because the link dropped."""
+        self._cancel_timer()
+        if self._future is not None and not self._future.done():
+            self._future.cancel()
+        self._future = None
+        self._sent_at = None
+
+    def _arm(self, delay: float) -> None:
+        self._cancel_timer()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._expire)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _expire(self) -> None:
+        self._timer = None
+        future = self._future
+        if future is None or future.done():
+            return
+        if not self._last_payload:
+            # Nothing arrived before the timeout
+            future.cancel()
+            return
+        loop = asyncio.get_running_loop()
+        quiet = loop.time() - self._last_payload
+        if quiet < self.settle:
+            # Re-arm instead of rescheduling on every payload
+            self._timer = loop.call_later(self.settle - quiet, self._expire)
+        else:
+            future.set_result(None)
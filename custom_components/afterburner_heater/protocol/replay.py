@@ -0,0 +1,215 @@
+"""Offline replay of recorded wire traces through the protocol pipeline.
+
+Feeds the inbound records of a capture through ``JsonObjectStream``,
+``normalize_payload`` and ``HeaterState.merge_payload`` and reports throughput,
+per-stage time and allocations. Captures are either a binary dump from
+``TraceRecorder.dump()`` or the JSON returned by diagnostics or the
+``export_trace`` service.
+
+This module does not import Home Assistant. Run it from the integration
+directory so ``protocol`` is importable as a top-level package:
+
+    cd custom_components/afterburner_heater
+    python -m protocol.replay capture.json --repeat 100 --tracemalloc
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .json_stream import JsonObjectStream
+from .models import HeaterState, normalize_payload
+from .trace import TRACE_IN, TRACE_OUT, iter_records
+
+STAGES = ("decode", "stream", "normalize", "merge")
+
+CaptureRecord = tuple[int, int, bytes]
+
+
+@dataclass
+class ReplayStats:
+    """Counters and per-stage timings of one replay run."""
+
+    fragments: int = 0
+    bytes: int = 0
+    messages: int = 0
+    elapsed: float = 0.0
+    stage_ns: dict[str, int] = field(default_factory=lambda: dict.fromkeys(STAGES, 0))
+
+    @property
+    def messages_per_second(self) -> float:
+        """Return decoded messages per second of wall time."""
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        """Return a human-readable summary."""
+        lines = [
+            (
+                f"fragments: {self.fragments}  bytes: {self.bytes}  "
+                f"messages: {self.messages}"
+            ),
+            (
+                f"elapsed: {self.elapsed * 1000:.1f} ms  "
+                f"throughput: {self.messages_per_second:,.0f} msg/s"
+            ),
+        ]
+        total_ns = sum(self.stage_ns.values()) or 1
+        for stage in STAGES:
+            stage_ns = self.stage_ns[stage]
+            per_message = stage_ns / self.messages / 1000 if self.messages else 0.0
+            lines.append(
+                f"  {stage:<10} {stage_ns / 1e6:>9.2f} ms "
+                f"{stage_ns / total_ns:>6.1%}  {per_message:>7.2f} us/msg"
+            )
+        return "\n".join(lines)
+
+
+def load_capture(path: Path) -> list[CaptureRecord]:
+    """Load a binary or JSON capture as ``(monotonic_ns, direction, data)``."""
+    blob = path.read_bytes()
+    if blob[:1] not in (b"[", b"{"):
+        return list(iter_records(blob))
+    return [
+        (
+            int(record["t"] * 1e9),
+            TRACE_OUT if record["dir"] == "out" else TRACE_IN,
+            record["data"].encode("utf-8"),
+        )
+        for record in _find_records(json.loads(blob))
+    ]
+
+
+def _find_records(document: Any) -> list[dict[str, Any]]:
+    """Return trace records from a diagnostics or service response document."""
+    if isinstance(document, list):
+        return document
+    if isinstance(document, dict):
+        if isinstance(document.get("records"), list):
+            return document["records"]
+        for value in document.values():
+            if records := _find_records(value):
+                return records
+    return []
+
+
+def replay(
+    records: Iterable[CaptureRecord],
+    *,
+    realtime: bool = False,
+    speed: float = 1.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayStats:
+    """Replay inbound records and return throughput statistics.
+
+    With ``realtime`` the original spacing between records is kept, divided
+    by ``speed``; otherwise records are fed back to back.
+    """
+    stats = ReplayStats()
+    stage_ns = stats.stage_ns
+    clock = time.perf_counter_ns
+    stream = JsonObjectStream()
+    state = HeaterState()
+    first_timestamp: int | None = None
+    started = time.perf_counter()
+
+    for timestamp, direction, data in records:
+        if direction != TRACE_IN:
+            continue
+        if realtime:
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            due = (timestamp - first_timestamp) / 1e9 / speed
+            delay = due - (time.perf_counter() - started)
+            if delay > 0:
+                sleep(delay)
+        stats.fragments += 1
+        stats.bytes += len(data)
+
+        mark = clock()
+        text = data.decode("utf-8", errors="replace")
+        now = clock()
+        stage_ns["decode"] += now - mark
+        mark = now
+        payloads = stream.feed(text)
+        now = clock()
+        stage_ns["stream"] += now - mark
+        for payload in payloads:
+            mark = now
+            normalized = normalize_payload(payload)
+            now = clock()
+            stage_ns["normalize"] += now - mark
+            mark = now
+            state = state.merge_payload(payload, normalized=normalized)
+            now = clock()
+            stage_ns["merge"] += now - mark
+        stats.messages += len(payloads)
+
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def trace_allocations(
+    records: list[CaptureRecord], top: int = 10
+) -> tuple[int, list[tracemalloc.Statistic]]:
+    """Replay once under tracemalloc; return peak bytes and top allocation sites."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        replay(records)
+        after = tracemalloc.take_snapshot()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    statistics = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    return peak, statistics[:top]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path, help="binary or JSON trace capture")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="replay the capture this many times"
+    )
+    parser.add_argument(
+        "--realtime", action="store_true", help="keep the recorded spacing"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="speed-up factor for --realtime"
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="report allocations from an extra traced pass",
+    )
+    args = parser.parse_args(argv)
+
+    records = load_capture(args.capture)
+    if not any(direction == TRACE_IN for _, direction, _ in records):
+        parser.error(f"{args.capture} contains no inbound records")
+    if args.repeat > 1 and not args.realtime:
+        records = records * args.repeat
+
+    stats = replay(records, realtime=args.realtime, speed=args.speed)
+    print(stats.report())
+
+    if args.tracemalloc:
+        peak, statistics = trace_allocations(records)
+        print(f"peak traced memory: {peak / 1024:.1f} KiB")
+        for statistic in statistics:
+            print(f"  {statistic}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+"""Declarative registry of the heater's command keys.
+
+Every writable key is described once by a ``CommandSpec``: its value kind,
+range, options, the key the heater echoes it under and whether it must be
+written on its own. Services, entities, echo tracking, write packing and
+``encode_setting`` are all derived from ``COMMAND_SPECS``. Keys missing from
+the registry (raw ``send_json`` commands) pass through unvalidated.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+KIND_FLOAT = "float"
+KIND_FLAG = "flag"
+KIND_CHOICE = "choice"
+
+# Entity platforms a command key can be exposed as
+PLATFORM_NUMBER = "number"
+PLATFORM_SWITCH = "switch"
+PLATFORM_SELECT = "select"
+
+_FLAG_WORDS = {"on": 1, "off": 0, "true": 1, "false": 0}
+
+
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """Type, limits and wire behaviour of one command key."""
+
+    key: str
+    kind: str
+    minimum: float | None = None
+    maximum: float | None = None
+    step: float | None = None
+    options: tuple[str, ...] = ()
+    # Value is a temperature in degrees Celsius
+    temperature: bool = False
+    # None is a valid value (e.g. to clear a fixed demand)
+    nullable: bool = False
+    # Key the heater reports the applied value under, if not the same
+    echo_key: str | None = None
+    # Must be written alone instead of packed with other keys
+    exclusive: bool = False
+    platform: str | None = None
+
+    @property
+    def echo(self) -> str:
+        """Return the key whose arrival acknowledges this command."""
+        return self.echo_key or self.key
+
+    def coerce(self, value: Any) -> Any:
+        """Return ``value`` converted to the wire type; raise ValueError if invalid."""
+        if value is None:
+            if self.nullable:
+                return None
+            raise ValueError(f"{self.key} requires a value")
+        if self.kind == KIND_FLAG:
+            return self._coerce_flag(value)
+        if self.kind == KIND_CHOICE:
+            if value not in self.options:
+                raise ValueError(
+                    f"{self.key} must be one of {', '.join(self.options)}"
+                )
+            return value
+        return self._coerce_float(value)
+
+    def _coerce_flag(self, value: Any) -> int:
+        if isinstance(value, str) and value.strip().lower() in _FLAG_WORDS:
+            return _FLAG_WORDS[value.strip().lower()]
+        try:
+            flag = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{self.key} must be 0 or 1") from None
+        if flag not in (0, 1):
+            raise ValueError(f"{self.key} must be 0 or 1")
+        return flag
+
+    def _coerce_float(self, value: Any) -> float:
+        if isinstance(value, bool):
+            raise ValueError(f"{self.key} must be a number")
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{self.key} must be a number") from None
+        if math.isnan(number):
+            raise ValueError(f"{self.key} must be a number")
+        if self.minimum is not None and number < self.minimum:
+            raise ValueError(f"{self.key} must be at least {self.minimum:g}")
+        if self.maximum is not None and number > self.maximum:
+            raise ValueError(f"{self.key} must be at most {self.maximum:g}")
+        return number
+
+
+def _temperature(
+    key: str, minimum: float, maximum: float, step: float = 0.5
+) -> CommandSpec:
+    return CommandSpec(
+        key,
+        KIND_FLOAT,
+        minimum=minimum,
+        maximum=maximum,
+        step=step,
+        temperature=True,
+        platform=PLATFORM_NUMBER,
+    )
+
+
+def _flag(key: str) -> CommandSpec:
+    return CommandSpec(key, KIND_FLAG, minimum=0, maximum=1, platform=PLATFORM_SWITCH)
+
+
+THERMOSTAT_MODES = ("Standard", "Deadband", "Linear Hz", "Stop/Start")
+FROST_MODES = ("Off", "Start/Stop", "System Thermostat", "Frost Thermostat")
+
+COMMAND_SPECS: dict[str, CommandSpec] = {
+    spec.key: spec
+    for spec in (
+        # Acknowledged through RunState and never packed with settings
+        CommandSpec(
+            "Run",
+            KIND_CHOICE,
+            options=("heat", "off"),
+            echo_key="RunState",
+            exclusive=True,
+        ),
+        _temperature("CyclicTemp", -20, 40),
+        _temperature("CyclicOn", -10, 10),
+        _temperature("CyclicOff", -10, 10),
+        _flag("CyclicEnb"),
+        _flag("FrostEnable"),
+        _temperature("FrostOn", -20, 10),
+        _temperature("FrostRise", 0, 20),
+        _temperature("FrostTarget", -10, 20),
+        _flag("Thermostat"),
+        CommandSpec(
+            "ThermostatMode",
+            KIND_CHOICE,
+            options=THERMOSTAT_MODES,
+            platform=PLATFORM_SELECT,
+        ),
+        CommandSpec(
+            "FrostMode",
+            KIND_CHOICE,
+            options=FROST_MODES,
+            platform=PLATFORM_SELECT,
+        ),
+        CommandSpec(
+            "FixedDemand",
+            KIND_FLOAT,
+            minimum=0,
+            maximum=100,
+            step=1,
+            nullable=True,
+            platform=PLATFORM_NUMBER,
+        ),
+        _flag("GPout1"),
+        _flag("GPout2"),
+    )
+}
+
+
+def specs_for_platform(platform: str) -> tuple[CommandSpec, ...]:
+    """Return the command keys exposed as entities of ``platform``."""
+    return tuple(spec for spec in COMMAND_SPECS.values() if spec.platform == platform)
+
+
+def coerce_settings(settings: Mapping[str, Any]) -> dict[str, Any]:
+    """Return registered keys coerced to their wire types; raise ValueError.
+
+    Keys without a spec are returned unchanged.
+    """
+    coerced: dict[str, Any] = {}
+    for key, value in settings.items():
+        spec = COMMAND_SPECS.get(key)
+        coerced[key] = value if spec is None else spec.coerce(value)
+    return coerced
+
+
+def echo_key(key: str) -> str:
+    """Return the key the heater echoes a command key under."""
+    spec = COMMAND_SPECS.get(key)
+    return key if spec is None else spec.echo
+
+
+def echo_keys(keys: Iterable[str]) -> set[str]:
+    """Return the keys whose arrival acknowledges a command."""
+    return {echo_key(key) for key in keys}
+
+
+def is_exclusive(key: str) -> bool:
+    """Return whether a command key must be written on its own."""
+    spec = COMMAND_SPECS.get(key)
+    return spec is not None and spec.exclusive
@@ -0,0 +1,156 @@
+"""Incremental rolling statistics over a time window.
+
+Each sample is folded in with amortized constant work: a time-weighted EWMA,
+and the window minimum and maximum kept in monotonic deques (every sample is
+appended and evicted at most once). The run duty cycle keeps closed on-periods
+in a deque with a running total. Nothing is recomputed from history, so
+reading the figures at a fixed cadence costs the same however many messages
+arrived in between.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Container, Iterable, Mapping
+from typing import Any
+
+DEFAULT_STATISTICS_WINDOW = 3600.0
+DEFAULT_EWMA_HALF_LIFE = 300.0
+DEFAULT_STATISTICS_KEYS = ("TempCurrent", "TempBody", "InputVoltage", "PumpActual")
+# Key whose truthiness counts as "running" for the duty cycle
+DUTY_CYCLE_KEY = "RunState"
+
+
+class RollingStats:
+    """EWMA and rolling minimum/maximum of one numeric value."""
+
+    def __init__(
+        self,
+        window: float = DEFAULT_STATISTICS_WINDOW,
+        half_life: float = DEFAULT_EWMA_HALF_LIFE,
+    ) -> None:
+        self.window = window
+        self.half_life = half_life
+        self.ewma: float | None = None
+        self._updated = 0.0
+        # (time, value) with increasing values for the minimum, decreasing
+        # values for the maximum; the newest sample is always last
+        self._min: deque[tuple[float, float]] = deque()
+        self._max: deque[tuple[float, float]] = deque()
+
+    def record(self, value: float, now: float) -> None:
+        """Add one sample received at ``now``."""
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            elapsed = max(0.0, now - self._updated)
+            alpha = 1.0 - 0.5 ** (elapsed / self.half_life)
+            self.ewma += alpha * (value - self.ewma)
+        self._updated = now
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((now, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((now, value))
+
+    def minimum(self, now: float) -> float | None:
+        """Return the smallest sample in the window (or the latest one)."""
+        return _front(self._min, now - self.window)
+
+    def maximum(self, now: float) -> float | None:
+        """Return the largest sample in the window (or the latest one)."""
+        return _front(self._max, now - self.window)
+
+
+def _front(samples: deque[tuple[float, float]], cutoff: float) -> float | None:
+    # The latest sample still holds, so it is never evicted
+    while len(samples) > 1 and samples[0][0] < cutoff:
+        samples.popleft()
+    return samples[0][1] if samples else None
+
+
+class DutyCycle:
+    """Percentage of the window a flag was on."""
+
+    def __init__(self, window: float = DEFAULT_STATISTICS_WINDOW) -> None:
+        self.window = window
+        self._started: float | None = None
+        self._on_since: float | None = None
+        # Closed on-periods and their total length
+        self._periods: deque[tuple[float, float]] = deque()
+        self._closed = 0.0
+
+    def record(self, on: bool, now: float) -> None:
+        """Note the flag's state at ``now``."""
+        if self._started is None:
+            self._started = now
+        if on and self._on_since is None:
+            self._on_since = now
+        elif not on and self._on_since is not None:
+            self._periods.append((self._on_since, now))
+            self._closed += now - self._on_since
+            self._on_since = None
+
+    def value(self, now: float) -> float | None:
+        """Return the on percentage over the window, or None before any sample."""
+        if self._started is None:
+            return None
+        cutoff = now - self.window
+        while self._periods and self._periods[0][1] <= cutoff:
+            start, end = self._periods.popleft()
+            self._closed -= end - start
+        on_time = self._closed
+        if self._periods and self._periods[0][0] < cutoff:
+            on_time -= cutoff - self._periods[0][0]
+        if self._on_since is not None:
+            on_time += now - max(self._on_since, cutoff)
+        span = now - max(self._started, cutoff)
+        if span <= 0:
+            return None
+        return min(100.0, max(0.0, on_time / span * 100))
+
+
+class HeaterStatistics:
+    """Rolling statistics for selected keys and the run duty cycle."""
+
+    def __init__(
+        self,
+        keys: Iterable[str] = DEFAULT_STATISTICS_KEYS,
+        window: float = DEFAULT_STATISTICS_WINDOW,
+        half_life: float = DEFAULT_EWMA_HALF_LIFE,
+    ) -> None:
+        self._stats = {key: RollingStats(window, half_life) for key in keys}
+        self.duty_cycle = DutyCycle(window)
+
+    def observe(
+        self, keys: Container[str], values: Mapping[str, Any], now: float
+    ) -> None:
+        """Record the normalized ``values`` of the keys a payload carried."""
+        for key, stats in self._stats.items():
+            if key not in keys:
+                continue
+            value = values.get(key)
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and math.isfinite(value)
+            ):
+                stats.record(float(value), now)
+        if DUTY_CYCLE_KEY in keys:
+            self.duty_cycle.record(bool(values.get(DUTY_CYCLE_KEY)), now)
+
+    def snapshot(self, now: float) -> dict[str, float | None]:
+        """Return ``<key>_mean``/``_min``/``_max`` and ``run_duty_cycle``."""
+        figures: dict[str, float | None] = {}
+        for key, stats in self._stats.items():
+            figures[f"{key}_mean"] = _round(stats.ewma)
+            figures[f"{key}_min"] = stats.minimum(now)
+            figures[f"{key}_max"] = stats.maximum(now)
+        figures["run_duty_cycle"] = _round(self.duty_cycle.value(now))
+        return figures
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 2)
@@ -0,0 +1,127 @@
+"""Bounded, conflating queues for streaming heater updates to subscribers.
+
+Producers call ``put`` from the transport's receive callback, which must never
+block. When a subscriber falls behind, new values overwrite pending ones
+(latest value wins) instead of growing the queue or stalling the producer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_PAYLOAD_QUEUE_SIZE = 16
+DEFAULT_CHANGE_QUEUE_SIZE = 128
+
+
+class _SingleConsumerQueue(ABC):
+    """Wake-up and close handling shared by the conflating queues."""
+
+    def __init__(self) -> None:
+        self.conflated = 0
+        self._closed = False
+        self._waiter: asyncio.Future[None] | None = None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of pending items."""
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the producer has closed the queue."""
+        return self._closed
+
+    def close(self) -> None:
+        """End iteration once the pending items are consumed."""
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _wait(self) -> None:
+        while not len(self) and not self._closed:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+
+class ConflatingQueue(_SingleConsumerQueue, Generic[K, V]):
+    """Keyed queue where a new value replaces a pending value for the same key.
+
+    Keys keep their original position, so a key updated continuously is not
+    starved by others. When ``maxsize`` distinct keys are pending, the oldest
+    is evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CHANGE_QUEUE_SIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.evicted = 0
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, key: K, value: V) -> None:
+        """Queue ``value`` for ``key`` without blocking."""
+        if self._closed:
+            return
+        if key in self._items:
+            self.conflated += 1
+        elif len(self._items) >= self.maxsize:
+            self._items.popitem(last=False)
+            self.evicted += 1
+        self._items[key] = value
+        self._wake()
+
+    def __aiter__(self) -> ConflatingQueue[K, V]:
+        return self
+
+    async def __anext__(self) -> tuple[K, V]:
+        await self._wait()
+        if not self._items:
+            raise StopAsyncIteration
+        return self._items.popitem(last=False)
+
+
+class PayloadQueue(_SingleConsumerQueue):
+    """Queue of decoded payloads that merges into the newest one when full."""
+
+    def __init__(self, maxsize: int = DEFAULT_PAYLOAD_QUEUE_SIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._items: deque[dict[str, Any]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, payload: dict[str, Any]) -> None:
+        """Queue ``payload`` without blocking."""
+        if self._closed:
+            return
+        if len(self._items) >= self.maxsize:
+            # Merge into a copy; the payload object may be shared with others
+            self._items[-1] = {**self._items[-1], **payload}
+            self.conflated += 1
+        else:
+            self._items.append(payload)
+        self._wake()
+
+    def __aiter__(self) -> PayloadQueue:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        await self._wait()
+        if not self._items:
+            raise StopAsyncIteration
+        return self._items.popleft()
@@ -0,0 +1,97 @@
+"""Wire-level trace recorder for Afterburner transports.
+
+Each record is a single ``bytes`` object: a packed header (monotonic
+nanoseconds, direction, length) followed by the raw bytes as they crossed the
+wire. Records are kept in a deque capped by a byte budget, so recording costs
+one ``struct.pack`` and one concatenation per fragment and can stay enabled.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from .const import DEFAULT_TRACE_BUFFER_BYTES
+
+# Header: monotonic ns (int64), direction (uint8), payload length (uint16)
+_HEADER = struct.Struct("<qBH")
+_MAX_RECORD_PAYLOAD = 0xFFFF
+
+TRACE_IN = 0
+TRACE_OUT = 1
+_DIRECTION_NAMES = {TRACE_IN: "in", TRACE_OUT: "out"}
+
+
+class TraceRecorder:
+    """Ring buffer of timestamped inbound fragments and outbound writes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_TRACE_BUFFER_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._records: deque[bytes] = deque()
+        self._size = 0
+        self.dropped = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes currently held."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, direction: int, data: bytes | bytearray) -> None:
+        """Append one fragment, evicting the oldest records over budget."""
+        if len(data) > _MAX_RECORD_PAYLOAD:
+            data = data[:_MAX_RECORD_PAYLOAD]
+        entry = _HEADER.pack(time.monotonic_ns(), direction, len(data)) + data
+        self._records.append(entry)
+        self._size += len(entry)
+        while self._size > self._max_bytes and self._records:
+            self._size -= len(self._records.popleft())
+            self.dropped += 1
+
+    def clear(self) -> None:
+        """Drop all records and reset the dropped count."""
+        self._records.clear()
+        self._size = 0
+        self.dropped = 0
+
+    def dump(self) -> bytes:
+        """Return all records in the compact binary layout."""
+        return b"".join(self._records)
+
+    def export(self, window: float | None = None) -> list[dict[str, Any]]:
+        """Decode the records of the last ``window`` seconds for diagnostics.
+
+        Times are seconds relative to now (negative); payloads are decoded as
+        UTF-8 text since both transports carry JSON.
+        """
+        now = time.monotonic_ns()
+        since = now - int(window * 1e9) if window is not None else None
+        return [
+            {
+                "t": round((timestamp - now) / 1e9, 3),
+                "dir": _DIRECTION_NAMES.get(direction, str(direction)),
+                "data": data.decode("utf-8", errors="replace"),
+            }
+            for timestamp, direction, data in map(_unpack, self._records)
+            if since is None or timestamp >= since
+        ]
+
+
+def _unpack(entry: bytes) -> tuple[int, int, bytes]:
+    timestamp, direction, _length = _HEADER.unpack_from(entry)
+    return timestamp, direction, entry[_HEADER.size :]
+
+
+def iter_records(blob: bytes) -> Iterator[tuple[int, int, bytes]]:
+    """Yield ``(monotonic_ns, direction, data)`` from a binary trace dump."""
+    offset = 0
+    while offset + _HEADER.size <= len(blob):
+        timestamp, direction, length = _HEADER.unpack_from(blob, offset)
+        offset += _HEADER.size
+        yield timestamp, direction, blob[offset : offset + length]
+        offset += length
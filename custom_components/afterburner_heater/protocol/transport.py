@@ -0,0 +1,64 @@
+"""Transport interface used by the standalone Afterburner client.
+
+A transport moves raw bytes; framing, JSON decoding, reconnects and state
+tracking live in ``AfterburnerClient``.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+DataCallback = Callable[[bytes], None]
+
+
+class TransportError(Exception):
+    """Raised when a transport cannot connect, write or stay connected."""
+
+
+class Transport(ABC):
+    """Byte transport to a single heater."""
+
+    #: Whether every received chunk is a complete JSON message
+    framed = False
+    #: Bytes appended to every write
+    suffix = b""
+    #: Seconds to wait after connecting before requesting a refresh
+    refresh_delay = 0.0
+
+    def __init__(self) -> None:
+        self._on_data: DataCallback | None = None
+
+    def set_data_callback(self, callback: DataCallback) -> None:
+        """Register the callback receiving inbound bytes."""
+        self._on_data = callback
+
+    @property
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """Return whether the link is up."""
+
+    @property
+    def max_payload_size(self) -> int | None:
+        """Largest payload in bytes that fits one write, or None if unlimited."""
+        return None
+
+    @abstractmethod
+    async def open(self) -> None:
+        """Connect, if needed, and start delivering inbound data."""
+
+    @abstractmethod
+    async def wait_closed(self) -> None:
+        """Return once the link has dropped."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Disconnect and release resources."""
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None:
+        """Write one message to the heater."""
+
+    def _deliver(self, data: bytes) -> None:
+        if self._on_data is not None:
+            self._on_data(data)
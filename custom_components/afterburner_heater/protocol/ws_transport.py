@@ -0,0 +1,149 @@
+"""WebSocket transport for the standalone Afterburner client.
+
+Requires ``aiohttp``. A shared ``ClientSession`` can be injected; otherwise
+the transport owns one for the lifetime of the connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+import aiohttp
+
+from .const import DEFAULT_WS_COMMAND_TIMEOUT, DEFAULT_WS_PATH
+from .transport import Transport, TransportError
+
+_LOGGER = logging.getLogger(__name__)
+
+_WS_CONNECT_TIMEOUT = 10
+_HEARTBEAT_INTERVAL = 30  # seconds
+_HEARTBEAT_TIMEOUT = 10  # seconds to wait for pong
+
+
+class WebSocketTransport(Transport):
+    """Text-frame transport over the firmware's WebSocket API."""
+
+    framed = True
+
+    def __init__(
+        self,
+        url: str,
+        session: aiohttp.ClientSession | None = None,
+        token: str | None = None,
+    ) -> None:
+        super().__init__()
+        self._url = url
+        self._session = session
+        self._owns_session = session is None
+        self._token = token
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the WebSocket is open."""
+        return self._ws is not None and not self._ws.closed
+
+    async def open(self) -> None:
+        """Connect and start reading frames."""
+        if self.is_connected:
+            return
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        headers = {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+        try:
+            async with asyncio.timeout(_WS_CONNECT_TIMEOUT):
+                self._ws = await self._session.ws_connect(self._url, headers=headers)
+        except aiohttp.ClientError as err:
+            raise TransportError(f"WebSocket connection failed: {err}") from err
+        self._reader = asyncio.create_task(self._read(self._ws))
+
+    async def wait_closed(self) -> None:
+        """Return once the reader stops."""
+        if self._reader:
+            await asyncio.wait({self._reader})
+
+    async def close(self) -> None:
+        """Close the WebSocket and, if owned, the session."""
+        ws, self._ws = self._ws, None
+        if ws is not None and not ws.closed:
+            await ws.close()
+        if self._reader:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def write(self, data: bytes) -> None:
+        """Send one text frame."""
+        async with self._send_lock:
+            if not self._ws or self._ws.closed:
+                raise TransportError("WebSocket not connected")
+            try:
+                async with asyncio.timeout(DEFAULT_WS_COMMAND_TIMEOUT):
+                    await self._ws.send_str(data.decode("utf-8"))
+            except (aiohttp.ClientError, ConnectionError) as err:
+                raise TransportError(f"WebSocket write failed: {err}") from err
+
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        heartbeat_task = asyncio.create_task(self._heartbeat(ws))
+        try:
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self._deliver(msg.data.encode("utf-8"))
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    _LOGGER.debug("WebSocket error: %s", ws.exception())
+                    break
+                elif msg.type == aiohttp.WSMsgType.CLOSED:
+                    break
+                elif msg.type == aiohttp.WSMsgType.PONG:
+                    _LOGGER.debug("WebSocket pong received")
+        except aiohttp.ClientError as err:
+            _LOGGER.debug("WebSocket read failed: %s", err)
+        finally:
+            heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat_task
+
+    async def _heartbeat(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Send periodic pings to keep the connection alive."""
+        while not ws.closed:
+            try:
+                await asyncio.sleep(_HEARTBEAT_INTERVAL)
+                if not ws.closed:
+                    async with asyncio.timeout(_HEARTBEAT_TIMEOUT):
+                        await ws.ping()
+                        _LOGGER.debug("WebSocket heartbeat ping sent")
+            except asyncio.TimeoutError:
+                _LOGGER.warning("WebSocket heartbeat timeout, closing connection")
+                if not ws.closed:
+                    await ws.close()
+                break
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("WebSocket heartbeat error: %s", err)
+                break
+
+
+def normalize_path(path: str | None) -> str:
+    """Return a WebSocket path with a leading slash."""
+    if not path:
+        return DEFAULT_WS_PATH
+    if not path.startswith("/"):
+        return f"/{path}"
+    return path
+
+
+def build_ws_url(host: str, port: int | None, path: str | None) -> str:
+    """Build the firmware's WebSocket URL."""
+    path = normalize_path(path)
+    if port is None:
+        return f"ws://{host}{path}"
+    return f"ws://{host}:{port}{path}"
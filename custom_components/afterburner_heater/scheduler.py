@@ -0,0 +1,102 @@
+"""Adaptive poll interval driven by the heater's run state.
+
+The coordinator polls at the floor while the heater is in a transitional run
+state (starting, igniting, cooling down) or shortly after a command, at the
+configured interval while it runs steadily, and backs off towards the ceiling
+while it is idle and stable.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+# Fragments of RunString values reported while the heater changes state
+_TRANSITIONAL_RUN_WORDS = ("start", "ignit", "prim", "glow", "stopping", "cool", "shut")
+# Seconds after a command during which the floor interval is used
+_COMMAND_WINDOW = 120.0
+# Seconds the idle run state must be unchanged before backing off
+_IDLE_STABLE_AFTER = 300.0
+# Growth factor of the interval per idle poll
+_BACKOFF_FACTOR = 2.0
+
+
+class PollScheduler:
+    """Pick the next poll interval from the run state and command activity."""
+
+    def __init__(self, base: float, floor: float, ceiling: float, now: float) -> None:
+        self.base = base
+        self.floor = floor
+        self.ceiling = ceiling
+        self.interval = base
+        # Refreshes the fixed base interval would have sent on top of ours
+        self.saved = 0.0
+        self._run_string: Any = None
+        self._run_string_since = now
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the interval may deviate from the base."""
+        return self.floor < self.ceiling
+
+    def observe(self, payload: Mapping[str, Any], now: float) -> None:
+        """Track how long the run state has been unchanged."""
+        if "RunString" in payload and payload["RunString"] != self._run_string:
+            self._run_string = payload["RunString"]
+            self._run_string_since = now
+
+    def next_interval(
+        self, raw: Mapping[str, Any], last_command: float | None, now: float
+    ) -> float:
+        """Return the interval until the next poll and account for savings.
+
+        Called once per poll; idle back-off grows the previous interval.
+        """
+        interval = self._target(raw, last_command, now)
+        if interval > self.base:
+            self.saved += interval / self.base - 1
+        self.interval = interval
+        return interval
+
+    def urgent(
+        self, raw: Mapping[str, Any], last_command: float | None, now: float
+    ) -> bool:
+        """Return whether the current interval should drop to the floor now."""
+        return self.interval > self.floor and self.wants_floor(raw, last_command, now)
+
+    def _target(
+        self, raw: Mapping[str, Any], last_command: float | None, now: float
+    ) -> float:
+        if not self.enabled:
+            return self.base
+        if self.wants_floor(raw, last_command, now):
+            return self.floor
+        if _is_idle(raw) and now - self._run_string_since >= _IDLE_STABLE_AFTER:
+            backed_off = max(self.interval, self.base) * _BACKOFF_FACTOR
+            return min(backed_off, self.ceiling)
+        return min(max(self.base, self.floor), self.ceiling)
+
+    def wants_floor(
+        self, raw: Mapping[str, Any], last_command: float | None, now: float
+    ) -> bool:
+        """Return whether a transition or recent command calls for fast polls."""
+        if not self.enabled:
+            return False
+        if last_command is not None and now - last_command < _COMMAND_WINDOW:
+            return True
+        return is_transitional(raw.get("RunString"))
+
+
+def is_transitional(run_string: Any) -> bool:
+    """Return whether a RunString describes a start-up or shut-down phase."""
+    if not isinstance(run_string, str):
+        return False
+    lowered = run_string.lower()
+    return any(word in lowered for word in _TRANSITIONAL_RUN_WORDS)
+
+
+def _is_idle(raw: Mapping[str, Any]) -> bool:
+    run_state = raw.get("RunState")
+    if run_state is not None:
+        return run_state == 0
+    run_string = raw.get("RunString")
+    return isinstance(run_string, str) and "stopped" in run_string.lower()
@@ -0,0 +1,57 @@
+"""Significant change checks for Afterburner Heater sensors.
+
+Thresholds are the deadbands declared in ``SENSOR_DESCRIPTIONS``, keyed by
+device class and unit, so state reporting and the sensors' own write filter
+agree on what counts as a meaningful change.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.significant_change import (
+    check_absolute_change,
+    check_valid_float,
+)
+
+from .entities.sensor import DEADBAND_TOLERANCE, SENSOR_DESCRIPTIONS
+
+# Smallest deadband declared per (device class, unit)
+DEADBANDS: dict[tuple[str | None, str | None], float] = {}
+for _description in SENSOR_DESCRIPTIONS:
+    if _description.deadband:
+        _key = (_description.device_class, _description.native_unit_of_measurement)
+        DEADBANDS[_key] = min(
+            DEADBANDS.get(_key, _description.deadband), _description.deadband
+        )
+
+
+@callback
+def async_check_significant_change(
+    hass: HomeAssistant,
+    old_state: str,
+    old_attrs: dict,
+    new_state: str,
+    new_attrs: dict,
+    **kwargs: Any,
+) -> bool | None:
+    """Test if the state change is significant; None if it cannot tell."""
+    if old_attrs.get(ATTR_DEVICE_CLASS) != new_attrs.get(ATTR_DEVICE_CLASS):
+        return True
+    if old_attrs.get(ATTR_UNIT_OF_MEASUREMENT) != new_attrs.get(
+        ATTR_UNIT_OF_MEASUREMENT
+    ):
+        return True
+
+    deadband = DEADBANDS.get(
+        (new_attrs.get(ATTR_DEVICE_CLASS), new_attrs.get(ATTR_UNIT_OF_MEASUREMENT))
+    )
+    if deadband is None:
+        return None
+    if not (check_valid_float(old_state) and check_valid_float(new_state)):
+        # Unavailable/unknown or a non-numeric state
+        return old_state != new_state
+    return check_absolute_change(
+        float(old_state), float(new_state), deadband - DEADBAND_TOLERANCE
+    )
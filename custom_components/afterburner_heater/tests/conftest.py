@@ -1,7 +1,7 @@
 """Fixtures for Afterburner Heater tests."""
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,6 +17,33 @@ from custom_components.afterburner_heater.const import (
     TRANSPORT_WEBSOCKET,
 )
 
+from .fake_bleak import FakeBleakConnector, fake_ble_device
+from .simulator import HeaterSimulator
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the opt-in benchmark marker."""
+    config.addinivalue_line(
+        "markers", "benchmark: timing benchmark, only run with -m benchmark"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip benchmarks unless a marker expression selects them."""
+    if "benchmark" in config.getoption("markexpr", ""):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the integration from custom_components."""
+
 
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock, None, None]:
@@ -123,3 +150,28 @@ def mock_ws_config_entry_data() -> dict[str, Any]:
         "path": "/",
         "access_token": None,
     }
+
+
+@pytest.fixture
+async def heater_simulator(
+    socket_enabled: None,
+) -> AsyncGenerator[HeaterSimulator, None]:
+    """Run a simulated heater WebSocket API on a free local port."""
+    simulator = HeaterSimulator(port=0, push_interval=None)
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+def fake_bleak_connector() -> Generator[FakeBleakConnector, None, None]:
+    """Replace BLE connection setup with an in-process fake heater."""
+    connector = FakeBleakConnector()
+    with patch(
+        "custom_components.afterburner_heater.protocol.ble_transport.establish_connection",
+        connector,
+    ), patch(
+        "custom_components.afterburner_heater.api.ble.async_ble_device_from_address",
+        return_value=fake_ble_device(),
+    ):
+        yield connector
@@ -0,0 +1,206 @@
+"""In-process stand-in for a BleakClient connected to Afterburner firmware.
+
+``FakeBleakConnector`` replaces ``establish_connection`` and hands out
+``FakeBleakClient`` instances that answer writes from a ``FirmwareModel`` and
+deliver the replies as notifications split into configurable fragments.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import MagicMock
+
+from bleak import BleakError
+
+from .simulator import FirmwareModel
+
+NotifyCallback = Callable[[Any, bytearray], None]
+
+# Fragment modes: the default 23 byte MTU, the negotiated MTU or random sizes
+FRAGMENT_ATT = "att"
+FRAGMENT_MTU = "mtu"
+FRAGMENT_RANDOM = "random"
+_DEFAULT_ATT_PAYLOAD = 20
+_NOTIFY_HANDLE = 0x0E
+
+
+@dataclass
+class FakeCharacteristic:
+    """Minimal GATT characteristic returned by the fake service collection."""
+
+    uuid: str
+    handle: int = 0x10
+
+
+@dataclass
+class FakeServices:
+    """Service collection exposing the characteristics the transport looks up."""
+
+    missing: set[str] = field(default_factory=set)
+
+    def get_characteristic(self, uuid: str) -> FakeCharacteristic | None:
+        """Return a characteristic unless it was configured as missing."""
+        if uuid.lower() in self.missing:
+            return None
+        return FakeCharacteristic(uuid.lower())
+
+
+class FakeBleakClient:
+    """Emulate a connected BleakClient talking to a heater."""
+
+    def __init__(
+        self,
+        model: FirmwareModel,
+        *,
+        mtu_size: int = 23,
+        fragment: str | int = FRAGMENT_ATT,
+        write_latency: float = 0.0,
+        notify_interval: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.model = model
+        self.mtu_size = mtu_size
+        self.fragment = fragment
+        self.write_latency = write_latency
+        self.notify_interval = notify_interval
+        self.services = FakeServices()
+        self.writes: list[bytes] = []
+        self.notifications = 0
+        self.notified_bytes = 0
+        self._random = random.Random(seed)
+        self._connected = True
+        self._notify_callback: NotifyCallback | None = None
+        self._disconnected_callback: Callable[[Any], None] | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether the fake link is up."""
+        return self._connected
+
+    def set_disconnected_callback(self, callback: Callable[[Any], None]) -> None:
+        """Register the callback fired when the link drops."""
+        self._disconnected_callback = callback
+
+    async def start_notify(self, _char: Any, callback: NotifyCallback) -> None:
+        """Start delivering notifications to ``callback``."""
+        self._ensure_connected()
+        self._notify_callback = callback
+
+    async def stop_notify(self, _char: Any) -> None:
+        """Stop delivering notifications."""
+        self._notify_callback = None
+
+    async def write_gatt_char(
+        self, _char: Any, data: bytes | bytearray, response: bool = False
+    ) -> None:
+        """Accept a write and schedule the firmware's reply."""
+        self._ensure_connected()
+        if self.write_latency:
+            await asyncio.sleep(self.write_latency)
+        self.writes.append(bytes(data))
+        try:
+            payload = json.loads(bytes(data))
+        except ValueError:
+            return
+        if isinstance(payload, dict):
+            task = asyncio.get_running_loop().create_task(
+                self.async_notify(*self.model.respond(payload))
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def disconnect(self) -> bool:
+        """Close the link from the host side."""
+        self._connected = False
+        for task in self._tasks:
+            task.cancel()
+        return True
+
+    def simulate_disconnect(self) -> None:
+        """Drop the link from the heater side, as an out-of-range heater would."""
+        self._connected = False
+        if self._disconnected_callback:
+            self._disconnected_callback(self)
+
+    def fragments(self, data: bytes) -> list[bytes]:
+        """Split ``data`` the way the configured link would."""
+        chunks = []
+        offset = 0
+        while offset < len(data):
+            size = self._fragment_size()
+            chunks.append(data[offset : offset + size])
+            offset += size
+        return chunks
+
+    def notify(self, *objects: dict[str, Any]) -> None:
+        """Deliver ``objects`` synchronously, one callback per fragment."""
+        for chunk in self.fragments(_encode(objects)):
+            self._deliver(chunk)
+
+    async def async_notify(self, *objects: dict[str, Any]) -> None:
+        """Deliver ``objects`` with a loop iteration between fragments."""
+        for chunk in self.fragments(_encode(objects)):
+            await asyncio.sleep(self.notify_interval)
+            self._deliver(chunk)
+
+    def _deliver(self, chunk: bytes) -> None:
+        if not self._connected or not self._notify_callback:
+            return
+        self.notifications += 1
+        self.notified_bytes += len(chunk)
+        self._notify_callback(_NOTIFY_HANDLE, bytearray(chunk))
+
+    def _fragment_size(self) -> int:
+        if isinstance(self.fragment, int):
+            return self.fragment
+        if self.fragment == FRAGMENT_MTU:
+            return self.mtu_size - 3
+        if self.fragment == FRAGMENT_RANDOM:
+            return self._random.randint(1, self.mtu_size - 3)
+        return _DEFAULT_ATT_PAYLOAD
+
+    def _ensure_connected(self) -> None:
+        if not self._connected:
+            raise BleakError("Not connected")
+
+
+class FakeBleakConnector:
+    """Replacement for ``establish_connection`` that creates fake clients."""
+
+    def __init__(self, model: FirmwareModel | None = None, **client_kwargs: Any) -> None:
+        self.model = model or FirmwareModel()
+        self.client_kwargs = client_kwargs
+        self.clients: list[FakeBleakClient] = []
+        self.fail_next = 0
+
+    @property
+    def client(self) -> FakeBleakClient:
+        """Return the most recently connected client."""
+        return self.clients[-1]
+
+    async def __call__(
+        self, _client_class: type, _device: Any, _name: str, **_kwargs: Any
+    ) -> FakeBleakClient:
+        if self.fail_next:
+            self.fail_next -= 1
+            raise BleakError("Connection failed")
+        client = FakeBleakClient(self.model, **self.client_kwargs)
+        self.clients.append(client)
+        return client
+
+
+def fake_ble_device(address: str = "AA:BB:CC:DD:EE:FF") -> MagicMock:
+    """Return a BLEDevice stand-in for ``async_ble_device_from_address``."""
+    device = MagicMock()
+    device.address = address
+    device.name = "Afterburner"
+    return device
+
+
+def _encode(objects: tuple[dict[str, Any], ...]) -> bytes:
+    return "".join(json.dumps(obj) for obj in objects).encode("utf-8")
@@ -0,0 +1,265 @@
+"""Local WebSocket stand-in for Afterburner heater firmware.
+
+Used by the test suite to exercise the WebSocket transport and coordinator end
+to end and to benchmark them against one or many simulated heaters.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from custom_components.afterburner_heater.protocol import DEFAULT_WS_PORT
+
+# Objects the firmware streams back in response to {"Refresh": 1}
+REFRESH_DUMP: tuple[dict[str, Any], ...] = (
+    {
+        "RunState": 0,
+        "RunString": "Stopped/Ready",
+        "ErrorState": 0,
+        "ErrorString": "No Error",
+        "RunReq": 0,
+    },
+    {
+        "TempCurrent": 18.5,
+        "TempDesired": 21,
+        "TempBody": 19,
+        "Temp1Current": 18.5,
+        "Temp4Current": 18.9,
+    },
+    {
+        "InputVoltage": 12.8,
+        "SystemVoltage": 12.8,
+        "GlowVoltage": 0,
+        "GlowCurrent": 0,
+        "FanRPM": 0,
+        "PumpActual": 0,
+        "PumpFixed": 0,
+    },
+    {
+        "FuelUsage": 1520.4,
+        "TotalFuelUsage": 88210.2,
+        "FuelRate": 0,
+        "FuelAlarm": 0,
+        "SysTotalFuel": 88210.2,
+    },
+    {
+        "Thermostat": 1,
+        "ThermostatMode": "Deadband",
+        "CyclicEnb": 1,
+        "CyclicTemp": 21,
+        "CyclicOn": -1,
+        "CyclicOff": 2,
+        "FixedDemand": 0,
+    },
+    {
+        "FrostEnable": 0,
+        "FrostOn": 2,
+        "FrostRise": 5,
+        "FrostTarget": 8,
+        "FrostMode": "Off",
+        "FrostRun": 0,
+        "FrostHold": 0,
+    },
+    {
+        "GPout1": 0,
+        "GPout2": 0,
+        "GPin1": 0,
+        "GPin2": 0,
+        "GPanlg": 0,
+        "GPmodeIn1": "Disabled",
+        "GPmodeIn2": "Disabled",
+        "GPmodeOut1": "Disabled",
+        "GPmodeOut2": "Disabled",
+    },
+    {"Altitude": 112, "Humidity": 48.2, "Pressure": 1013.4, "IP_STARSSI": -61},
+)
+
+
+class FirmwareModel:
+    """Heater state shared by the simulated WebSocket server and BLE client."""
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.state: dict[str, Any] = {}
+        for obj in REFRESH_DUMP:
+            self.state.update(obj)
+        self._random = random.Random(seed)
+
+    def respond(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
+        """Apply a command and return the objects the firmware sends back."""
+        if "Refresh" in payload:
+            return [{key: self.state[key] for key in obj} for obj in REFRESH_DUMP]
+        echo: dict[str, Any] = {}
+        for key, value in payload.items():
+            if key == "Run":
+                running = value == "heat"
+                self.state["RunState"] = 1 if running else 0
+                self.state["RunString"] = "Starting" if running else "Stopping"
+                echo.update(
+                    RunState=self.state["RunState"], RunString=self.state["RunString"]
+                )
+                continue
+            self.state[key] = value
+            echo[key] = value
+        return [echo]
+
+    def periodic_push(self) -> dict[str, Any]:
+        """Return the Humidity/Pressure/IP_STARSSI push sent every ~10 s."""
+        push = {
+            "Humidity": round(
+                self.state["Humidity"] + self._random.uniform(-0.3, 0.3), 1
+            ),
+            "Pressure": round(
+                self.state["Pressure"] + self._random.uniform(-0.2, 0.2), 1
+            ),
+            "IP_STARSSI": self.state["IP_STARSSI"] + self._random.randint(-2, 2),
+        }
+        self.state.update(push)
+        return push
+
+
+@dataclass
+class SimulatorStats:
+    """Counters for traffic seen by a simulated heater."""
+
+    connections: int = 0
+    commands: int = 0
+    refreshes: int = 0
+    messages_sent: int = 0
+    messages_dropped: int = 0
+
+
+class HeaterSimulator:
+    """Emulate the Afterburner WebSocket API on a local port."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_WS_PORT,
+        push_interval: float | None = 10.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.push_interval = push_interval
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.stats = SimulatorStats()
+        self.model = FirmwareModel(seed)
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self._clients: set[web.WebSocketResponse] = set()
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return the simulated heater state."""
+        return self.model.state
+
+    @property
+    def url(self) -> str:
+        """Return the WebSocket URL of the simulator."""
+        return f"ws://{self.host}:{self.port}/"
+
+    async def start(self) -> None:
+        """Start serving; port 0 picks a free port."""
+        app = web.Application()
+        app.router.add_get("/", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Close all client connections and stop serving."""
+        for ws in list(self._clients):
+            await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def disconnect_clients(self) -> None:
+        """Drop every connected client, as a firmware reboot would."""
+        for ws in list(self._clients):
+            await ws.close()
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.stats.connections += 1
+        self._clients.add(ws)
+        push_task = (
+            asyncio.create_task(self._push_periodic(ws))
+            if self.push_interval
+            else None
+        )
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    payload = json.loads(msg.data)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(payload, dict):
+                    await self._handle_command(ws, payload)
+        finally:
+            if push_task:
+                push_task.cancel()
+            self._clients.discard(ws)
+        return ws
+
+    async def _handle_command(
+        self, ws: web.WebSocketResponse, payload: dict[str, Any]
+    ) -> None:
+        if "Refresh" in payload:
+            self.stats.refreshes += 1
+        else:
+            self.stats.commands += 1
+        replies = self.model.respond(payload)
+        await self._delay()
+        for obj in replies:
+            await self._send(ws, obj)
+
+    async def _push_periodic(self, ws: web.WebSocketResponse) -> None:
+        assert self.push_interval is not None
+        while not ws.closed:
+            await asyncio.sleep(self.push_interval)
+            await self._send(ws, self.model.periodic_push())
+
+    async def _delay(self) -> None:
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _send(self, ws: web.WebSocketResponse, obj: dict[str, Any]) -> None:
+        if ws.closed:
+            return
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            self.stats.messages_dropped += 1
+            return
+        await ws.send_str(json.dumps(obj))
+        self.stats.messages_sent += 1
+
+
+async def start_fleet(count: int, **kwargs: Any) -> list[HeaterSimulator]:
+    """Start ``count`` simulators on free local ports."""
+    simulators = [HeaterSimulator(port=0, **kwargs) for _ in range(count)]
+    await asyncio.gather(*(simulator.start() for simulator in simulators))
+    return simulators
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return a nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
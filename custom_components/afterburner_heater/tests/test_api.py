@@ -0,0 +1,130 @@
+"""Tests for the HeaterApi subscription streams."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.afterburner_heater.api.ws import WebSocketHeaterApi
+from custom_components.afterburner_heater.protocol import CommandRateLimitedError
+
+from .simulator import REFRESH_DUMP, HeaterSimulator
+
+pytestmark = pytest.mark.asyncio
+
+
+def _api(hass: HomeAssistant, simulator: HeaterSimulator) -> WebSocketHeaterApi:
+    return WebSocketHeaterApi(
+        hass,
+        simulator.host,
+        simulator.port,
+        "/",
+        lambda payload: None,
+        init_message={"Refresh": 1},
+    )
+
+
+async def test_payload_stream_receives_refresh_dump(
+    hass: HomeAssistant, heater_simulator: HeaterSimulator
+) -> None:
+    """Test a payload subscriber sees every object of the refresh dump."""
+    api = _api(hass, heater_simulator)
+    stream = api.async_iter_payloads()
+    received: list[dict[str, Any]] = []
+
+    async def _consume() -> None:
+        async for payload in stream:
+            received.append(payload)
+            if len(received) == len(REFRESH_DUMP):
+                return
+
+    consumer = asyncio.create_task(_consume())
+    await asyncio.sleep(0)
+    await api.async_start()
+    await asyncio.wait_for(consumer, 5)
+
+    assert received == list(REFRESH_DUMP)
+    await api.async_stop()
+
+
+async def test_change_stream_filters_and_conflates(
+    hass: HomeAssistant, heater_simulator: HeaterSimulator
+) -> None:
+    """Test change subscribers only see changed keys, latest value first."""
+    api = _api(hass, heater_simulator)
+    changes = api.async_iter_changes(keys=["TempDesired"])
+    first = asyncio.ensure_future(changes.__anext__())
+    await asyncio.sleep(0)
+    await api.async_start()
+    assert await asyncio.wait_for(first, 5) == ("TempDesired", 21)
+
+    # A refresh repeating the same value is not a change
+    await api.async_request_refresh()
+    for value in (22, 23, 24):
+        await api.async_send_json({"TempDesired": value})
+    await asyncio.sleep(0.2)
+
+    # The subscriber was not reading, so only the latest value is pending
+    assert await asyncio.wait_for(changes.__anext__(), 5) == ("TempDesired", 24)
+
+    await api.async_stop()
+    with pytest.raises(StopAsyncIteration):
+        await changes.__anext__()
+
+
+async def test_refresh_requests_share_one_dump(
+    hass: HomeAssistant, heater_simulator: HeaterSimulator
+) -> None:
+    """Test the connect refresh and closely spaced requests share one dump."""
+    api = _api(hass, heater_simulator)
+    await api.async_start()
+    await api._client.wait_connected(5)
+    await asyncio.gather(*(api.async_request_refresh() for _ in range(3)))
+    await asyncio.sleep(0.2)
+
+    assert heater_simulator.stats.refreshes == 1
+    assert api._client.refresh_gate.shared == 3
+
+    # Outside the spacing window a new dump is requested
+    api.refresh_spacing = 0
+    await asyncio.sleep(1)
+    await api.async_request_refresh()
+    await asyncio.sleep(0.2)
+    assert heater_simulator.stats.refreshes == 2
+    await api.async_stop()
+
+
+async def test_command_flood_is_rate_limited(
+    hass: HomeAssistant, heater_simulator: HeaterSimulator
+) -> None:
+    """Test a flood of writes is cut off while Run still gets through."""
+    api = WebSocketHeaterApi(
+        hass,
+        heater_simulator.host,
+        heater_simulator.port,
+        "/",
+        lambda payload: None,
+        init_message={"Refresh": 1},
+        command_burst=5,
+        command_rate=0.001,
+    )
+    await api.async_start()
+    await api._client.wait_connected(5)
+
+    sent = 0
+    for value in range(20):
+        try:
+            await api.async_send_json({"TempDesired": value})
+        except CommandRateLimitedError:
+            continue
+        sent += 1
+    await api.async_send_json({"Run": "off"})
+    await asyncio.sleep(0.2)
+
+    assert sent == 4
+    assert heater_simulator.stats.commands == 5
+    assert api.rate_limiter.dropped["setting"] == 16
+    await api.async_stop()
@@ -0,0 +1,186 @@
+"""BLE pipeline benchmarks against an in-process fake BleakClient.
+
+Notifications travel the same path as on hardware: ``_handle_notify``,
+``JsonObjectStream``, ``HeaterState.merge_payload``, the coordinator and the
+entities writing their state.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+
+from custom_components.afterburner_heater.const import (
+    CONF_TRANSPORT,
+    DOMAIN,
+    TRANSPORT_BLE,
+)
+
+from .fake_bleak import (
+    FRAGMENT_ATT,
+    FRAGMENT_MTU,
+    FRAGMENT_RANDOM,
+    FakeBleakConnector,
+)
+from .simulator import REFRESH_DUMP, percentile
+
+# The bluetooth dependency is set up against mocked adapters
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("enable_bluetooth")]
+
+UPDATES = 50
+DUMP_ROUNDS = 20
+FRAGMENT_MODES = [FRAGMENT_ATT, FRAGMENT_MTU, FRAGMENT_RANDOM]
+# Regression bounds, loose enough for a loaded CI runner
+MAX_NOTIFY_P95 = 0.1  # s
+MAX_DUMP_CPU = 0.1  # s
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def _setup_ble_entry(
+    hass: HomeAssistant, connector: FakeBleakConnector
+) -> MockConfigEntry:
+    """Set up a BLE entry and wait for the first full refresh dump."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Afterburner",
+        data={CONF_TRANSPORT: TRANSPORT_BLE, CONF_ADDRESS: "AA:BB:CC:DD:EE:FF"},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    coordinator = entry.runtime_data.coordinator
+    dump_keys = {key for obj in REFRESH_DUMP for key in obj}
+    await _wait_for(
+        lambda: coordinator.data is not None
+        and dump_keys <= coordinator.data.raw.keys()
+    )
+    await hass.async_block_till_done()
+    return entry
+
+
+def _entity_id(hass: HomeAssistant, entry: MockConfigEntry, key: str) -> str:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}-{key}"
+    )
+    assert entity_id
+    return entity_id
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("fragment", FRAGMENT_MODES)
+async def test_notify_to_entity_latency(
+    hass: HomeAssistant,
+    record_property: Callable[[str, object], None],
+    fake_bleak_connector: FakeBleakConnector,
+    fragment: str,
+) -> None:
+    """Benchmark the time from the first notify fragment to the entity state."""
+    fake_bleak_connector.client_kwargs.update(mtu_size=185, fragment=fragment, seed=1)
+    entry = await _setup_ble_entry(hass, fake_bleak_connector)
+    client = fake_bleak_connector.client
+    entity_id = _entity_id(hass, entry, "TempCurrent")
+
+    changed: asyncio.Future[float] | None = None
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if changed and not changed.done():
+            changed.set_result(time.perf_counter())
+
+    unsub = async_track_state_change_event(hass, [entity_id], _state_changed)
+    samples = []
+    for update in range(UPDATES):
+        changed = hass.loop.create_future()
+        started = time.perf_counter()
+        await client.async_notify({"TempCurrent": 10 + update / 10})
+        samples.append(await asyncio.wait_for(changed, 5) - started)
+    unsub()
+    p95 = percentile(samples, 0.95)
+
+    record_property("notify_p50_ms", round(percentile(samples, 0.5) * 1000, 2))
+    record_property("notify_p95_ms", round(p95 * 1000, 2))
+    assert p95 <= MAX_NOTIFY_P95
+    assert hass.states.get(entity_id).state == str(10 + (UPDATES - 1) / 10)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("fragment", FRAGMENT_MODES)
+async def test_refresh_dump_cpu(
+    hass: HomeAssistant,
+    record_property: Callable[[str, object], None],
+    fake_bleak_connector: FakeBleakConnector,
+    fragment: str,
+) -> None:
+    """Benchmark CPU time spent processing one refresh dump end to end."""
+    fake_bleak_connector.client_kwargs.update(mtu_size=185, fragment=fragment, seed=1)
+    entry = await _setup_ble_entry(hass, fake_bleak_connector)
+    client = fake_bleak_connector.client
+    coordinator = entry.runtime_data.coordinator
+    dump = fake_bleak_connector.model.respond({"Refresh": 1})
+    messages = coordinator.health.message_count
+    notifications = client.notifications
+
+    started = time.process_time()
+    for _ in range(DUMP_ROUNDS):
+        client.notify(*dump)
+        await hass.async_block_till_done()
+    cpu = (time.process_time() - started) / DUMP_ROUNDS
+
+    fragments = (client.notifications - notifications) // DUMP_ROUNDS
+    record_property("cpu_per_dump_ms", round(cpu * 1000, 2))
+    record_property("notifications_per_dump", fragments)
+    assert cpu <= MAX_DUMP_CPU
+    assert coordinator.health.message_count - messages == DUMP_ROUNDS * len(dump)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_write_echo_with_latency(
+    hass: HomeAssistant, fake_bleak_connector: FakeBleakConnector
+) -> None:
+    """Test writes are acknowledged after the configured latency and echoed."""
+    fake_bleak_connector.client_kwargs.update(write_latency=0.02)
+    entry = await _setup_ble_entry(hass, fake_bleak_connector)
+    coordinator = entry.runtime_data.coordinator
+
+    waiter = coordinator.async_track_echo(["TempDesired"])
+    started = time.perf_counter()
+    await entry.runtime_data.api.async_send_json({"TempDesired": 24})
+    assert await coordinator.async_wait_echo(waiter, 5) == set()
+    coordinator.async_cancel_echo(waiter)
+
+    assert time.perf_counter() - started >= 0.02
+    assert fake_bleak_connector.client.writes[-1] == b'{"TempDesired":24}'
+    assert coordinator.data.raw["TempDesired"] == 24
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_reconnect_after_disconnect(
+    hass: HomeAssistant, fake_bleak_connector: FakeBleakConnector
+) -> None:
+    """Test a dropped link reconnects and refreshes the full state again."""
+    entry = await _setup_ble_entry(hass, fake_bleak_connector)
+    coordinator = entry.runtime_data.coordinator
+    messages = coordinator.health.message_count
+
+    fake_bleak_connector.client.simulate_disconnect()
+    await _wait_for(lambda: len(fake_bleak_connector.clients) == 2)
+    await _wait_for(
+        lambda: coordinator.health.message_count - messages >= len(REFRESH_DUMP)
+    )
+
+    assert fake_bleak_connector.client.writes == [b'{"Refresh":1}']
+    assert await hass.config_entries.async_unload(entry.entry_id)
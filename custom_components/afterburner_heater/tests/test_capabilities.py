@@ -0,0 +1,49 @@
+"""Tests for the persisted set of reported heater keys."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.afterburner_heater.capabilities import HeaterCapabilities
+from custom_components.afterburner_heater.const import DOMAIN
+
+pytestmark = pytest.mark.asyncio
+
+_STORAGE_KEY = f"{DOMAIN}.entry1.capabilities"
+
+
+async def test_new_keys_notified_once_and_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test listeners only see first-seen keys and the set survives a reload."""
+    capabilities = HeaterCapabilities(hass, "entry1")
+    await capabilities.async_load()
+    seen: list[set[str]] = []
+    capabilities.async_add_listener(seen.append)
+
+    capabilities.async_observe({"TempCurrent": 20, "RunString": "Stopped"})
+    capabilities.async_observe({"TempCurrent": 21})
+    capabilities.async_observe({"TempCurrent": 21, "GlowCurrent": 0.0})
+    assert seen == [{"TempCurrent", "RunString"}, {"GlowCurrent"}]
+
+    # Saving is delayed to batch the first dump
+    assert _STORAGE_KEY not in hass_storage
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[_STORAGE_KEY]["data"] == {
+        "keys": ["GlowCurrent", "RunString", "TempCurrent"]
+    }
+
+    reloaded = HeaterCapabilities(hass, "entry1")
+    await reloaded.async_load()
+    assert reloaded.keys == {"GlowCurrent", "RunString", "TempCurrent"}
+
+    await reloaded.async_remove()
+    assert _STORAGE_KEY not in hass_storage
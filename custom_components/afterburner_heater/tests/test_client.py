@@ -0,0 +1,156 @@
+"""Tests for the standalone AfterburnerClient over an in-memory transport."""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from custom_components.afterburner_heater.protocol import (
+    AfterburnerClient,
+    HeaterState,
+    Transport,
+)
+
+pytestmark = pytest.mark.asyncio
+
+REFRESH = b'{"Refresh":1}'
+
+
+class _FakeTransport(Transport):
+    """Transport that records writes and delivers whatever the test feeds."""
+
+    framed = True
+
+    def __init__(self, echo: bool = False) -> None:
+        super().__init__()
+        self.echo = echo
+        self.opens = 0
+        self.writes: list[bytes] = []
+        self._connected = False
+        self._closed = asyncio.Event()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def open(self) -> None:
+        self.opens += 1
+        self._connected = True
+        self._closed = asyncio.Event()
+
+    async def wait_closed(self) -> None:
+        await self._closed.wait()
+
+    async def close(self) -> None:
+        self._connected = False
+        self._closed.set()
+
+    async def write(self, data: bytes) -> None:
+        self.writes.append(data)
+        if self.echo and data != REFRESH:
+            asyncio.get_running_loop().call_soon(self._deliver, data)
+
+    def receive(self, payload: dict[str, Any]) -> None:
+        self._deliver(json.dumps(payload).encode())
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 1) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+async def test_connect_refresh_reconnect_and_stop() -> None:
+    """Test the client refreshes on connect, reopens a dropped link and stops."""
+    transport = _FakeTransport()
+    client = AfterburnerClient(transport)
+    await client.start()
+    await client.wait_connected(1)
+    await _wait_for(lambda: transport.writes == [REFRESH])
+
+    transport.receive({"TempCurrent": 20})
+    assert client.state.raw["TempCurrent"] == 20
+    assert client.message_count == 1
+
+    await client.reconnect()
+    await _wait_for(lambda: transport.opens == 2)
+    assert client.reconnects == 1
+
+    await client.stop()
+    assert not client.is_connected
+    assert not client.refresh_gate.in_flight
+
+
+async def test_send_waits_for_echo() -> None:
+    """Test acknowledged sends return the keys the heater did not echo."""
+    transport = _FakeTransport(echo=True)
+    async with AfterburnerClient(transport, init_message=None) as client:
+        assert await client.send({"CyclicTemp": 21}, ack=True, timeout=1) == set()
+        assert transport.writes == [b'{"CyclicTemp":21}']
+
+        transport.echo = False
+        assert await client.send({"CyclicTemp": 22}, ack=True, timeout=0.01) == {
+            "CyclicTemp"
+        }
+        # Unacknowledged sends return at once
+        assert await client.send(b'{"Run":1}') == set()
+        assert transport.writes[-1] == b'{"Run":1}'
+
+
+async def test_refresh_requests_are_shed() -> None:
+    """Test requests during and shortly after a dump share it."""
+    transport = _FakeTransport()
+    client = AfterburnerClient(transport)
+    client.refresh_gate.settle = 0.01
+    await client.start()
+    await _wait_for(lambda: client.refresh_gate.in_flight)
+
+    # In flight: shared
+    future = await client.request_refresh()
+    transport.receive({"TempCurrent": 20})
+    transport.receive({"RunState": 0})
+    await asyncio.wait_for(future, 1)
+    # Within the spacing of the last dump: shared as well
+    state = await client.refresh(timeout=1)
+
+    assert state.raw == {"TempCurrent": 20, "RunState": 0}
+    assert transport.writes == [REFRESH]
+    assert client.refresh_gate.shared == 2
+    await client.stop()
+
+
+async def test_subscriptions_fan_out() -> None:
+    """Test listeners and state subscribers each see the updates."""
+    transport = _FakeTransport()
+    transport.framed = False
+    client = AfterburnerClient(transport, init_message=None)
+    first: list[dict[str, Any]] = []
+    second: list[dict[str, Any]] = []
+    client.add_listener(first.append)
+    remove = client.add_listener(second.append)
+
+    async def _next_state() -> HeaterState:
+        async for state in client.states():
+            return state
+        raise AssertionError("state stream ended")
+
+    consumers = [asyncio.create_task(_next_state()) for _ in range(2)]
+    await client.start()
+    await client.wait_connected(1)
+
+    # Objects split across fragments are reassembled
+    transport._deliver(b'{"TempCurrent":2')
+    transport._deliver(b'0}{"RunState":0}')
+    states = await asyncio.wait_for(asyncio.gather(*consumers), 1)
+
+    assert first == second == [{"TempCurrent": 20}, {"RunState": 0}]
+    assert all(state.raw["TempCurrent"] == 20 for state in states)
+
+    remove()
+    transport._deliver(b'{"RunState":1}')
+    assert len(first) == 3
+    assert len(second) == 2
+    await client.stop()
@@ -0,0 +1,47 @@
+"""Tests for command encoding."""
+from __future__ import annotations
+
+from custom_components.afterburner_heater.protocol import (
+    ENCODED_REFRESH,
+    ENCODED_RUN_OFF,
+    cyclic_temp_command,
+    encode_command,
+    encoded_command,
+    encoded_size,
+    gpout1_command,
+    pack_commands,
+)
+
+
+def test_commands_encode_compactly() -> None:
+    """Test commands are encoded without whitespace."""
+    assert ENCODED_REFRESH == b'{"Refresh":1}'
+    assert ENCODED_RUN_OFF == b'{"Run":"off"}'
+    assert encode_command({"CyclicTemp": 70, "GPout1": 1}) == (
+        b'{"CyclicTemp":70,"GPout1":1}'
+    )
+    assert encoded_size({"FixedDemand": None}) == len(b'{"FixedDemand":null}')
+
+
+def test_single_key_encodings_are_cached_by_type() -> None:
+    """Test repeated commands reuse their encoding and keep value types."""
+    encoded_command.cache_clear()
+    first = encode_command(cyclic_temp_command(70.5))
+    assert encode_command(cyclic_temp_command(70.5)) is first
+    assert encoded_command.cache_info().hits == 1
+
+    assert encode_command(gpout1_command(True)) == b'{"GPout1":1}'
+    assert encode_command({"GPout1": True}) == b'{"GPout1":true}'
+    assert encode_command({"CyclicTemp": 70}) == b'{"CyclicTemp":70}'
+    assert encode_command({"CyclicTemp": 70.0}) == b'{"CyclicTemp":70.0}'
+
+
+def test_pack_commands_uses_compact_size() -> None:
+    """Test packing counts the bytes that are actually written."""
+    settings = {"CyclicTemp": 70, "CyclicOn": 2, "CyclicOff": 3}
+    size = len(b'{"CyclicTemp":70,"CyclicOn":2}')
+
+    assert pack_commands(settings, size) == [
+        {"CyclicTemp": 70, "CyclicOn": 2},
+        {"CyclicOff": 3},
+    ]
@@ -5,6 +5,7 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
@@ -443,3 +444,30 @@ async def test_options_flow_save(
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert result["data"]["scan_interval"] == 120
     assert result["data"]["path"] == "/custom"
+
+
+async def test_options_flow_rejects_min_above_max(
+    hass: HomeAssistant,
+    mock_ws_config_entry_data: dict[str, Any],
+) -> None:
+    """Test a fastest update interval above the slowest one is not stored."""
+    entry = MockConfigEntry(domain=DOMAIN, data=mock_ws_config_entry_data)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"min_scan_interval": 300, "max_scan_interval": 60},
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"max_scan_interval": "max_below_min"}
+    assert entry.options == {}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"min_scan_interval": 30, "max_scan_interval": 60},
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options["max_scan_interval"] == 60
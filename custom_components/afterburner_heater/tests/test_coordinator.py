@@ -0,0 +1,331 @@
+"""Tests for the coordinator's refresh scheduling and command path."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.util import dt as dt_util
+
+from custom_components.afterburner_heater.api.base import HeaterApi
+from custom_components.afterburner_heater.const import COMMAND_MAX_AGE, DOMAIN
+from custom_components.afterburner_heater.coordinator import AfterburnerCoordinator
+
+pytestmark = pytest.mark.asyncio
+
+
+class _RecordingApi(HeaterApi):
+    """HeaterApi that records refresh requests and sent payloads."""
+
+    def __init__(self) -> None:
+        super().__init__(lambda payload: None)
+        self.refreshes = 0
+        self.sent: list[dict[str, Any]] = []
+
+    async def async_start(self) -> None:
+        """Nothing to start."""
+
+    async def async_stop(self) -> None:
+        """Nothing to stop."""
+
+    async def async_send_json(self, payload: dict[str, Any]) -> None:
+        self.sent.append(payload)
+
+    async def async_request_refresh(self) -> None:
+        self.refreshes += 1
+
+
+def _coordinator(
+    hass: HomeAssistant, api: HeaterApi, **kwargs: Any
+) -> AfterburnerCoordinator:
+    entry = MockConfigEntry(domain=DOMAIN, title="Heater")
+    entry.add_to_hass(hass)
+    return AfterburnerCoordinator(
+        hass, entry, api, timedelta(seconds=60), **kwargs
+    )
+
+
+async def _settle_first_dump(
+    hass: HomeAssistant, coordinator: AfterburnerCoordinator
+) -> None:
+    coordinator.handle_message({"TempCurrent": 20, "RunString": "Stopped"})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+
+
+async def test_polling_starts_with_first_message(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test nothing polls before the first payload and entities stay unavailable."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    remove_listener = coordinator.async_add_listener(lambda: None)
+    assert coordinator.update_interval is None
+
+    freezer.tick(timedelta(seconds=150))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert api.refreshes == 0
+    assert coordinator.last_exception is None
+    assert not coordinator.last_update_success
+
+    coordinator.handle_message({"TempCurrent": 20})
+    await hass.async_block_till_done()
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    freezer.tick(timedelta(seconds=61))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert api.refreshes == 1
+    assert coordinator.last_update_success
+    remove_listener()
+    await coordinator.async_stop()
+
+
+async def test_refresh_skipped_while_tracked_keys_fresh(hass: HomeAssistant) -> None:
+    """Test the periodic refresh is skipped while entity keys are fresh."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api, max_key_age=timedelta(seconds=300))
+    await _settle_first_dump(hass, coordinator)
+    untrack = coordinator.async_track_keys(["TempCurrent", "RunString", "Unsent"])
+
+    await coordinator._async_update_data()
+    assert api.refreshes == 0
+    assert coordinator.health.refreshes_skipped == 1
+
+    # Keys age past the bound
+    coordinator.max_key_age = timedelta(milliseconds=1)
+    await asyncio.sleep(0.01)
+    assert coordinator.stale_keys() == {"TempCurrent", "RunString"}
+    await coordinator._async_update_data()
+    assert api.refreshes == 1
+
+    # Without tracked keys there is nothing to judge freshness by
+    untrack()
+    coordinator.max_key_age = timedelta(seconds=300)
+    await coordinator._async_update_data()
+    assert api.refreshes == 2
+
+
+async def test_skipped_refreshes_do_not_starve_the_watchdog(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a link that only answers polls is refreshed before it goes stale."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api, max_key_age=timedelta(seconds=300))
+    await _settle_first_dump(hass, coordinator)
+    coordinator.async_track_keys(["TempCurrent", "RunString"])
+
+    # Recent activity still allows skipping
+    await coordinator._async_update_data()
+    assert api.refreshes == 0
+
+    for _ in range(5):
+        freezer.tick(timedelta(seconds=60))
+        refreshes = api.refreshes
+        await coordinator._async_update_data()
+        if api.refreshes > refreshes:
+            coordinator.handle_message({"TempCurrent": 20, "RunString": "Stopped"})
+        coordinator._async_check_stale(dt_util.utcnow())
+
+    assert api.refreshes == 5
+    assert coordinator.watchdog.forced_reconnects == 0
+    await coordinator.async_stop()
+
+
+async def test_idle_backoff_raises_stale_threshold(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polls backed off past twice the base interval are not outages."""
+    api = _RecordingApi()
+    coordinator = _coordinator(
+        hass,
+        api,
+        min_update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=600),
+    )
+    coordinator.handle_message({"RunState": 0, "RunString": "Stopped/Ready"})
+    freezer.tick(timedelta(seconds=400))
+    coordinator.handle_message({"RunState": 0})
+
+    for _ in range(3):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=480)
+    assert coordinator.watchdog.fallback_stale_after == 960
+
+    freezer.tick(timedelta(seconds=300))
+    coordinator._async_check_stale(dt_util.utcnow())
+    assert coordinator.watchdog.forced_reconnects == 0
+    await coordinator.async_stop()
+
+
+async def test_stale_link_warns_once_per_outage(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test one warning per outage and no overlapping reconnects."""
+    api = _RecordingApi()
+    reconnects: list[asyncio.Event] = []
+
+    async def _reconnect() -> None:
+        reconnects.append(asyncio.Event())
+        await reconnects[-1].wait()
+
+    api.async_reconnect = _reconnect  # type: ignore[method-assign]
+    coordinator = _coordinator(hass, api)
+    coordinator.handle_message({"TempCurrent": 20})
+
+    def _check_after(seconds: float) -> None:
+        freezer.tick(timedelta(seconds=seconds))
+        coordinator._async_check_stale(dt_util.utcnow())
+
+    def _warnings() -> int:
+        return sum(
+            "reconnecting" in record.message
+            for record in caplog.records
+            if record.levelname == "WARNING"
+        )
+
+    _check_after(130)
+    await hass.async_block_till_done(wait_background_tasks=False)
+    assert len(reconnects) == 1
+    assert _warnings() == 1
+    # Still reconnecting: no second attempt
+    _check_after(130)
+    assert len(reconnects) == 1
+
+    reconnects[0].set()
+    await asyncio.sleep(0)
+    _check_after(130)
+    await asyncio.sleep(0)
+    assert len(reconnects) == 2
+    assert _warnings() == 1
+
+    coordinator.handle_message({"TempCurrent": 20})
+    assert "is back" in caplog.text
+    reconnects[1].set()
+    await asyncio.sleep(0)
+    _check_after(130)
+    await asyncio.sleep(0)
+    assert _warnings() == 2
+    await coordinator.async_stop()
+    assert coordinator.watchdog.forced_reconnects == 3
+
+
+async def test_refresh_always_sent_when_disabled(hass: HomeAssistant) -> None:
+    """Test a zero max key age always refreshes."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    await _settle_first_dump(hass, coordinator)
+    coordinator.async_track_keys(["TempCurrent"])
+
+    await coordinator._async_update_data()
+    assert api.refreshes == 1
+
+
+async def test_unchanged_commands_suppressed(hass: HomeAssistant) -> None:
+    """Test commands matching the fresh state are not written."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    coordinator.handle_message({"CyclicTemp": 21, "GPout1": 1, "RunState": 1})
+
+    assert not await coordinator.async_send_command({"CyclicTemp": 21.0})
+    assert not await coordinator.async_send_command({"GPout1": "1"})
+    # Run is never suppressed, partial changes are sent whole
+    assert await coordinator.async_send_command({"Run": "heat"})
+    assert await coordinator.async_send_command({"CyclicTemp": 21, "GPout1": 0})
+    assert api.sent == [{"Run": "heat"}, {"CyclicTemp": 21, "GPout1": 0}]
+    assert coordinator.health.commands_suppressed == 2
+    assert coordinator.health.commands_sent == 2
+
+    coordinator.suppress_unchanged = False
+    assert await coordinator.async_send_command({"CyclicTemp": 21})
+    await coordinator.async_stop()
+
+
+async def test_writes_in_flight_never_suppress(hass: HomeAssistant) -> None:
+    """Test a write reverting one the heater has not echoed yet is sent."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    coordinator.handle_message({"GPout1": 0})
+
+    # Toggled on and straight back off before the first echo arrives
+    assert await coordinator.async_send_command({"GPout1": 1})
+    assert coordinator.unchanged_keys({"GPout1": 0}) == set()
+    assert await coordinator.async_send_command({"GPout1": 0})
+    assert api.sent == [{"GPout1": 1}, {"GPout1": 0}]
+
+    # Once echoed the state is current again
+    coordinator.handle_message({"GPout1": 0})
+    assert not await coordinator.async_send_command({"GPout1": 0})
+    # A write that is never echoed stops counting after the freshness bound
+    assert await coordinator.async_send_command({"GPout1": 1})
+    assert coordinator.unchanged_keys({"GPout1": 0}) == set()
+    coordinator._in_flight["GPout1"] -= COMMAND_MAX_AGE.total_seconds() + 1
+    assert coordinator.unchanged_keys({"GPout1": 0}) == {"GPout1"}
+    await coordinator.async_stop()
+
+
+async def test_commands_are_coerced_by_the_registry(hass: HomeAssistant) -> None:
+    """Test registered keys are sent as wire types and invalid values raise."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+
+    assert await coordinator.async_send_command({"CyclicTemp": "21", "GPout1": True})
+    assert await coordinator.async_send_command({"FixedDemand": 50, "Custom": "x"})
+    assert api.sent == [
+        {"CyclicTemp": 21.0, "GPout1": 1},
+        {"FixedDemand": 50.0, "Custom": "x"},
+    ]
+    with pytest.raises(HomeAssistantError, match="ThermostatMode must be one of"):
+        await coordinator.async_send_command({"ThermostatMode": "Eco"})
+    assert len(api.sent) == 2
+    await coordinator.async_stop()
+
+
+async def test_stale_values_never_suppress(hass: HomeAssistant) -> None:
+    """Test values older than the freshness bound do not suppress writes."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    coordinator.handle_message({"CyclicTemp": 21})
+
+    later = time.monotonic() + COMMAND_MAX_AGE.total_seconds() + 1
+    assert coordinator.unchanged_keys({"CyclicTemp": 21}) == {"CyclicTemp"}
+    assert coordinator.unchanged_keys({"CyclicTemp": 21}, later) == set()
+    await coordinator.async_stop()
+
+
+async def test_dropped_commands_raise_repair_issue(hass: HomeAssistant) -> None:
+    """Test rate limited writes raise a repair issue that clears later."""
+    api = _RecordingApi()
+    coordinator = _coordinator(hass, api)
+    issue_id = f"commands_rate_limited_{coordinator.config_entry.entry_id}"
+    registry = ir.async_get(hass)
+
+    coordinator._async_check_rate_limit(dt_util.utcnow())
+    assert registry.async_get_issue(DOMAIN, issue_id) is None
+
+    api.rate_limiter.dropped["setting"] += 3
+    coordinator._async_check_rate_limit(dt_util.utcnow())
+    issue = registry.async_get_issue(DOMAIN, issue_id)
+    assert issue is not None
+    assert issue.translation_placeholders == {"name": "Heater", "dropped": "3"}
+    assert coordinator.commands_dropped == 3
+
+    # Quiet for the clear period
+    coordinator._dropped_at = time.monotonic() - 1801
+    coordinator._async_check_rate_limit(dt_util.utcnow())
+    assert registry.async_get_issue(DOMAIN, issue_id) is None
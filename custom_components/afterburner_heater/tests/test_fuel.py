@@ -0,0 +1,63 @@
+"""Tests for the fuel consumption integrator."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.afterburner_heater.protocol import FuelIntegrator
+
+
+def test_counter_increase_is_consumption() -> None:
+    """Test fuel use follows the heater counter and survives a restart."""
+    fuel = FuelIntegrator()
+    fuel.start_day("2026-01-01")
+    fuel.observe({"RunState"}, {"RunState": False}, 0)
+    fuel.observe({"TotalFuelUsage"}, {"TotalFuelUsage": 1000.0}, 0)
+    assert fuel.total_ml == 0.0
+
+    fuel.observe({"RunState"}, {"RunState": True}, 10)
+    fuel.observe({"TotalFuelUsage"}, {"TotalFuelUsage": 1250.0}, 20)
+    assert (fuel.total_ml, fuel.day_ml, fuel.run_ml) == (250.0, 250.0, 250.0)
+
+    # Restored from a checkpoint, the next reading catches up on the gap
+    restored = FuelIntegrator()
+    restored.restore(fuel.as_dict())
+    restored.observe({"SysTotalFuel"}, {"TotalFuelUsage": 1300.0}, 0)
+    assert restored.total_ml == 300.0
+    # A counter reset is not negative use
+    restored.observe({"TotalFuelUsage"}, {"TotalFuelUsage": 5.0}, 10)
+    assert restored.total_ml == 300.0
+
+
+def test_pump_integration_without_counter() -> None:
+    """Test heaters without a fuel counter are integrated from the pump."""
+    fuel = FuelIntegrator(stroke_ml=0.02)
+    fuel.observe({"PumpActual"}, {"PumpActual": 2.5}, 0)
+    assert fuel.rate_lph == pytest.approx(0.18)
+    fuel.observe({"PumpActual"}, {"PumpActual": 2.5}, 60)
+    assert fuel.total_ml == pytest.approx(3.0)
+
+    # Gaps longer than a link outage are not integrated across
+    fuel.observe({"PumpActual"}, {"PumpActual": 2.5}, 1000)
+    assert fuel.total_ml == pytest.approx(3.0)
+
+    # The heater's own rate wins once reported
+    fuel.observe({"FuelRate"}, {"FuelRate": 250.0}, 1010)
+    fuel.observe({"PumpActual"}, {"PumpActual": 5.0}, 1020)
+    assert fuel.rate_lph == 0.25
+
+
+def test_new_run_and_new_day_reset() -> None:
+    """Test the per-run and per-day totals restart."""
+    fuel = FuelIntegrator()
+    fuel.start_day("2026-01-01")
+    fuel.observe(
+        {"RunState", "TotalFuelUsage"}, {"RunState": True, "TotalFuelUsage": 0.0}, 0
+    )
+    fuel.observe({"TotalFuelUsage"}, {"TotalFuelUsage": 100.0}, 10)
+    fuel.observe({"RunState"}, {"RunState": False}, 20)
+    fuel.start_day("2026-01-02")
+    assert (fuel.day_ml, fuel.run_ml) == (0.0, 100.0)
+
+    fuel.observe({"RunState"}, {"RunState": True}, 30)
+    fuel.observe({"TotalFuelUsage"}, {"TotalFuelUsage": 150.0}, 40)
+    assert (fuel.total_ml, fuel.day_ml, fuel.run_ml) == (150.0, 50.0, 50.0)
@@ -0,0 +1,31 @@
+"""Tests for the streaming latency histogram."""
+from __future__ import annotations
+
+from custom_components.afterburner_heater.protocol import StreamingHistogram
+
+
+def test_percentiles_within_bucket_width() -> None:
+    """Test percentiles are within one bucket of the exact value."""
+    histogram = StreamingHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    assert histogram.count == 1000
+    assert histogram.mean == 500.5
+    for fraction, exact in ((0.5, 500), (0.95, 950), (0.99, 990)):
+        value = histogram.percentile(fraction)
+        assert value is not None
+        assert exact <= value <= exact * 1.1
+
+
+def test_out_of_range_samples_are_clamped() -> None:
+    """Test samples outside the bucket range still count."""
+    histogram = StreamingHistogram(minimum=1.0, maximum=100.0)
+    assert histogram.percentile(0.5) is None
+    histogram.record(0.1)
+    histogram.record(10_000.0)
+
+    assert histogram.percentile(0.5) == 1.0
+    assert histogram.percentile(1.0) == 10_000.0
+    histogram.clear()
+    assert histogram.count == 0
@@ -0,0 +1,83 @@
+"""Tests for the payload ingestion stage."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.afterburner_heater.ingest import PayloadIngest
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_payloads_pass_through_without_lag() -> None:
+    """Test payloads are published one by one while the loop keeps up."""
+    published: list[dict[str, Any]] = []
+    ingest = PayloadIngest(asyncio.get_running_loop(), published.append)
+    ingest.start()
+    ingest.push({"TempCurrent": 20})
+    ingest.push({"TempCurrent": 21})
+    probe = ingest._probe_handle
+    assert probe is not None
+    ingest.stop()
+
+    assert published == [{"TempCurrent": 20}, {"TempCurrent": 21}]
+    assert ingest.stats.conflated_payloads == 0
+    assert probe.cancelled()
+    assert ingest._probe_handle is None
+
+
+async def test_probe_only_runs_while_payloads_arrive() -> None:
+    """Test the lag probe is armed by payloads and disarms once idle."""
+    ingest = PayloadIngest(
+        asyncio.get_running_loop(),
+        lambda payload: None,
+        probe_interval=0.01,
+        probe_idle_after=0.03,
+    )
+    ingest.start()
+    await asyncio.sleep(0.02)
+    assert ingest._probe_handle is None
+
+    ingest.push({"TempCurrent": 20})
+    assert ingest._probe_handle is not None
+    await asyncio.sleep(0.1)
+    assert ingest._probe_handle is None
+
+    # Not started: payloads do not arm it
+    ingest.stop()
+    ingest.push({"TempCurrent": 21})
+    assert ingest._probe_handle is None
+
+
+async def test_lagging_loop_conflates_payloads() -> None:
+    """Test payloads are folded into one delta while the loop lags."""
+    published: list[dict[str, Any]] = []
+    ingest = PayloadIngest(
+        asyncio.get_running_loop(),
+        published.append,
+        lag_threshold=0.02,
+        probe_interval=0.05,
+    )
+    ingest.start()
+    # The first payload arms the probe, then the loop blocks past its deadline
+    ingest.push({"RunState": 0})
+    time.sleep(0.1)
+    await asyncio.sleep(0.001)
+    assert ingest.conflating
+
+    ingest.push({"TempCurrent": 20, "RunState": 0})
+    ingest.push({"TempCurrent": 21})
+    ingest.push({"TempDesired": 22})
+    await asyncio.sleep(0)
+    ingest.stop()
+
+    assert published == [
+        {"RunState": 0},
+        {"TempCurrent": 21, "RunState": 0, "TempDesired": 22},
+    ]
+    assert ingest.stats.conflated_payloads == 2
+    assert ingest.stats.conflated_batches == 1
+    assert ingest.stats.conflation_activations == 1
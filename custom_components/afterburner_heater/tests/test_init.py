@@ -0,0 +1,141 @@
+"""Tests for applying changed options to a running entry."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Generator
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_HOST, CONF_PATH, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+
+from custom_components.afterburner_heater import (
+    AfterburnerRuntimeData,
+    _async_update_listener,
+)
+from custom_components.afterburner_heater.api.base import HeaterApi
+from custom_components.afterburner_heater.const import (
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
+    CONF_TRANSPORT,
+    DEFAULT_POLL_INTERVAL_WS,
+    DOMAIN,
+    TRANSPORT_WEBSOCKET,
+)
+from custom_components.afterburner_heater.coordinator import AfterburnerCoordinator
+
+pytestmark = pytest.mark.asyncio
+
+
+class _OptionsApi(HeaterApi):
+    """HeaterApi recording the command rates it is given."""
+
+    def __init__(self) -> None:
+        super().__init__(lambda payload: None)
+        self.command_rates: list[tuple[int, float]] = []
+
+    async def async_start(self) -> None:
+        """Nothing to start."""
+
+    async def async_stop(self) -> None:
+        """Nothing to stop."""
+
+    async def async_send_json(self, payload: dict[str, Any]) -> None:
+        """Nothing to send."""
+
+    def set_command_rate(self, burst: int, rate: float) -> None:
+        self.command_rates.append((burst, rate))
+        super().set_command_rate(burst, rate)
+
+
+@pytest.fixture
+def mock_reload(hass: HomeAssistant) -> Generator[MagicMock, None, None]:
+    """Record scheduled reloads instead of reloading."""
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        yield reload
+
+
+@pytest.fixture
+async def entry(hass: HomeAssistant) -> AsyncGenerator[MockConfigEntry, None]:
+    """Return a WebSocket entry with runtime data, as setup leaves it."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Heater",
+        data={CONF_TRANSPORT: TRANSPORT_WEBSOCKET, CONF_HOST: "192.168.1.100"},
+    )
+    entry.add_to_hass(hass)
+    api = _OptionsApi()
+    entry.runtime_data = AfterburnerRuntimeData(
+        coordinator=AfterburnerCoordinator(
+            hass, entry, api, DEFAULT_POLL_INTERVAL_WS
+        ),
+        api=api,
+        transport=TRANSPORT_WEBSOCKET,
+    )
+    yield entry
+    await entry.runtime_data.coordinator.async_stop()
+
+
+async def _set_options(
+    hass: HomeAssistant, entry: MockConfigEntry, **options: Any
+) -> None:
+    hass.config_entries.async_update_entry(entry, options=options)
+    await _async_update_listener(hass, entry)
+
+
+async def test_hot_options_apply_in_place(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_reload: MagicMock
+) -> None:
+    """Test the scan interval and command rate change without a reload."""
+    runtime_data: AfterburnerRuntimeData = entry.runtime_data
+    # Polling, and with it the update interval, starts with the first payload
+    runtime_data.coordinator.handle_message({"TempCurrent": 20})
+
+    await _set_options(
+        hass,
+        entry,
+        **{CONF_SCAN_INTERVAL: 90, CONF_COMMAND_BURST: 5, CONF_COMMAND_RATE: 12},
+    )
+
+    mock_reload.assert_not_called()
+    assert runtime_data.coordinator.update_interval == timedelta(seconds=90)
+    assert runtime_data.coordinator.scheduler.base == 90
+    assert runtime_data.api.command_rates == [(5, 0.2)]
+    assert runtime_data.options == dict(entry.options)
+
+
+async def test_storing_defaults_is_not_a_change(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_reload: MagicMock
+) -> None:
+    """Test saving options at their effective defaults changes nothing."""
+    runtime_data: AfterburnerRuntimeData = entry.runtime_data
+
+    await _set_options(
+        hass,
+        entry,
+        **{
+            CONF_SCAN_INTERVAL: int(DEFAULT_POLL_INTERVAL_WS.total_seconds()),
+            CONF_COMMAND_BURST: 0,
+            CONF_PATH: "/",
+        },
+    )
+
+    mock_reload.assert_not_called()
+    assert runtime_data.api.command_rates == []
+    assert runtime_data.options == {}
+
+
+async def test_cold_option_reloads(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_reload: MagicMock
+) -> None:
+    """Test an option the transport only reads at setup reloads the entry."""
+    await _set_options(
+        hass, entry, **{CONF_PATH: "/ws", CONF_COMMAND_BURST: 5}
+    )
+
+    mock_reload.assert_called_once_with(entry.entry_id)
+    # Nothing is applied in place ahead of the reload
+    assert entry.runtime_data.api.command_rates == []
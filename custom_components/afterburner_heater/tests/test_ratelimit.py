@@ -0,0 +1,61 @@
+"""Tests for the command rate limiter."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.afterburner_heater.protocol import (
+    LANE_CONTROL,
+    LANE_REFRESH,
+    LANE_SETTING,
+    CommandRateLimiter,
+    command_lane,
+)
+
+
+def test_command_lanes() -> None:
+    """Test payloads are sorted into control, setting and refresh lanes."""
+    assert command_lane({"Run": "off"}) == LANE_CONTROL
+    assert command_lane({"Run": "heat", "CyclicTemp": 70}) == LANE_CONTROL
+    assert command_lane({"Refresh": 1}) == LANE_REFRESH
+    assert command_lane({"CyclicTemp": 70}) == LANE_SETTING
+    assert command_lane({"Refresh": 1, "GPout1": 1}) == LANE_SETTING
+
+
+def test_lanes_keep_reserves_for_control() -> None:
+    """Test refreshes and settings run out before control commands."""
+    limiter = CommandRateLimiter(burst=10, rate=0.0, now=0.0)
+
+    # Refreshes leave half the bucket
+    assert sum(limiter.acquire(LANE_REFRESH, 0.0) for _ in range(10)) == 5
+    # Settings leave two tokens for control commands
+    assert sum(limiter.acquire(LANE_SETTING, 0.0) for _ in range(10)) == 3
+    assert sum(limiter.acquire(LANE_CONTROL, 0.0) for _ in range(10)) == 2
+
+    assert limiter.dropped == {LANE_REFRESH: 5, LANE_SETTING: 7, LANE_CONTROL: 8}
+
+
+def test_refill_is_capped_at_burst() -> None:
+    """Test tokens refill at the rate up to the burst size."""
+    limiter = CommandRateLimiter(burst=4, rate=0.5, now=0.0)
+    for _ in range(4):
+        assert limiter.acquire(LANE_CONTROL, 0.0)
+    assert not limiter.acquire(LANE_CONTROL, 1.0)
+
+    # Two seconds at 0.5 tokens per second buy one write
+    assert limiter.acquire(LANE_CONTROL, 2.0)
+    assert not limiter.acquire(LANE_CONTROL, 2.0)
+
+    limiter.acquire(LANE_CONTROL, 1000.0)
+    assert limiter.tokens == pytest.approx(3.0)
+
+
+def test_zero_burst_disables_limit() -> None:
+    """Test a burst of zero, the default, lets every write through."""
+    assert not CommandRateLimiter().enabled
+    limiter = CommandRateLimiter(burst=0, now=0.0)
+    assert all(limiter.acquire(LANE_REFRESH, 0.0) for _ in range(100))
+    assert not limiter.dropped
+
+    limiter.configure(burst=2, rate=0.0, now=0.0)
+    assert limiter.acquire(LANE_CONTROL, 0.0)
+    assert not limiter.acquire(LANE_SETTING, 0.0)
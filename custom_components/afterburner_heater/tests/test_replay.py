@@ -0,0 +1,76 @@
+"""Tests for the offline trace replay harness."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.afterburner_heater.protocol import (
+    TRACE_IN,
+    TRACE_OUT,
+    TraceRecorder,
+    models,
+    replay,
+)
+
+
+def _recorder() -> TraceRecorder:
+    trace = TraceRecorder()
+    trace.record(TRACE_OUT, b'{"Refresh":1}')
+    trace.record(TRACE_IN, b'{"TempCurrent":20}{"RunSt')
+    trace.record(TRACE_IN, b'ate":0}')
+    trace.record(TRACE_IN, b'{"InputVoltage":12.5}')
+    return trace
+
+
+def test_binary_dump_round_trip(tmp_path: Path) -> None:
+    """Test a recorder dump replays every inbound message through each stage."""
+    capture = tmp_path / "capture.bin"
+    capture.write_bytes(_recorder().dump())
+
+    records = replay.load_capture(capture)
+    assert [direction for _, direction, _ in records] == [
+        TRACE_OUT,
+        TRACE_IN,
+        TRACE_IN,
+        TRACE_IN,
+    ]
+    stats = replay.replay(records)
+
+    assert (stats.fragments, stats.messages) == (3, 3)
+    assert stats.bytes == sum(len(data) for _, _, data in records[1:])
+    assert set(stats.stage_ns) == set(replay.STAGES)
+    assert all(stage_ns > 0 for stage_ns in stats.stage_ns.values())
+    assert "messages: 3" in stats.report()
+
+
+def test_exported_capture_and_cli(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test the diagnostics export replays and the command line reports it."""
+    capture = tmp_path / "diagnostics.json"
+    document = {"data": {"trace": {"records": _recorder().export()}}}
+    capture.write_text(json.dumps(document))
+
+    assert replay.replay(replay.load_capture(capture)).messages == 3
+    assert replay.main([str(capture), "--repeat", "2"]) == 0
+    assert "messages: 6" in capsys.readouterr().out
+
+
+def test_payloads_are_normalized_once(tmp_path: Path) -> None:
+    """Test the merge stage reuses the normalize stage's result."""
+    capture = tmp_path / "capture.bin"
+    capture.write_bytes(_recorder().dump())
+    records = replay.load_capture(capture)
+
+    with patch.object(
+        models, "normalize_payload", wraps=models.normalize_payload
+    ) as in_merge, patch.object(
+        replay, "normalize_payload", wraps=replay.normalize_payload
+    ) as in_replay:
+        stats = replay.replay(records)
+
+    assert in_replay.call_count == stats.messages
+    assert in_merge.call_count == 0
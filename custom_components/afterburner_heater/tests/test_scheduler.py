@@ -0,0 +1,50 @@
+"""Tests for the adaptive poll scheduler."""
+from __future__ import annotations
+
+from custom_components.afterburner_heater.scheduler import PollScheduler, is_transitional
+
+IDLE = {"RunState": 0, "RunString": "Stopped/Ready"}
+HEATING = {"RunState": 5, "RunString": "Heating"}
+
+
+def test_transitional_run_strings() -> None:
+    """Test start-up and shut-down phases are recognized."""
+    for run_string in ("Starting", "Igniting", "Cooling", "Stopping"):
+        assert is_transitional(run_string)
+    for run_string in ("Stopped/Ready", "Heating", None, 3):
+        assert not is_transitional(run_string)
+
+
+def test_floor_while_transitional_or_after_command() -> None:
+    """Test the floor applies during transitions and after commands."""
+    scheduler = PollScheduler(base=60, floor=10, ceiling=600, now=0)
+
+    assert scheduler.next_interval({"RunString": "Igniting"}, None, 10) == 10
+    assert scheduler.next_interval(HEATING, None, 20) == 60
+    assert scheduler.next_interval(HEATING, last_command=15, now=30) == 10
+    assert scheduler.urgent(HEATING, last_command=15, now=30) is False
+    scheduler.interval = 60
+    assert scheduler.urgent(HEATING, last_command=15, now=30) is True
+
+
+def test_backs_off_while_idle_and_stable() -> None:
+    """Test idle polls double up to the ceiling and count saved refreshes."""
+    scheduler = PollScheduler(base=60, floor=10, ceiling=600, now=0)
+    scheduler.observe(IDLE, 0)
+
+    # Not yet stable long enough
+    assert scheduler.next_interval(IDLE, None, 100) == 60
+    intervals = [scheduler.next_interval(IDLE, None, now) for now in (400, 600, 900, 1500, 2100)]
+    assert intervals == [120, 240, 480, 600, 600]
+    assert scheduler.saved == 1 + 3 + 7 + 9 + 9
+
+    # A state change resets to the base interval
+    scheduler.observe(HEATING, 2200)
+    assert scheduler.next_interval(HEATING, None, 2200) == 60
+
+
+def test_disabled_when_bounds_equal() -> None:
+    """Test equal floor and ceiling keep the base interval."""
+    scheduler = PollScheduler(base=60, floor=60, ceiling=60, now=0)
+    assert not scheduler.wants_floor({"RunString": "Starting"}, 0, 1)
+    assert scheduler.next_interval({"RunString": "Starting"}, 0, 1) == 60
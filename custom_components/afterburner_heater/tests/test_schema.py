@@ -0,0 +1,70 @@
+"""Tests for the command registry."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.afterburner_heater.protocol import (
+    COMMAND_SPECS,
+    PLATFORM_NUMBER,
+    PLATFORM_SELECT,
+    PLATFORM_SWITCH,
+    coerce_settings,
+    echo_keys,
+    encode_setting,
+    pack_commands,
+    specs_for_platform,
+)
+
+
+def test_specs_coerce_and_validate() -> None:
+    """Test values are converted to wire types and limits are enforced."""
+    assert COMMAND_SPECS["CyclicTemp"].coerce("21") == 21.0
+    assert COMMAND_SPECS["GPout1"].coerce(True) == 1
+    assert COMMAND_SPECS["GPout1"].coerce("off") == 0
+    assert COMMAND_SPECS["FixedDemand"].coerce(None) is None
+    assert COMMAND_SPECS["ThermostatMode"].coerce("Deadband") == "Deadband"
+
+    for key, value in (
+        ("CyclicTemp", 41),
+        ("CyclicTemp", "warm"),
+        ("CyclicTemp", None),
+        ("GPout1", 2),
+        ("ThermostatMode", "Eco"),
+        ("Run", "on"),
+    ):
+        with pytest.raises(ValueError):
+            COMMAND_SPECS[key].coerce(value)
+
+
+def test_coerce_settings_passes_unknown_keys() -> None:
+    """Test unregistered keys are left for raw commands."""
+    assert coerce_settings({"CyclicEnb": "1", "Custom": "x"}) == {
+        "CyclicEnb": 1,
+        "Custom": "x",
+    }
+    assert encode_setting("CyclicOn", -1) == b'{"CyclicOn":-1.0}'
+
+
+def test_platform_specs() -> None:
+    """Test entity platforms are derived from the registry."""
+    assert [spec.key for spec in specs_for_platform(PLATFORM_SWITCH)] == [
+        "CyclicEnb",
+        "FrostEnable",
+        "Thermostat",
+        "GPout1",
+        "GPout2",
+    ]
+    assert [spec.key for spec in specs_for_platform(PLATFORM_SELECT)] == [
+        "ThermostatMode",
+        "FrostMode",
+    ]
+    assert "Run" not in {spec.key for spec in specs_for_platform(PLATFORM_NUMBER)}
+
+
+def test_echo_and_packing_follow_registry() -> None:
+    """Test Run is acknowledged via RunState and written on its own."""
+    assert echo_keys({"Run": "heat", "CyclicTemp": 21}) == {"RunState", "CyclicTemp"}
+    assert pack_commands({"CyclicTemp": 21, "Run": "heat", "GPout1": 1}) == [
+        {"Run": "heat"},
+        {"CyclicTemp": 21, "GPout1": 1},
+    ]
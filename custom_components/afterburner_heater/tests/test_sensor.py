@@ -0,0 +1,116 @@
+"""Tests for the sensor write filter."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.afterburner_heater.api.base import HeaterApi
+from custom_components.afterburner_heater.const import DOMAIN
+from custom_components.afterburner_heater.coordinator import AfterburnerCoordinator
+from custom_components.afterburner_heater.entities.sensor import (
+    SENSOR_DESCRIPTIONS,
+    AfterburnerSensor,
+)
+from custom_components.afterburner_heater.protocol import HeaterState
+
+pytestmark = pytest.mark.asyncio
+
+
+class _IdleApi(HeaterApi):
+    """HeaterApi that never talks to a heater."""
+
+    def __init__(self) -> None:
+        super().__init__(lambda payload: None)
+
+    async def async_start(self) -> None:
+        """Nothing to start."""
+
+    async def async_stop(self) -> None:
+        """Nothing to stop."""
+
+    async def async_send_json(self, payload: dict[str, Any]) -> None:
+        """Nothing to send."""
+
+    async def async_request_refresh(self) -> None:
+        """Nothing to refresh."""
+
+
+def _sensor(hass: HomeAssistant, key: str) -> AfterburnerSensor:
+    entry = MockConfigEntry(domain=DOMAIN, title="Heater")
+    entry.add_to_hass(hass)
+    coordinator = AfterburnerCoordinator(
+        hass, entry, _IdleApi(), timedelta(seconds=60)
+    )
+    coordinator.last_update_success = True
+    description = next(d for d in SENSOR_DESCRIPTIONS if d.key == key)
+    sensor = AfterburnerSensor(coordinator, entry, description)
+    sensor.hass = hass
+    sensor.async_write_ha_state = MagicMock()
+    return sensor
+
+
+def _update(sensor: AfterburnerSensor, value: Any) -> None:
+    sensor.coordinator.data = HeaterState(raw={sensor.entity_description.key: value})
+    sensor._handle_coordinator_update()
+
+
+async def test_deadband_filters_small_changes(hass: HomeAssistant) -> None:
+    """Test a 0.1 V deadband drops smaller steps but not a 0.1 V step."""
+    sensor = _sensor(hass, "InputVoltage")
+    writes = sensor.async_write_ha_state
+
+    _update(sensor, 12.5)
+    _update(sensor, 12.55)
+    _update(sensor, 12.5)
+    assert writes.call_count == 1
+
+    _update(sensor, 12.6)
+    _update(sensor, 13.1)
+    _update(sensor, 13.0)
+    assert writes.call_count == 4
+
+
+async def test_min_interval_holds_then_writes(hass: HomeAssistant) -> None:
+    """Test a change inside the hold is written once the hold ends."""
+    sensor = _sensor(hass, "Humidity")
+    writes = sensor.async_write_ha_state
+
+    _update(sensor, 45.0)
+    _update(sensor, 47.0)
+    _update(sensor, 48.0)
+    assert writes.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert writes.call_count == 2
+    assert sensor.native_value == 48.0
+
+    # A change that reverts within the hold is not written
+    _update(sensor, 50.0)
+    _update(sensor, 48.0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=122))
+    await hass.async_block_till_done()
+    assert writes.call_count == 2
+
+
+async def test_availability_change_always_written(hass: HomeAssistant) -> None:
+    """Test going unavailable and back is written inside the deadband."""
+    sensor = _sensor(hass, "InputVoltage")
+    writes = sensor.async_write_ha_state
+
+    _update(sensor, 12.5)
+    sensor.coordinator.last_update_success = False
+    _update(sensor, 12.5)
+    sensor.coordinator.last_update_success = True
+    _update(sensor, 12.52)
+    assert writes.call_count == 3
@@ -0,0 +1,287 @@
+"""Tests for the integration services and their heater targeting."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util.yaml import load_yaml_dict
+
+from custom_components.afterburner_heater import (
+    _SETTING_SERVICES,
+    AfterburnerRuntimeData,
+    _async_register_services,
+)
+from custom_components.afterburner_heater.api.base import HeaterApi
+from custom_components.afterburner_heater.const import (
+    DATA_DEVICE_INDEX,
+    DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+    SERVICE_SEND_JSON,
+    TRANSPORT_WEBSOCKET,
+)
+from custom_components.afterburner_heater.coordinator import AfterburnerCoordinator
+from custom_components.afterburner_heater.protocol import COMMAND_SPECS, KIND_CHOICE
+
+pytestmark = pytest.mark.asyncio
+
+
+class _ServiceApi(HeaterApi):
+    """HeaterApi recording writes and how many heaters write at once."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self) -> None:
+        super().__init__(lambda payload: None)
+        self.sent: list[dict[str, Any]] = []
+        self.payload_limit: int | None = None
+        # Called with each write the heater should echo back
+        self.echo: Callable[[dict[str, Any]], None] | None = None
+
+    @property
+    def max_payload_size(self) -> int | None:
+        return self.payload_limit
+
+    async def async_start(self) -> None:
+        """Nothing to start."""
+
+    async def async_stop(self) -> None:
+        """Nothing to stop."""
+
+    async def async_send_json(self, payload: dict[str, Any]) -> None:
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            cls.active -= 1
+        self.sent.append(payload)
+        if self.echo is not None:
+            self.echo(payload)
+
+
+@pytest.fixture
+async def heaters(
+    hass: HomeAssistant,
+) -> AsyncGenerator[dict[str, AfterburnerRuntimeData], None]:
+    """Set up three heaters with devices and services, as setup would."""
+    _ServiceApi.active = _ServiceApi.peak = 0
+    device_registry = dr.async_get(hass)
+    runtimes: dict[str, AfterburnerRuntimeData] = {}
+    for index in range(3):
+        entry = MockConfigEntry(domain=DOMAIN, title=f"Heater {index}")
+        entry.add_to_hass(hass)
+        api = _ServiceApi()
+        runtimes[entry.entry_id] = AfterburnerRuntimeData(
+            coordinator=AfterburnerCoordinator(
+                hass, entry, api, timedelta(seconds=60)
+            ),
+            api=api,
+            transport=TRANSPORT_WEBSOCKET,
+        )
+        device = device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+        )
+        hass.data.setdefault(DATA_DEVICE_INDEX, {})[device.id] = entry.entry_id
+    hass.data[DOMAIN] = dict(runtimes)
+    await _async_register_services(hass)
+    yield runtimes
+    for runtime_data in runtimes.values():
+        await runtime_data.coordinator.async_stop()
+
+
+def _device_id(hass: HomeAssistant, entry_id: str) -> str:
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry_id)})
+    assert device is not None
+    return device.id
+
+
+async def _send(hass: HomeAssistant, **data: Any) -> dict[str, Any]:
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEND_JSON,
+        {"cmd": "GPout1", "value": 1, **data},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    return response["heaters"]
+
+
+async def test_untargeted_calls_reach_every_heater(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test calls without a target address every heater and report each."""
+    results = await _send(hass)
+
+    assert set(results) == set(heaters)
+    for entry_id, result in results.items():
+        assert heaters[entry_id].api.sent == [{"GPout1": 1}]
+        assert result == {
+            "name": heaters[entry_id].coordinator.name,
+            "suppressed": False,
+            "success": True,
+            "latency_ms": result["latency_ms"],
+            "error": None,
+        }
+        assert result["latency_ms"] >= 0
+
+
+async def test_device_entity_and_area_targets(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test device, entity and area targets select only their heaters."""
+    first, second, third = heaters
+    entity = er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{second}_temperature",
+        config_entry=hass.config_entries.async_get_entry(second),
+    )
+    area = ar.async_get(hass).async_create("Garage")
+    dr.async_get(hass).async_update_device(
+        _device_id(hass, third), area_id=area.id
+    )
+
+    assert set(await _send(hass, device_id=_device_id(hass, first))) == {first}
+    assert set(await _send(hass, entity_id=entity.entity_id)) == {second}
+    assert set(await _send(hass, area_id=area.id)) == {third}
+    assert set(
+        await _send(hass, device_id=_device_id(hass, first), area_id=area.id)
+    ) == {first, third}
+
+
+async def test_unknown_target_raises(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test a target matching no heater fails instead of reaching all."""
+    other = MockConfigEntry(domain="other")
+    other.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=other.entry_id, identifiers={("other", "lamp")}
+    )
+
+    for target in ({"entity_id": "sensor.missing"}, {"device_id": device.id}):
+        with pytest.raises(HomeAssistantError, match="No Afterburner heaters"):
+            await _send(hass, **target)
+    assert all(not runtime_data.api.sent for runtime_data in heaters.values())
+
+
+async def test_max_concurrency_limits_parallel_writes(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test max_concurrency bounds how many heaters are written at once."""
+    await _send(hass, max_concurrency=1)
+    assert _ServiceApi.peak == 1
+
+    await _send(hass, cmd="GPout2")
+    assert _ServiceApi.peak == len(heaters)
+    assert all(len(runtime_data.api.sent) == 2 for runtime_data in heaters.values())
+
+
+async def _apply(
+    hass: HomeAssistant, heater: AfterburnerRuntimeData, **data: Any
+) -> dict[str, Any]:
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        {
+            "device_id": _device_id(hass, heater.coordinator.config_entry.entry_id),
+            "wait_for_echo": True,
+            **data,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    [result] = response["heaters"].values()
+    return result
+
+
+async def test_apply_settings_packs_and_waits_for_echo(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test settings are coerced, packed into writes and confirmed by echo."""
+    heater = next(iter(heaters.values()))
+    heater.api.payload_limit = 40
+    heater.api.echo = heater.coordinator.handle_message
+
+    result = await _apply(
+        hass,
+        heater,
+        settings={
+            "CyclicTemp": "21",
+            "CyclicOn": -1,
+            "CyclicOff": 2,
+            "FrostEnable": True,
+            "ThermostatMode": "Deadband",
+        },
+    )
+
+    assert heater.api.sent == [
+        {"CyclicTemp": 21.0, "CyclicOn": -1.0},
+        {"CyclicOff": 2.0, "FrostEnable": 1},
+        {"ThermostatMode": "Deadband"},
+    ]
+    assert result["applied"] == [
+        "CyclicOff",
+        "CyclicOn",
+        "CyclicTemp",
+        "FrostEnable",
+        "ThermostatMode",
+    ]
+    assert result["writes"] == 3
+    assert result["echoed"] is True
+    assert result["missing_echo"] == []
+    assert result["success"] is True
+
+
+async def test_apply_settings_reports_missing_echo(
+    hass: HomeAssistant, heaters: dict[str, AfterburnerRuntimeData]
+) -> None:
+    """Test keys the heater never echoes are reported once the wait times out."""
+    heater = next(iter(heaters.values()))
+    # The heater only confirms the cyclic temperature
+    heater.api.echo = lambda payload: heater.coordinator.handle_message(
+        {"CyclicTemp": payload["CyclicTemp"]}
+    )
+
+    result = await _apply(
+        hass, heater, settings={"CyclicTemp": 21, "FrostOn": 5}, timeout=0.1
+    )
+
+    assert heater.api.sent == [{"CyclicTemp": 21.0, "FrostOn": 5}]
+    assert result["echoed"] is False
+    assert result["missing_echo"] == ["FrostOn"]
+    # A missing echo is reported, not raised
+    assert result["success"] is True
+    assert not heater.coordinator._echo_waiters
+
+
+async def test_choice_selectors_match_registry() -> None:
+    """Test setting services offer exactly the options their spec accepts."""
+    services = load_yaml_dict(str(Path(__file__).parents[1] / "services.yaml"))
+
+    choices = {
+        service: spec.options
+        for service, key in _SETTING_SERVICES.items()
+        if (spec := COMMAND_SPECS[key]).kind == KIND_CHOICE
+    }
+    assert choices
+    for service, options in choices.items():
+        selector = services[service]["fields"]["value"]["selector"]
+        assert tuple(selector["select"]["options"]) == options
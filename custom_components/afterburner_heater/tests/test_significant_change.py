@@ -0,0 +1,48 @@
+"""Tests for the sensor significant change checks."""
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfTemperature,
+)
+
+from custom_components.afterburner_heater.significant_change import (
+    async_check_significant_change,
+)
+
+HUMIDITY = {
+    ATTR_DEVICE_CLASS: SensorDeviceClass.HUMIDITY,
+    ATTR_UNIT_OF_MEASUREMENT: PERCENTAGE,
+}
+VOLTAGE = {
+    ATTR_DEVICE_CLASS: SensorDeviceClass.VOLTAGE,
+    ATTR_UNIT_OF_MEASUREMENT: UnitOfElectricPotential.VOLT,
+}
+TEMPERATURE = {
+    ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
+    ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS,
+}
+
+
+def test_deadbands_from_sensor_descriptions() -> None:
+    """Test changes are significant once they reach the declared deadband."""
+    assert not async_check_significant_change(None, "45.0", HUMIDITY, "45.6", HUMIDITY)
+    assert async_check_significant_change(None, "45.0", HUMIDITY, "46.0", HUMIDITY)
+    assert not async_check_significant_change(None, "12.60", VOLTAGE, "12.65", VOLTAGE)
+    assert async_check_significant_change(None, "12.6", VOLTAGE, "12.4", VOLTAGE)
+    # One deadband step despite float error
+    assert async_check_significant_change(None, "12.5", VOLTAGE, "12.6", VOLTAGE)
+
+
+def test_unfiltered_and_non_numeric_states() -> None:
+    """Test sensors without a deadband and unavailable states."""
+    assert (
+        async_check_significant_change(None, "20.0", TEMPERATURE, "20.1", TEMPERATURE)
+        is None
+    )
+    assert async_check_significant_change(None, "unavailable", VOLTAGE, "12.6", VOLTAGE)
+    assert async_check_significant_change(None, "45", HUMIDITY, "12.6", VOLTAGE)
@@ -0,0 +1,61 @@
+"""Tests for the rolling statistics."""
+from __future__ import annotations
+
+from custom_components.afterburner_heater.protocol import (
+    DutyCycle,
+    HeaterStatistics,
+    RollingStats,
+)
+
+
+def test_rolling_min_max_and_ewma() -> None:
+    """Test the window extremes expire and the EWMA moves by half-lives."""
+    stats = RollingStats(window=100, half_life=10)
+    for now, value in ((0, 5.0), (10, 3.0), (20, 8.0), (30, 4.0)):
+        stats.record(value, now)
+
+    assert stats.minimum(30) == 3.0
+    assert stats.maximum(30) == 8.0
+    # 3.0 left the window, 8.0 not yet
+    assert stats.minimum(115) == 4.0
+    assert stats.maximum(115) == 8.0
+    # Only the latest sample is left, and it still holds
+    assert stats.maximum(500) == 4.0
+
+    ewma = RollingStats(half_life=10)
+    ewma.record(0.0, 0)
+    ewma.record(10.0, 10)
+    assert ewma.ewma == 5.0
+
+
+def test_duty_cycle_over_window() -> None:
+    """Test the on percentage covers only the window."""
+    duty = DutyCycle(window=100)
+    assert duty.value(0) is None
+    duty.record(False, 0)
+    duty.record(True, 10)
+    duty.record(False, 30)
+    duty.record(True, 50)
+
+    assert duty.value(60) == 50.0
+    assert duty.value(150) == 100.0
+    duty.record(False, 160)
+    assert duty.value(200) == 60.0
+
+
+def test_heater_statistics_snapshot() -> None:
+    """Test only keys carried by a payload are recorded."""
+    statistics = HeaterStatistics(keys=("TempCurrent",))
+    statistics.observe(
+        {"TempCurrent", "RunState"}, {"TempCurrent": 20.0, "RunState": True}, 0
+    )
+    # A stale normalized value is not recorded again
+    statistics.observe({"RunState"}, {"TempCurrent": 20.0, "RunState": True}, 100)
+    statistics.observe({"TempCurrent"}, {"TempCurrent": 22.0, "RunState": True}, 300)
+
+    assert statistics.snapshot(600) == {
+        "TempCurrent_mean": 21.0,
+        "TempCurrent_min": 20.0,
+        "TempCurrent_max": 22.0,
+        "run_duty_cycle": 100.0,
+    }
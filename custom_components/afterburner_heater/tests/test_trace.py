@@ -0,0 +1,109 @@
+"""Tests for the wire trace recorder and its redaction."""
+from __future__ import annotations
+
+import struct
+from unittest.mock import patch
+
+from custom_components.afterburner_heater.diagnostics import redact_trace
+from custom_components.afterburner_heater.protocol import (
+    TRACE_IN,
+    TRACE_OUT,
+    TraceRecorder,
+    iter_records,
+)
+
+# Mirrors the documented dump layout: int64 ns, uint8 direction, uint16 length
+_HEADER = struct.Struct("<qBH")
+
+
+def _clock(*seconds: float) -> object:
+    return patch(
+        "custom_components.afterburner_heater.protocol.trace.time.monotonic_ns",
+        side_effect=[int(value * 1e9) for value in seconds],
+    )
+
+
+def test_record_and_export() -> None:
+    """Test records keep their order, direction and payload."""
+    trace = TraceRecorder()
+    with _clock(1, 2, 3, 4):
+        trace.record(TRACE_OUT, b'{"Refresh":1}')
+        trace.record(TRACE_IN, bytearray(b'{"RunState":0}'))
+        trace.record(TRACE_IN, b"\xff")
+        exported = trace.export()
+
+    assert len(trace) == 3
+    assert trace.size == 3 * _HEADER.size + 13 + 14 + 1
+    assert exported == [
+        {"t": -3.0, "dir": "out", "data": '{"Refresh":1}'},
+        {"t": -2.0, "dir": "in", "data": '{"RunState":0}'},
+        {"t": -1.0, "dir": "in", "data": "\ufffd"},
+    ]
+    with _clock(4):
+        assert [record["t"] for record in trace.export(window=2.5)] == [-2.0, -1.0]
+
+
+def test_ring_wraparound() -> None:
+    """Test the oldest records are evicted past the byte budget."""
+    entry_size = _HEADER.size + 4
+    trace = TraceRecorder(max_bytes=3 * entry_size)
+    for index in range(5):
+        trace.record(TRACE_IN, b"%04d" % index)
+
+    assert len(trace) == 3
+    assert trace.size == 3 * entry_size
+    assert trace.dropped == 2
+    assert [data for _, _, data in iter_records(trace.dump())] == [
+        b"0002",
+        b"0003",
+        b"0004",
+    ]
+
+    trace.clear()
+    assert (len(trace), trace.size, trace.dropped) == (0, 0, 0)
+    assert trace.dump() == b""
+
+
+def test_oversized_fragments_are_truncated() -> None:
+    """Test a fragment longer than the length field holds is cut to fit."""
+    trace = TraceRecorder()
+    trace.record(TRACE_IN, b"x" * 0x10005)
+
+    [(_, _, data)] = iter_records(trace.dump())
+    assert len(data) == 0xFFFF
+
+
+def test_dump_layout() -> None:
+    """Test the binary dump is header plus payload per record, back to back."""
+    trace = TraceRecorder()
+    with _clock(1.5, 2.25):
+        trace.record(TRACE_OUT, b'{"Run":1}')
+        trace.record(TRACE_IN, b"")
+
+    blob = trace.dump()
+    assert blob == (
+        _HEADER.pack(1_500_000_000, TRACE_OUT, 9)
+        + b'{"Run":1}'
+        + _HEADER.pack(2_250_000_000, TRACE_IN, 0)
+    )
+    assert list(iter_records(blob)) == [
+        (1_500_000_000, TRACE_OUT, b'{"Run":1}'),
+        (2_250_000_000, TRACE_IN, b""),
+    ]
+    # A truncated trailing header is ignored
+    assert len(list(iter_records(blob + b"\x00" * 3))) == 2
+
+
+def test_redact_trace() -> None:
+    """Test sensitive string values are masked inside raw trace text."""
+    records = [
+        {"t": -1.0, "dir": "out", "data": '{"Password": "se\\"cret", "Run":1}'},
+        {"t": -0.5, "dir": "in", "data": '{"mUser":"admin"}{"mPasswd" :"x"}'},
+        {"t": 0.0, "dir": "in", "data": '{"TempCurrent":20}'},
+    ]
+
+    assert [record["data"] for record in redact_trace(records)] == [
+        '{"Password": "**REDACTED**", "Run":1}',
+        '{"mUser":"**REDACTED**"}{"mPasswd" :"**REDACTED**"}',
+        '{"TempCurrent":20}',
+    ]
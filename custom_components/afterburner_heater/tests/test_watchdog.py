@@ -0,0 +1,52 @@
+"""Tests for the staleness watchdog."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.afterburner_heater.watchdog import StalenessWatchdog
+
+
+def test_fallback_until_cadence_learned() -> None:
+    """Test the poll-derived threshold applies before any cadence is known."""
+    watchdog = StalenessWatchdog(fallback_stale_after=120.0, now=0.0)
+    watchdog.observe({"TempCurrent": 20}, 5.0)
+
+    assert watchdog.interval is None
+    assert watchdog.stale_after == 120.0
+    assert not watchdog.is_stale(125.0)
+    assert watchdog.is_stale(125.1)
+
+
+def test_learns_periodic_cadence() -> None:
+    """Test the threshold follows the periodic push interval."""
+    watchdog = StalenessWatchdog(fallback_stale_after=120.0, now=0.0)
+    now = 0.0
+    for _ in range(20):
+        now += 12.0
+        watchdog.observe({"Humidity": 40, "Pressure": 1013}, now)
+
+    assert watchdog.interval == pytest.approx(12.0)
+    # Three missed pushes, well below the fallback
+    assert watchdog.stale_after == pytest.approx(36.0, abs=1.0)
+    assert not watchdog.is_stale(now + 30.0)
+    assert watchdog.is_stale(now + 40.0)
+
+
+def test_outages_and_bursts_are_not_learned() -> None:
+    """Test gaps beyond the threshold and same-burst pushes are ignored."""
+    watchdog = StalenessWatchdog(fallback_stale_after=120.0, now=0.0)
+    watchdog.observe({"Humidity": 40}, 10.0)
+    watchdog.observe({"Humidity": 40}, 10.2)
+    watchdog.observe({"Humidity": 40}, 500.0)
+
+    assert watchdog.interval is None
+
+
+def test_reconnect_restarts_window() -> None:
+    """Test forcing a reconnect restarts the staleness window."""
+    watchdog = StalenessWatchdog(fallback_stale_after=60.0, now=0.0)
+    assert watchdog.is_stale(61.0)
+    watchdog.reconnected(61.0)
+
+    assert not watchdog.is_stale(100.0)
+    assert watchdog.forced_reconnects == 1
@@ -0,0 +1,207 @@
+"""End-to-end throughput and latency benchmarks against simulated heaters."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.afterburner_heater.api.ws import WebSocketHeaterApi
+from custom_components.afterburner_heater.const import DOMAIN
+from custom_components.afterburner_heater.coordinator import AfterburnerCoordinator
+from custom_components.afterburner_heater.protocol import DEFAULT_REFRESH_SPACING
+
+from .simulator import REFRESH_DUMP, HeaterSimulator, percentile, start_fleet
+
+# The simulators listen on local sockets
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("socket_enabled")]
+
+REFRESH_ROUNDS = 5
+COMMANDS_PER_HEATER = 20
+# Regression bounds, loose enough for a loaded CI runner
+MIN_REFRESH_THROUGHPUT = 200  # msg/s
+MAX_ECHO_P95 = 0.5  # s
+
+
+class _Heater:
+    """A WebSocket API and coordinator wired to one simulator."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        simulator: HeaterSimulator,
+        refresh_spacing: float = DEFAULT_REFRESH_SPACING,
+    ) -> None:
+        self.simulator = simulator
+        self.messages = 0
+        self.dump_complete = asyncio.Event()
+        entry = MockConfigEntry(domain=DOMAIN, title=f"Heater {simulator.port}")
+        entry.add_to_hass(hass)
+        self.api = WebSocketHeaterApi(
+            hass,
+            simulator.host,
+            simulator.port,
+            "/",
+            self._on_message,
+            init_message={"Refresh": 1},
+            refresh_spacing=refresh_spacing,
+            # Measures the link, so commands are never rate limited
+            command_burst=0,
+        )
+        self.coordinator = AfterburnerCoordinator(
+            hass, entry, self.api, timedelta(seconds=60)
+        )
+
+    def _on_message(self, payload: dict[str, Any]) -> None:
+        self.messages += 1
+        if self.messages >= len(REFRESH_DUMP):
+            self.dump_complete.set()
+        self.coordinator.handle_message(payload)
+
+    async def wait_for_messages(self, count: int, timeout: float = 10) -> None:
+        deadline = time.monotonic() + timeout
+        while self.messages < count:
+            assert time.monotonic() < deadline, "simulator did not answer in time"
+            await asyncio.sleep(0.001)
+
+    async def wait_until_refresh_sent(self, timeout: float = 10) -> None:
+        """Wait until a refresh request would be sent rather than shared."""
+        gate = self.api._client.refresh_gate
+        deadline = time.monotonic() + timeout
+        while gate.would_share:
+            assert time.monotonic() < deadline, "refresh dump did not settle"
+            await asyncio.sleep(0.01)
+
+
+async def _start_heaters(
+    hass: HomeAssistant,
+    count: int,
+    refresh_spacing: float = DEFAULT_REFRESH_SPACING,
+    **kwargs: Any,
+) -> tuple[list[HeaterSimulator], list[_Heater], float]:
+    """Connect to ``count`` simulators and return time to the first full dump."""
+    simulators = await start_fleet(count, push_interval=None, **kwargs)
+    heaters = [
+        _Heater(hass, simulator, refresh_spacing) for simulator in simulators
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(*(heater.api.async_start() for heater in heaters))
+    await asyncio.wait_for(
+        asyncio.gather(*(heater.dump_complete.wait() for heater in heaters)), 30
+    )
+    return simulators, heaters, time.perf_counter() - started
+
+
+async def _stop_heaters(
+    simulators: list[HeaterSimulator], heaters: list[_Heater]
+) -> None:
+    await asyncio.gather(*(heater.coordinator.async_stop() for heater in heaters))
+    await asyncio.gather(*(simulator.stop() for simulator in simulators))
+
+
+async def test_simulator_answers_refresh(
+    hass: HomeAssistant, heater_simulator: HeaterSimulator
+) -> None:
+    """Test the simulator streams the full dump and echoes commands."""
+    heater = _Heater(hass, heater_simulator)
+    await heater.api.async_start()
+    await asyncio.wait_for(heater.dump_complete.wait(), 10)
+    assert heater.coordinator.data.raw["RunString"] == "Stopped/Ready"
+
+    waiter = heater.coordinator.async_track_echo(["TempDesired"])
+    await heater.api.async_send_json({"TempDesired": 23})
+    assert await heater.coordinator.async_wait_echo(waiter, 5) == set()
+    assert heater.coordinator.data.raw["TempDesired"] == 23
+
+    await heater.coordinator.async_stop()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 10, 100])
+async def test_refresh_throughput(
+    hass: HomeAssistant, record_property: Callable[[str, object], None], count: int
+) -> None:
+    """Benchmark connect, first full dump and refresh throughput."""
+    # Back-to-back refreshes would otherwise share the previous dump
+    simulators, heaters, first_dump = await _start_heaters(
+        hass, count, refresh_spacing=0
+    )
+
+    elapsed = 0.0
+    for round_number in range(1, REFRESH_ROUNDS + 1):
+        # A dump still settling is shared even without spacing
+        await asyncio.gather(*(heater.wait_until_refresh_sent() for heater in heaters))
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(heater.api.async_request_refresh() for heater in heaters)
+        )
+        expected = len(REFRESH_DUMP) * (round_number + 1)
+        await asyncio.gather(
+            *(heater.wait_for_messages(expected) for heater in heaters)
+        )
+        elapsed += time.perf_counter() - started
+    throughput = len(REFRESH_DUMP) * REFRESH_ROUNDS * count / elapsed
+
+    record_property("first_dump_ms", round(first_dump * 1000, 1))
+    record_property("messages_per_second", round(throughput))
+    assert throughput >= MIN_REFRESH_THROUGHPUT
+    assert all(heater.coordinator.last_update_success for heater in heaters)
+    assert all(
+        simulator.stats.refreshes == REFRESH_ROUNDS + 1 for simulator in simulators
+    )
+    await _stop_heaters(simulators, heaters)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 10, 100])
+async def test_command_echo_latency(
+    hass: HomeAssistant, record_property: Callable[[str, object], None], count: int
+) -> None:
+    """Benchmark command-to-echo latency with injected network latency."""
+    simulators, heaters, _ = await _start_heaters(
+        hass, count, latency=0.005, jitter=0.01, seed=1
+    )
+
+    async def _measure(heater: _Heater) -> list[float]:
+        samples = []
+        for value in range(COMMANDS_PER_HEATER):
+            waiter = heater.coordinator.async_track_echo(["TempDesired"])
+            started = time.perf_counter()
+            await heater.api.async_send_json({"TempDesired": 15 + value % 10})
+            missing = await heater.coordinator.async_wait_echo(waiter, 5)
+            heater.coordinator.async_cancel_echo(waiter)
+            assert not missing
+            samples.append(time.perf_counter() - started)
+        return samples
+
+    results = await asyncio.gather(*(_measure(heater) for heater in heaters))
+    samples = [sample for result in results for sample in result]
+    p95 = percentile(samples, 0.95)
+
+    record_property("echo_p50_ms", round(percentile(samples, 0.5) * 1000, 1))
+    record_property("echo_p95_ms", round(p95 * 1000, 1))
+    assert len(samples) == count * COMMANDS_PER_HEATER
+    assert p95 <= MAX_ECHO_P95
+    await _stop_heaters(simulators, heaters)
+
+
+async def test_dropped_messages_are_counted(hass: HomeAssistant) -> None:
+    """Test an unreliable link loses replies without stalling the transport."""
+    simulators, heaters, _ = await _start_heaters(hass, 1)
+    simulator, heater = simulators[0], heaters[0]
+    simulator.drop_rate = 1.0
+
+    waiter = heater.coordinator.async_track_echo(["TempDesired"])
+    await heater.api.async_send_json({"TempDesired": 25})
+    assert await heater.coordinator.async_wait_echo(waiter, 0.2) == {"TempDesired"}
+    heater.coordinator.async_cancel_echo(waiter)
+    assert simulator.stats.messages_dropped == 1
+    assert simulator.state["TempDesired"] == 25
+
+    await _stop_heaters(simulators, heaters)
@@ -0,0 +1,95 @@
+"""Staleness watchdog that learns a heater's periodic push cadence.
+
+The firmware pushes ``PERIODIC_UPDATE_FIELDS`` every ~10-13 seconds without
+being asked. The watchdog keeps a smoothed mean and deviation of their
+inter-arrival time (as TCP does for round trip times) and considers the link
+stale once nothing has arrived for several learned periods. Until a cadence
+is learned, the fallback threshold derived from the poll interval applies.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import PERIODIC_UPDATE_FIELDS
+
+# Bounds for the learned staleness threshold in seconds
+_MIN_STALE_AFTER = 30.0
+_MAX_STALE_AFTER = 300.0
+# Missed periodic pushes tolerated before the link counts as stale
+_MISSED_PERIODS = 3
+# Pushes closer together than this belong to the same burst (e.g. a refresh)
+_MIN_INTERVAL = 1.0
+# Smoothing gains for the interval mean and deviation
+_ALPHA = 0.125
+_BETA = 0.25
+
+
+class StalenessWatchdog:
+    """Decide when a heater's data is stale from its learned push cadence."""
+
+    def __init__(self, fallback_stale_after: float, now: float) -> None:
+        self.fallback_stale_after = fallback_stale_after
+        self.interval: float | None = None
+        self.deviation = 0.0
+        self.forced_reconnects = 0
+        self._last_periodic: float | None = None
+        self._last_activity = now
+
+    @property
+    def stale_after(self) -> float:
+        """Return seconds without data after which the link is stale."""
+        if self.interval is None:
+            return self.fallback_stale_after
+        learned = max(
+            self.interval * _MISSED_PERIODS, self.interval + 4 * self.deviation
+        )
+        return min(
+            max(learned, _MIN_STALE_AFTER),
+            _MAX_STALE_AFTER,
+            self.fallback_stale_after,
+        )
+
+    def observe(self, payload: Mapping[str, Any], now: float) -> None:
+        """Record a payload received at ``now``."""
+        self._last_activity = now
+        if PERIODIC_UPDATE_FIELDS.isdisjoint(payload):
+            return
+        last, self._last_periodic = self._last_periodic, now
+        if last is None:
+            return
+        interval = now - last
+        # Gaps longer than the threshold are outages, not cadence
+        if interval < _MIN_INTERVAL or interval > self.stale_after:
+            return
+        if self.interval is None:
+            self.interval = interval
+            self.deviation = interval / 2
+            return
+        self.deviation += _BETA * (abs(interval - self.interval) - self.deviation)
+        self.interval += _ALPHA * (interval - self.interval)
+
+    def quiet_for(self, now: float) -> float:
+        """Return seconds since anything arrived."""
+        return now - self._last_activity
+
+    def is_stale(self, now: float) -> bool:
+        """Return whether nothing has arrived for longer than the threshold."""
+        return self.quiet_for(now) > self.stale_after
+
+    def reconnected(self, now: float) -> None:
+        """Restart the staleness window after forcing a reconnect."""
+        self.forced_reconnects += 1
+        self._last_activity = now
+        # The push phase is unknown after reconnecting
+        self._last_periodic = None
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the learned cadence for diagnostics."""
+        return {
+            "interval_s": None if self.interval is None else round(self.interval, 2),
+            "deviation_s": round(self.deviation, 2),
+            "stale_after_s": round(self.stale_after, 1),
+            "seconds_since_activity": round(self.quiet_for(now), 1),
+            "forced_reconnects": self.forced_reconnects,
+        }
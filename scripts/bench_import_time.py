@@ -0,0 +1,87 @@
+"""Import-time benchmark for the Afterburner Heater integration.
+
+Runs ``python -X importtime`` in a fresh interpreter per transport and reports
+how much import time the integration package and the transport module add on
+top of Home Assistant core. Run from the repository root:
+
+    python scripts/bench_import_time.py --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE = "custom_components.afterburner_heater"
+TRANSPORT_MODULES = {
+    "ble": f"{PACKAGE}.api.ble",
+    "websocket": f"{PACKAGE}.api.ws",
+}
+# Imported first so shared Home Assistant core cost is not attributed to us
+WARMUP_MODULES = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+def _measure(transport: str, repo_root: Path) -> dict[str, float]:
+    """Return cumulative import times in milliseconds for a single run."""
+    statements = [f"import {module}" for module in WARMUP_MODULES]
+    statements.append(f"import {PACKAGE}")
+    statements.append(f"import {TRANSPORT_MODULES[transport]}")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        try:
+            cumulative[name.strip()] = int(cumulative_us)
+        except ValueError:
+            continue  # Header line
+    package_us = cumulative.get(PACKAGE, 0)
+    transport_us = cumulative.get(TRANSPORT_MODULES[transport], 0)
+    return {
+        "package": package_us / 1000,
+        "transport": transport_us / 1000,
+        "total": (package_us + transport_us) / 1000,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a per-transport summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per transport")
+    parser.add_argument(
+        "--transport",
+        choices=sorted(TRANSPORT_MODULES),
+        action="append",
+        help="transport(s) to measure (default: all)",
+    )
+    args = parser.parse_args()
+    repo_root = Path(__file__).resolve().parent.parent
+
+    print(f"{'transport':<10} {'package ms':>11} {'transport ms':>13} {'total ms':>9}")
+    for transport in args.transport or sorted(TRANSPORT_MODULES):
+        runs = [_measure(transport, repo_root) for _ in range(args.runs)]
+        median = {
+            key: statistics.median(run[key] for run in runs)
+            for key in ("package", "transport", "total")
+        }
+        print(
+            f"{transport:<10} {median['package']:>11.1f} "
+            f"{median['transport']:>13.1f} {median['total']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()